@@ -0,0 +1,111 @@
+"""Load test of the HTTP/JSON API (infinity_park.api) on localhost.
+
+Starts an ApiServer on a temporary database and a free port, then has
+--kiosks client threads, each with its own keep-alive connection and user,
+repeat what a kiosk does on one visit: log in, load the catalog screens, quote
+and buy tickets, check in, rate and save an itinerary. "individual" sends one
+request per operation; "lote" sends each screen's reads in one /lote request.
+Reports requests/s and p50/p95/p99 latency per operation.
+
+Usage: python benchmarks/bench_api.py [--kiosks 16] [--visits 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park.api import ApiClient, ApiServer
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.payments import SimulatedGateway, PaymentWorker
+from infinity_park.stats import percentile
+
+DAY = "2025-07-01"
+CATALOG_READS = [("GET", f"/catalogo/{kind}", None) for kind in ("atracoes", "shows", "lanchonetes", "ingressos")]
+
+
+def kiosk(url, username, attractions, visits, mode, seed, latencies, lock):
+    client = ApiClient(url)
+    rng = random.Random(seed)
+    local = {}
+
+    def timed(name, fn, *args):
+        started = time.perf_counter()
+        result = fn(*args)
+        local.setdefault(name, []).append(time.perf_counter() - started)
+        return result
+
+    for visit in range(visits):
+        user = timed("login", client.login_user, username, "senha123")
+        if mode == "lote":
+            timed("catalogos", client.batch, CATALOG_READS)
+        else:
+            for method, path, body in CATALOG_READS:
+                timed("catalogo", client.request, method, path)
+        timed("cotacao", client.quote, 1, DAY)
+        timed("compra", client.process_purchase, user["id"], 1, DAY, rng.randint(1, 4), "PIX")
+        attraction_id = attractions[visit % len(attractions)]
+        try:
+            timed("checkin", client.do_checkin, user["id"], attraction_id)
+        except Exception:
+            pass  # Already checked in there today
+        timed("avaliacao", client.submit_rating, user["id"], attraction_id, "atracao", rng.randint(1, 5), "Bom")
+        timed("itinerario", client.save_itinerary, user["id"], f"Roteiro {visit}", DAY,
+              [["atracao", attraction, "10:00"] for attraction in rng.sample(attractions, 3)])
+    client.close()
+    with lock:
+        for name, values in local.items():
+            latencies.setdefault(name, []).extend(values)
+
+
+def run(mode, kiosks, visits):
+    path = os.path.join(tempfile.mkdtemp(), "bench_api.db")
+    init_db(path)
+    conn = get_db_connection(path)
+    attractions = [row["id"] for row in conn.execute("SELECT id FROM atracoes")]
+    conn.close()
+
+    worker = PaymentWorker(path, gateway=SimulatedGateway(latency=(0.0, 0.0)))
+    with ApiServer(path, port=0, payment_worker=worker) as server:
+        url = f"http://127.0.0.1:{server.port}"
+        setup = ApiClient(url)
+        for i in range(kiosks):
+            setup.register_user(f"quiosque{i}", f"quiosque{i}@example.com", "senha123")
+        setup.close()
+        first = server.requests
+
+        latencies, lock = {}, threading.Lock()
+        threads = [threading.Thread(target=kiosk, args=(url, f"quiosque{i}", attractions, visits, mode, i,
+                                                         latencies, lock)) for i in range(kiosks)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        requests = server.requests - first
+
+    print(f"{mode}: {requests} requisições HTTP em {elapsed:.2f} s ({requests / elapsed:.0f} req/s, "
+          f"{kiosks * visits / elapsed:.0f} visitas/s)")
+    for name, values in latencies.items():
+        print(f"  {name:10s} {len(values):6d}x  p50 {percentile(values, 0.50) * 1000:6.2f} ms  "
+              f"p95 {percentile(values, 0.95) * 1000:6.2f} ms  p99 {percentile(values, 0.99) * 1000:6.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kiosks", type=int, default=16, help="Quiosques simultâneos (threads cliente)")
+    parser.add_argument("--visits", type=int, default=20, help="Visitas por quiosque")
+    args = parser.parse_args()
+    print(f"{args.kiosks} quiosques x {args.visits} visitas")
+    for mode in ("individual", "lote"):
+        run(mode, args.kiosks, args.visits)
+
+
+if __name__ == "__main__":
+    main()
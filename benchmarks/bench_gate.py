@@ -0,0 +1,106 @@
+"""Scans per second: in-memory TicketValidator vs. one database lookup per scan.
+
+Usage: python benchmarks/bench_gate.py [--tickets 50000] [--scans 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.gate import TicketValidator
+from infinity_park.ticket_codes import new_ticket_codes
+
+DAY = "2025-07-01"
+
+
+def build_database(path, codes):
+    init_db(path)
+    conn = get_db_connection(path)
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO compras_ingressos (id_usuario_sistema, valor_total_compra, metodo_pagamento, status_pagamento, codigo_transacao) "
+        "VALUES (1, 0, 'PIX', 'Aprovado', ?)",
+        (str(uuid.uuid4()),)
+    )
+    purchase_id = cursor.lastrowid
+    cursor.executemany(
+        "INSERT INTO itens_compra_ingressos (id_compra_ingresso, id_tipo_ingresso, preco_unitario_cobrado, data_utilizacao_prevista, codigo_ingresso_unico) "
+        "VALUES (?, 1, 150.0, ?, ?)",
+        ((purchase_id, DAY, code) for code in codes)
+    )
+    conn.commit()
+    conn.close()
+
+
+def scan_sequence(codes, scans):
+    rng = random.Random(215)
+    sample = rng.sample(codes, min(scans, len(codes)))
+    # One in ten scans is an unknown code
+    return [code if i % 10 else code[::-1] for i, code in enumerate(sample)]
+
+
+def bench_naive(path, sequence):
+    conn = get_db_connection(path)
+    start = time.perf_counter()
+    for code in sequence:
+        row = conn.execute(
+            "SELECT id, status_ingresso FROM itens_compra_ingressos WHERE codigo_ingresso_unico = ? AND data_utilizacao_prevista = ?",
+            (code, DAY)
+        ).fetchone()
+        if row and row["status_ingresso"] == "Nao Utilizado":
+            conn.execute("UPDATE itens_compra_ingressos SET status_ingresso = 'Utilizado' WHERE id = ?", (row["id"],))
+            conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def bench_validator(path, sequence):
+    validator = TicketValidator(path, DAY)
+    load_start = time.perf_counter()
+    validator.load()
+    load_elapsed = time.perf_counter() - load_start
+    with validator:
+        start = time.perf_counter()
+        for code in sequence:
+            validator.validate(code)
+        elapsed = time.perf_counter() - start
+    return load_elapsed, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=50000)
+    parser.add_argument("--scans", type=int, default=20000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    naive_db = os.path.join(workdir, "naive.db")
+    index_db = os.path.join(workdir, "index.db")
+    codes = new_ticket_codes(args.tickets)
+    build_database(naive_db, codes)
+    build_database(index_db, codes)
+    sequence = scan_sequence(codes, args.scans)
+
+    naive = bench_naive(naive_db, sequence)
+    load, indexed = bench_validator(index_db, sequence)
+    print(f"ingressos no dia: {args.tickets}, leituras: {len(sequence)}")
+    print(f"consulta por leitura:  {len(sequence) / naive:12.0f} leituras/s")
+    print(f"indice em memoria:     {len(sequence) / indexed:12.0f} leituras/s "
+          f"({indexed / len(sequence) * 1e6:.2f} us/leitura, carga {load * 1000:.0f} ms)")
+
+    conn = get_db_connection(index_db)
+    used = conn.execute("SELECT COUNT(*) FROM itens_compra_ingressos WHERE status_ingresso = 'Utilizado'").fetchone()[0]
+    conn.close()
+    print(f"ingressos marcados como Utilizado apos o flush: {used}")
+
+
+if __name__ == "__main__":
+    main()
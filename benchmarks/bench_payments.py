@@ -0,0 +1,95 @@
+"""Payment pipeline throughput and tail latency against the simulated gateway.
+
+Records pending purchases, settles them through payments.PaymentWorker at
+several concurrency levels and reports payments/s and p50/p95/p99 latency
+(submit to committed status). Also checks that declined purchases gave their
+tickets back and that the sales summary matches a rebuild and the purchases.
+
+Usage: python benchmarks/bench_payments.py [--purchases 300] [--concurrency 1,16,64]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.payments import APPROVED, DECLINED, PENDING, PaymentWorker, SimulatedGateway
+from infinity_park.purchases import create_purchase
+from infinity_park.sales import check_summary, query_sales, rebuild_summary
+
+DAY = "2025-07-01"
+
+
+def record_pending(path, count):
+    conn = get_db_connection(path)
+    cursor = conn.cursor()
+    purchases = []
+    for i in range(count):
+        quantity = 1 + i % 4
+        purchase_id = create_purchase(cursor, 1, 1, 150.0, DAY, quantity, "PIX")
+        purchases.append((purchase_id, quantity * 150.0, "PIX"))
+    conn.commit()
+    conn.close()
+    return purchases
+
+
+def check_consistency(path):
+    conn = get_db_connection(path)
+    cursor = conn.cursor()
+    sold = cursor.execute("SELECT vendidos FROM estoque_ingressos_dia WHERE data_visita = ?", (DAY,)).fetchone()[0]
+    kept = cursor.execute("""
+        SELECT COUNT(*) FROM itens_compra_ingressos ici
+        JOIN compras_ingressos ci ON ci.id = ici.id_compra_ingresso
+        WHERE ici.data_utilizacao_prevista = ? AND ci.status_pagamento <> ?
+    """, (DAY, DECLINED)).fetchone()[0]
+    summary = [tuple(row) for row in query_sales(cursor, ("dia", "tipo", "metodo", "status"))]
+    matches_purchases = not check_summary(cursor)
+    rebuild_summary(cursor)
+    rebuilt = [tuple(row) for row in query_sales(cursor, ("dia", "tipo", "metodo", "status"))]
+    conn.rollback()
+    conn.close()
+    return sold == kept and summary == rebuilt and matches_purchases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--purchases", type=int, default=300)
+    parser.add_argument("--concurrency", default="1,16,64")
+    parser.add_argument("--latency-ms", default="10,50", help="Latência mínima e máxima do gateway")
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--decline-rate", type=float, default=0.05)
+    args = parser.parse_args()
+    low, high = (float(value) / 1000 for value in args.latency_ms.split(","))
+
+    print(f"compras: {args.purchases}, latência do gateway: {args.latency_ms} ms, "
+          f"falhas: {args.failure_rate:.0%}, recusas: {args.decline_rate:.0%}")
+    ok = True
+    for concurrency in (int(value) for value in args.concurrency.split(",")):
+        path = os.path.join(tempfile.mkdtemp(), "pagamentos.db")
+        init_db(path)
+        purchases = record_pending(path, args.purchases)
+        gateway = SimulatedGateway((low, high), args.failure_rate, args.decline_rate, seed=concurrency)
+        worker = PaymentWorker(path, gateway, concurrency=concurrency, retry_delay=0.01)
+        start = time.perf_counter()
+        with worker:
+            futures = [worker.submit(*purchase) for purchase in purchases]
+            statuses = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+        stats = worker.stats()
+        consistent = check_consistency(path)
+        ok = ok and consistent
+        print(f"concorrência {concurrency:>3}: {len(statuses) / elapsed:8.1f} pagamentos/s  "
+              f"p50 {stats['p50'] * 1000:7.1f} ms  p95 {stats['p95'] * 1000:7.1f} ms  "
+              f"p99 {stats['p99'] * 1000:7.1f} ms  "
+              f"aprovados {statuses.count(APPROVED)}  recusados {statuses.count(DECLINED)}  "
+              f"pendentes {statuses.count(PENDING)}  {'consistente' if consistent else 'INCONSISTENTE'}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Headless throughput of the app's operations (infinity_park.services).
+
+Registers users, then runs login, purchase, check-in, rating and itinerary
+operations against a temporary database and reports operations/s and
+p50/p95/p99 latency for each. Fails if anything imported Kivy, so it can run
+in CI on a machine without a display.
+
+Usage: python benchmarks/bench_services.py [--users 200] [--rounds 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park import services
+from infinity_park.badges import BadgeEngine
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.stats import percentile
+
+DAY = "2025-07-01"
+
+
+def timed(latencies, name, fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    latencies.setdefault(name, []).append(time.perf_counter() - started)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5, help="Operações de cada tipo por usuário")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench_services.db")
+    init_db(path)
+    conn = get_db_connection(path)
+    attractions = [row["id"] for row in conn.execute("SELECT id FROM atracoes")]
+    badge_engine = BadgeEngine()
+    rng = random.Random(args.seed)
+    latencies = {}
+
+    users = []
+    for i in range(args.users):
+        username = f"visitante{i}"
+        timed(latencies, "register_user", services.register_user,
+              conn, username, f"{username}@example.com", "senha123")
+        users.append(username)
+
+    started = time.perf_counter()
+    for round_number in range(args.rounds):
+        for username in users:
+            user = timed(latencies, "login_user", services.login_user, conn, username, "senha123")
+            timed(latencies, "process_purchase", services.process_purchase,
+                  conn, user["id"], 1, 150.0, DAY, rng.randint(1, 4), "PIX")
+            # One check-in per attraction per day: use a different day each round
+            attraction_id = attractions[round_number % len(attractions)]
+            timed(latencies, "do_checkin", services.do_checkin,
+                  conn, badge_engine, user["id"], attraction_id, f"2025-07-{round_number + 1:02d}")
+            timed(latencies, "submit_rating", services.submit_rating,
+                  conn, user["id"], attraction_id, "atracao", rng.randint(1, 5), "Muito bom")
+            timed(latencies, "save_itinerary", services.save_itinerary,
+                  conn, user["id"], f"Roteiro {round_number}", DAY,
+                  [("atracao", attraction, "10:00") for attraction in rng.sample(attractions, 3)])
+    elapsed = time.perf_counter() - started
+    conn.close()
+
+    assert "kivy" not in sys.modules, "infinity_park.services importou o Kivy"
+    total = sum(len(values) for name, values in latencies.items() if name != "register_user")
+    print(f"{args.users} usuários x {args.rounds} rodadas: {total} operações em {elapsed:.2f} s "
+          f"({total / elapsed:.0f} op/s), sem Kivy")
+    for name, values in latencies.items():
+        print(f"  {name:16s} {len(values) / sum(values):8.0f} op/s  p50 {percentile(values, 0.50) * 1000:6.2f} ms  "
+              f"p95 {percentile(values, 0.95) * 1000:6.2f} ms  p99 {percentile(values, 0.99) * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Time from launch to the login screen, eager vs lazy screen construction.
+
+Each run starts a fresh interpreter in a temporary directory (so the app
+creates its own database there) and measures importing teste1 and building
+the app until the login screen is current. "eager" then constructs every
+registered screen before returning, as build() used to; "lazy" returns with
+only the login screen built. A first untimed run creates the database.
+
+Usage: python benchmarks/bench_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODES = ("eager", "lazy")
+
+
+def child(mode):
+    started = time.perf_counter()
+    import teste1
+    from kivy.app import App
+    imported = time.perf_counter()
+    app = teste1.InfinityParkApp()
+    App._running_app = app
+    sm = app.build()
+    if mode == "eager":
+        for name in sm.factories:
+            sm.get_screen(name)
+    ready = time.perf_counter()
+    assert sm.current_screen.name == "login"
+    built = len(sm.screens)
+    app.on_stop()
+    print(json.dumps({"import": imported - started, "build": ready - imported, "screens": built}))
+
+
+def run(mode, workdir):
+    env = dict(os.environ, KIVY_NO_CONSOLELOG="1", KIVY_NO_ARGS="1", PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--filho", mode],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--filho", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.filho:
+        child(args.filho)
+        return
+
+    workdir = tempfile.mkdtemp()
+    run("lazy", workdir)  # creates and seeds the database
+    print(f"Tempo até a tela de login (mediana de {args.runs} execuções):")
+    for mode in MODES:
+        results = [run(mode, workdir) for _ in range(args.runs)]
+        import_ms = statistics.median(r["import"] for r in results) * 1000
+        build_ms = statistics.median(r["build"] for r in results) * 1000
+        print(f"  {mode:5s}: import {import_ms:7.1f} ms + build {build_ms:7.1f} ms = "
+              f"{import_ms + build_ms:7.1f} ms (telas construídas: {results[0]['screens']})")
+
+
+if __name__ == "__main__":
+    main()
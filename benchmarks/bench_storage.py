@@ -0,0 +1,143 @@
+"""Mixed read/write throughput of several processes sharing one database: legacy vs WAL profile.
+
+--processes kiosk processes run for --seconds against one temporary database.
+Each loops over a mix of reads (the attraction catalog and a day's ticket
+availability) and, in --writes of the iterations, a write (a purchase or a
+rating), each on a new connection as the screens do.
+
+- "legado": rollback journal and a plain sqlite3.connect(), the way the app
+  connected before infinity_park.storage.
+- "wal": get_db_connection() with the storage profile, writes wrapped in
+  retry_busy() and a Checkpointer running in the parent process.
+
+Reports reads/s, writes/s, failed operations, p95/p99 latency and the WAL
+file's peak size.
+
+Usage: python benchmarks/bench_storage.py [--processes 4] [--seconds 5] [--writes 0.2]
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from infinity_park import services
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.inventory import available
+from infinity_park.stats import percentile
+from infinity_park.storage import Checkpointer, retry_busy, wal_size
+
+DAY = "2025-07-01"
+MODES = ("legado", "wal")
+
+
+def legacy_connection(path):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def child(mode, path, seconds, write_share, user_id):
+    connect = legacy_connection if mode == "legado" else get_db_connection
+    rng = random.Random(user_id)
+    reads, writes, errors = [], [], 0
+
+    def read():
+        conn = connect(path)
+        try:
+            services.catalog(conn, "atracoes")
+            available(conn.cursor(), DAY)
+        finally:
+            conn.close()
+
+    def write():
+        conn = connect(path)
+        try:
+            if rng.random() < 0.5:
+                services.process_purchase(conn, user_id, 1, 150.0, DAY, 1, "PIX")
+            else:
+                services.submit_rating(conn, user_id, rng.randint(1, 5), "atracao", rng.randint(1, 5), "Bom")
+        finally:
+            conn.close()
+
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        is_write = rng.random() < write_share
+        started = time.perf_counter()
+        try:
+            if not is_write:
+                read()
+            elif mode == "legado":
+                write()
+            else:
+                retry_busy(write)
+        except sqlite3.Error:
+            errors += 1
+            continue
+        (writes if is_write else reads).append(time.perf_counter() - started)
+    print(json.dumps({"reads": reads, "writes": writes, "errors": errors}))
+
+
+def run(mode, processes, seconds, write_share):
+    path = os.path.join(tempfile.mkdtemp(), "bench_storage.db")
+    init_db(path)
+    conn = get_db_connection(path)
+    user_ids = [services.register_user(conn, f"quiosque{i}", f"quiosque{i}@example.com", "senha123")
+                for i in range(processes)]
+    if mode == "legado":
+        conn.execute("PRAGMA journal_mode = DELETE")
+    conn.close()
+
+    checkpointer = Checkpointer(path, interval=1).start() if mode == "wal" else None
+    children = [
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), "--filho", mode, path,
+                          str(seconds), str(write_share), str(user_id)], stdout=subprocess.PIPE, text=True)
+        for user_id in user_ids
+    ]
+    # The WAL file goes away when the last connection closes: sample its size while the children run
+    conn = get_db_connection(path)
+    wal_peak = 0
+    while any(child_process.poll() is None for child_process in children):
+        wal_peak = max(wal_peak, wal_size(conn))
+        time.sleep(0.05)
+    conn.close()
+    results = [json.loads(child_process.communicate()[0].strip().splitlines()[-1]) for child_process in children]
+    if checkpointer is not None:
+        checkpointer.close()
+
+    reads = [value for result in results for value in result["reads"]]
+    writes = [value for result in results for value in result["writes"]]
+    errors = sum(result["errors"] for result in results)
+    print(f"  {mode:7s} {len(reads) / seconds:7.0f} leituras/s  {len(writes) / seconds:6.0f} escritas/s  "
+          f"falhas {errors:5d}  leitura p95 {percentile(reads, 0.95) * 1000:6.2f} ms  "
+          f"escrita p95 {percentile(writes, 0.95) * 1000:7.2f} ms  p99 {percentile(writes, 0.99) * 1000:7.2f} ms  "
+          f"WAL máx. {wal_peak / 1024:.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4, help="Processos (quiosques) simultâneos")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--writes", type=float, default=0.2, help="Fração das operações que escrevem")
+    parser.add_argument("--filho", nargs=5, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.filho:
+        mode, path, seconds, write_share, user_id = args.filho
+        child(mode, path, float(seconds), float(write_share), int(user_id))
+        return
+
+    print(f"{args.processes} processos x {args.seconds:g} s, {args.writes:.0%} escritas:")
+    for mode in MODES:
+        run(mode, args.processes, args.seconds, args.writes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""UNIQUE index size and lookup speed: uuid4-derived codes vs. compact codes.
+
+Usage: python benchmarks/bench_ticket_codes.py [--tickets 200000] [--lookups 50000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park.ticket_codes import decode, new_ticket_codes
+
+
+def build(path, column_type, values):
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE itens (id INTEGER PRIMARY KEY, codigo {column_type} UNIQUE NOT NULL)")
+    conn.executemany("INSERT INTO itens (codigo) VALUES (?)", ((value,) for value in values))
+    conn.commit()
+    conn.execute("VACUUM")
+    try:
+        index_bytes = conn.execute(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE 'sqlite_autoindex_itens%'"
+        ).fetchone()[0]
+    except sqlite3.OperationalError:  # SQLite built without dbstat
+        index_bytes = None
+    return conn, index_bytes
+
+
+def time_lookups(conn, keys):
+    start = time.perf_counter()
+    for key in keys:
+        conn.execute("SELECT id FROM itens WHERE codigo = ?", (key,)).fetchone()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=200000)
+    parser.add_argument("--lookups", type=int, default=50000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    legacy = [f"{uuid.uuid4()}-{i % 10 + 1}" for i in range(args.tickets)]
+    compact = new_ticket_codes(args.tickets)
+    numbers = [decode(code) for code in compact]
+
+    rng = random.Random(215)
+    picks = [rng.randrange(args.tickets) for _ in range(args.lookups)]
+    variants = [
+        ("uuid4 TEXT", "TEXT", legacy),
+        ("compacto TEXT", "TEXT", compact),
+        ("compacto INTEGER", "INTEGER", numbers),
+    ]
+    print(f"ingressos: {args.tickets}, consultas: {args.lookups}")
+    for n, (label, column_type, values) in enumerate(variants):
+        conn, index_bytes = build(os.path.join(workdir, f"variante{n}.db"), column_type, values)
+        elapsed = time_lookups(conn, [values[i] for i in picks])
+        size = f"{index_bytes / 1024:10.0f} KiB" if index_bytes is not None else "       n/d"
+        print(f"{label:18} indice {size}   {args.lookups / elapsed:10.0f} consultas/s")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Write throughput: one connection and commit per operation vs the group-committing WriteQueue.
+
+--threads writers (kiosks) each run --ops write operations, a mix of
+purchases, check-ins, ratings and itinerary saves, against a temporary
+database. "individual" is how the app used to write: every operation opens
+its own connection and commits on its own. "fila" submits the same
+operations to one writer.WriteQueue. Reports writes/s, failed writes
+("database is locked" and the like), operations per commit and p50/p95/p99
+latency.
+
+Usage: python benchmarks/bench_writes.py [--threads 16] [--ops 100]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park import services
+from infinity_park.badges import BadgeEngine
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.stats import percentile
+from infinity_park.writer import WriteQueue
+
+DAY = "2025-07-01"
+MODES = ("individual", "fila")
+
+
+def operations(user_id, attractions, badge_engine, count, seed):
+    """count (operation, args) write operations for one kiosk's user."""
+    rng = random.Random(seed)
+    ops = []
+    unvisited = list(attractions)
+    for i in range(count):
+        attraction_id = rng.choice(attractions)
+        kind = i % 4
+        if kind == 0:
+            ops.append((services.process_purchase, (user_id, 1, 150.0, DAY, rng.randint(1, 4), "PIX")))
+        elif kind == 1 and unvisited:
+            # checkins_atracao is unique per user, attraction and second: one check-in per attraction
+            ops.append((services.do_checkin, (badge_engine, user_id, unvisited.pop(), DAY)))
+        elif kind in (1, 2):
+            ops.append((services.submit_rating, (user_id, attraction_id, "atracao", rng.randint(1, 5), "Bom")))
+        else:
+            ops.append((services.save_itinerary, (user_id, f"Roteiro {i}", DAY,
+                                                   [("atracao", attraction_id, "10:00")])))
+    return ops
+
+
+def run_individual(path, ops, latencies, errors):
+    for operation, args in ops:
+        started = time.perf_counter()
+        conn = get_db_connection(path)
+        try:
+            operation(conn, *args)
+            latencies.append(time.perf_counter() - started)
+        except Exception:
+            errors.append(1)
+        finally:
+            conn.close()
+
+
+def run_queue(writer, ops, latencies, errors):
+    for operation, args in ops:
+        started = time.perf_counter()
+        try:
+            writer.call(operation, *args)
+            latencies.append(time.perf_counter() - started)
+        except Exception:
+            errors.append(1)
+
+
+def run(mode, threads, count):
+    path = os.path.join(tempfile.mkdtemp(), "bench_writes.db")
+    init_db(path)
+    conn = get_db_connection(path)
+    attractions = [row["id"] for row in conn.execute("SELECT id FROM atracoes")]
+    user_ids = [services.register_user(conn, f"quiosque{i}", f"quiosque{i}@example.com", "senha123")
+                for i in range(threads)]
+    conn.close()
+
+    badge_engine = BadgeEngine()
+    work = [operations(user_id, attractions, badge_engine, count, user_id) for user_id in user_ids]
+    latencies, errors = [], []
+    writer = WriteQueue(path).start() if mode == "fila" else None
+    if writer is None:
+        workers = [threading.Thread(target=run_individual, args=(path, ops, latencies, errors)) for ops in work]
+    else:
+        workers = [threading.Thread(target=run_queue, args=(writer, ops, latencies, errors)) for ops in work]
+
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    if writer is not None:
+        writer.close()
+        per_commit = writer.stats()["por_commit"]
+    else:
+        per_commit = 1.0
+
+    print(f"  {mode:10s} {len(latencies) / elapsed:7.0f} escritas/s  falhas {len(errors):5d}  "
+          f"{per_commit:5.1f} op/commit  p50 {percentile(latencies, 0.50) * 1000:7.2f} ms  "
+          f"p95 {percentile(latencies, 0.95) * 1000:7.2f} ms  p99 {percentile(latencies, 0.99) * 1000:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16, help="Escritores simultâneos")
+    parser.add_argument("--ops", type=int, default=100, help="Escritas por escritor")
+    args = parser.parse_args()
+    print(f"{args.threads} escritores x {args.ops} escritas:")
+    for mode in MODES:
+        run(mode, args.threads, args.ops)
+
+
+if __name__ == "__main__":
+    main()
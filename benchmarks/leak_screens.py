@@ -0,0 +1,173 @@
+"""Memory and object growth per screen over repeated visits (widget leak detector).
+
+Builds the app headlessly on a temporary database, logs a visitor in and
+selects an attraction, show, food court, ticket type and purchase, so every
+screen has something to show. Each screen is then entered --warmup times,
+which fills its caches and textures. After that it is entered --visits more
+times, dispatching on_pre_enter/on_enter and running the event loop's frame
+steps after each visit as a real navigation would.
+
+After each measured visit it runs gc.collect(), then reads the memory traced
+by tracemalloc and the number of live objects. Kivy frees discarded widgets
+with some lag, so the traced memory swings by tens of KiB between visits.
+Growth per visit is therefore the slope of a least-squares line through
+those samples, not the difference between the first and the last. Per screen
+it reports that growth, the live Kivy widgets and canvas instructions gained
+per visit, and the types that grew the most. It exits with status 1 if any
+screen retains more than --budget-kb KiB or --budget-objects objects per
+visit.
+
+Usage: python benchmarks/leak_screens.py [--visits 40] [--warmup 5] [--budget-kb 2] [--budget-objects 5]
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+DAY = "2025-07-01"
+
+
+def live_objects():
+    """Counter of live gc-tracked objects by type name, after a full collection."""
+    gc.collect()
+    return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+def count_instances(cls):
+    return sum(1 for obj in gc.get_objects() if issubclass(type(obj), cls))  # isinstance() fails on dead weak proxies
+
+
+def settle(rounds=5):
+    """Run a few frames' worth of the event loop, minus drawing and input.
+
+    Callbacks scheduled by on_enter (and by its threads) run, and so do the kv
+    expressions Builder defers to the end of a frame. Builder keeps those in a
+    list until then, so skipping Builder.sync() would show up as a leak.
+    """
+    from kivy.clock import Clock
+    from kivy.lang import Builder
+
+    for _ in range(rounds):
+        time.sleep(0.01)
+        Clock.tick()
+        Builder.sync()
+        Clock.tick_draw()
+        Builder.sync()
+
+
+def visit(screen):
+    screen.dispatch("on_pre_enter")
+    screen.dispatch("on_enter")
+    settle()
+    screen.dispatch("on_pre_leave")
+    screen.dispatch("on_leave")
+
+
+def prepare(app):
+    """Log a visitor in and select the first row of everything the detail screens show."""
+    from infinity_park import services
+    from infinity_park.db import get_db_connection
+
+    conn = get_db_connection()
+    try:
+        user_id = services.register_user(conn, "visitante_memoria", "memoria@example.com", "senha123")
+        ticket = conn.execute("SELECT id, nome, preco_base FROM tipos_ingressos ORDER BY id LIMIT 1").fetchone()
+        app.selected_attraction_id = conn.execute("SELECT MIN(id) FROM atracoes").fetchone()[0]
+        app.selected_show_id = conn.execute("SELECT MIN(id) FROM shows").fetchone()[0]
+        app.selected_lanchonete_id = conn.execute("SELECT MIN(id) FROM lanchonetes").fetchone()[0]
+        app.selected_ticket_type_id, app.selected_ticket_type_name, app.selected_ticket_type_price = ticket
+        app.selected_purchase_id = services.process_purchase(conn, user_id, ticket[0], ticket[2], DAY, 2, "PIX")
+    finally:
+        conn.close()
+    app.user_id = user_id
+    app.user_profile = "visitante"
+
+
+def measure(app, name, visits, warmup):
+    from kivy.graphics.instructions import Instruction
+    from kivy.uix.widget import Widget
+
+    screen = app.sm.get_screen(name)
+    app.sm.current = name
+    settle()
+    for _ in range(warmup):
+        visit(screen)
+    before_objects = live_objects()
+    before_widgets = count_instances(Widget)
+    before_instructions = count_instances(Instruction)
+    memory, objects = [], []
+    for _ in range(visits):
+        visit(screen)
+        gc.collect()
+        memory.append(tracemalloc.get_traced_memory()[0])
+        objects.append(len(gc.get_objects()))
+    after_objects = live_objects()
+    visit_numbers = range(visits)
+    return {
+        "bytes": statistics.linear_regression(visit_numbers, memory).slope,
+        "objects": statistics.linear_regression(visit_numbers, objects).slope,
+        "widgets": (count_instances(Widget) - before_widgets) / visits,
+        "instrucoes": (count_instances(Instruction) - before_instructions) / visits,
+        "tipos": (after_objects - before_objects).most_common(3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--visits", type=int, default=40, help="Visitas medidas por tela")
+    parser.add_argument("--warmup", type=int, default=5, help="Visitas de aquecimento antes de medir")
+    parser.add_argument("--budget-kb", type=float, default=2, help="KiB retidos por visita tolerados")
+    parser.add_argument("--budget-objects", type=float, default=5, help="Objetos retidos por visita tolerados")
+    parser.add_argument("--telas", nargs="*", help="Telas a medir (padrão: todas)")
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp())  # The app creates its database, logs and caches here
+    import teste1
+    from kivy.app import App
+
+    app = teste1.InfinityParkApp()
+    App._running_app = app
+    app.build()
+    prepare(app)
+    names = args.telas or list(app.sm.factories)
+    tracemalloc.start()
+
+    failed = []
+    print(f"Crescimento por visita ({args.visits} visitas após {args.warmup} de aquecimento):")
+    for name in names:
+        try:
+            result = measure(app, name, args.visits, args.warmup)
+        except Exception as e:
+            print(f"  {name:26s} erro: {e!r}")
+            failed.append(name)
+            continue
+        kb = result["bytes"] / 1024
+        objects = result["objects"]
+        over = kb > args.budget_kb or objects > args.budget_objects
+        if over:
+            failed.append(name)
+        grown = ", ".join(f"{kind} +{count}" for kind, count in result["tipos"] if count > 0)
+        print(f"  {name:26s} {kb:8.2f} KiB  {objects:7.1f} objetos  "
+              f"{result['widgets']:5.1f} widgets  {result['instrucoes']:5.1f} instruções"
+              f"{'  ACIMA DO LIMITE' if over else ''}{f'  ({grown})' if grown else ''}")
+
+    app.on_stop()
+    if failed:
+        print(f"Telas acima do limite ({args.budget_kb:g} KiB, {args.budget_objects:g} objetos por visita): "
+              f"{', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Concurrent buyers against one visit date: proves no oversell, measures purchases/s.
+
+Each worker process opens its own connection and keeps buying 1-4 tickets
+through purchases.create_purchase until the date is sold out.
+
+Usage: python benchmarks/stress_inventory.py [--buyers 8] [--capacity 2000]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.inventory import SoldOutError, set_capacity
+from infinity_park.purchases import create_purchase
+
+DAY = "2025-07-01"
+
+
+def buyer(path, seed, results):
+    rng = random.Random(seed)
+    conn = get_db_connection(path)
+    conn.execute("PRAGMA busy_timeout = 30000")
+    cursor = conn.cursor()
+    purchases = tickets = sold_out = 0
+    while True:
+        quantity = rng.randint(1, 4)
+        try:
+            create_purchase(cursor, 1, 1, 150.0, DAY, quantity, "PIX")
+            conn.commit()
+            purchases += 1
+            tickets += quantity
+        except SoldOutError as e:
+            conn.rollback()
+            sold_out += 1
+            if e.remaining == 0:
+                break
+        except sqlite3.OperationalError:
+            conn.rollback()
+    conn.close()
+    results.put((purchases, tickets, sold_out))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--buyers", type=int, default=8)
+    parser.add_argument("--capacity", type=int, default=2000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "estoque.db")
+    init_db(path)
+    conn = get_db_connection(path)
+    set_capacity(conn.cursor(), DAY, args.capacity)
+    conn.commit()
+
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=buyer, args=(path, seed, results)) for seed in range(args.buyers)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    totals = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    purchases = sum(t[0] for t in totals)
+    tickets = sum(t[1] for t in totals)
+    rejected = sum(t[2] for t in totals)
+    stored = conn.execute(
+        "SELECT COUNT(*) FROM itens_compra_ingressos WHERE data_utilizacao_prevista = ?", (DAY,)
+    ).fetchone()[0]
+    sold = conn.execute("SELECT vendidos FROM estoque_ingressos_dia WHERE data_visita = ?", (DAY,)).fetchone()[0]
+    conn.close()
+
+    print(f"compradores: {args.buyers}, capacidade: {args.capacity}")
+    print(f"compras: {purchases} ({purchases / elapsed:.0f}/s), ingressos: {tickets}, recusas por falta: {rejected}")
+    print(f"ingressos gravados: {stored}, vendidos no estoque: {sold}")
+    if stored > args.capacity or stored != sold or stored != tickets:
+        print("FALHA: venda acima da capacidade ou estoque inconsistente")
+        sys.exit(1)
+    print("OK: nenhuma venda acima da capacidade")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Building blocks for the Infinity Park 215 app.
+
+Only the infinity_park.ui package imports Kivy; the other modules are used by
+the headless tools as well.
+"""
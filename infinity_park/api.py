@@ -0,0 +1,594 @@
+"""HTTP/JSON API over infinity_park.services, so many kiosks share one backend.
+
+    python -m infinity_park.api --porta 8215
+    INFINITY_PARK_API=http://servidor:8215 python teste1.py
+
+Endpoints (JSON in and out; errors are {"erro": message}):
+
+    GET  /catalogo/<atracoes|shows|lanchonetes|ingressos>
+    GET  /catalogo/<atracoes|shows|lanchonetes>/<id>   {"item", "avaliacao"[, "cardapio"]}
+    GET  /parque/informacoes                           the "Sobre o Parque" sections
+    GET  /parque/avisos                                the active warnings
+    GET  /cotacao?tipo=<id>&data=YYYY-MM-DD           {"preco", "disponiveis"}
+    POST /login        {"username", "password"}        the user and a "token"
+    POST /logout                                       ends the token's session
+    POST /cadastro     {"username", "email", "password"}
+    POST /compras      {"tipo", "data", "quantidade", "metodo"}
+    GET  /compras?apos=<data>&apos_id=<id>             a page of the user's purchases
+    GET  /compras/<id>                                 {"compra", "grupos"}
+    GET  /compras/<id>/ingressos?apos=<id>             a page of the purchase's tickets
+    GET  /compras/<id>/pagamento                       waits for the charge: {"status"}
+    GET  /perfil                                       the user's profile summary
+    POST /checkins     {"atracao"}                     {"conquistas": [badge codes]}
+    POST /avaliacoes   {"referencia", "tipo", "nota", "comentario"}
+    POST /itinerarios  {"nome", "data", "itens": [[tipo, id, "HH:MM"], ...]}
+    GET  /itinerarios                                  the user's itineraries
+    DELETE /itinerarios/<id>
+    POST /senha        {"atual", "nova"}
+    POST /lote         {"requisicoes": [{"metodo", "caminho", "corpo"}, ...]}
+
+Requests made for a user carry the login token as "Authorization: Bearer".
+A token expires after API_SESSION_TTL seconds without requests, and the
+result of a charge is kept API_PAYMENT_TTL seconds for its kiosk to fetch.
+The server keeps client connections alive and runs database work on a small
+thread pool where each thread keeps one read-only connection open; writes go
+through a writer.WriteQueue, which commits concurrent ones together, payment
+results and expiration sweeps included. /lote runs a list of requests on one
+of those threads in a single hop and answers them together, so a kiosk
+loading a screen pays for one round trip.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import re
+import secrets
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from infinity_park.badges import RULES_BY_CODE
+from infinity_park.config import API_PAYMENT_TTL, API_SESSION_TTL
+from infinity_park.db import get_read_connection, init_db
+from infinity_park.expiration import ExpirationSweeper
+from infinity_park.inventory import SoldOutError
+from infinity_park.payments import PaymentWorker
+from infinity_park.services import (LocalBackend, ServiceError, active_warnings, catalog, details, list_itineraries,
+                                    load_profile, park_info, purchase_details, purchase_page, quote, ticket_page)
+from infinity_park.storage import Checkpointer
+from infinity_park.writer import WriteQueue
+
+DEFAULT_PORT = 8215
+EXPIRY_INTERVAL = 60  # Seconds between sweeps of expired sessions and payments
+REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+           409: "Conflict", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+# (method, path pattern, handler name, needs a logged-in user)
+ROUTES = (
+    ("GET", r"/catalogo/(\w+)", "catalog", False),
+    ("GET", r"/catalogo/(\w+)/(\d+)", "details", False),
+    ("GET", r"/parque/informacoes", "park_info", False),
+    ("GET", r"/parque/avisos", "warnings", False),
+    ("GET", r"/cotacao", "quote", False),
+    ("POST", r"/login", "login", False),
+    ("POST", r"/logout", "logout", True),
+    ("POST", r"/cadastro", "register", False),
+    ("POST", r"/compras", "purchase", True),
+    ("GET", r"/compras", "purchases", True),
+    ("GET", r"/compras/(\d+)", "purchase_details", True),
+    ("GET", r"/compras/(\d+)/ingressos", "tickets", True),
+    ("GET", r"/perfil", "profile", True),
+    ("POST", r"/checkins", "checkin", True),
+    ("POST", r"/avaliacoes", "rating", True),
+    ("POST", r"/itinerarios", "itinerary", True),
+    ("GET", r"/itinerarios", "itineraries", True),
+    ("DELETE", r"/itinerarios/(\d+)", "delete_itinerary", True),
+    ("POST", r"/senha", "password", True),
+    ("POST", r"/lote", "batch", False),
+)
+PAYMENT_PATH = re.compile(r"/compras/(\d+)/pagamento$")  # Answered on the event loop, see _await_payment
+
+
+class ApiError(Exception):
+    def __init__(self, status, message, **extra):
+        super(ApiError, self).__init__(message)
+        self.status = status
+        self.extra = extra
+
+
+def _field(body, name):
+    try:
+        return body[name]
+    except (KeyError, TypeError):
+        raise ApiError(400, f"Campo obrigatório ausente: {name}")
+
+
+def _int(value, name):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"Campo inválido: {name}")
+
+
+class ApiServer(object):
+    """Serves the API from an asyncio loop on a background thread.
+
+    Operations run through a LocalBackend whose pricing engine, badge engine
+    and payment worker are shared by every client. port=0 picks a free port;
+    the chosen one is in self.port after start().
+    """
+
+    def __init__(self, database=None, host="127.0.0.1", port=DEFAULT_PORT, workers=8, payment_worker=None,
+                 session_ttl=API_SESSION_TTL, payment_ttl=API_PAYMENT_TTL):
+        self.database = database
+        self.host = host
+        self.port = port
+        self.session_ttl = session_ttl
+        self.payment_ttl = payment_ttl
+        writer = WriteQueue(database)
+        payment_worker = payment_worker or PaymentWorker(database)
+        if payment_worker.writer is None:
+            payment_worker.writer = writer  # Payment results commit along with the requests' writes
+        self.backend = LocalBackend(database, payment_worker=payment_worker, writer=writer)
+        self.expiration_sweeper = ExpirationSweeper(database, writer=writer)
+        self.checkpointer = Checkpointer(database)
+        self.requests = 0
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="api-db")
+        self._local = threading.local()
+        self._routes = [(method, re.compile(pattern + "$"), getattr(self, "_" + name), needs_user)
+                        for method, pattern, name, needs_user in ROUTES]
+        self._sessions = {}  # token -> [user id, expires at]
+        self._payments = {}  # purchase id -> (user id, Future of the final status, expires at)
+        self._lock = threading.Lock()  # Guards both: handlers run on the executor's threads
+        self._ready = threading.Event()
+        self._thread = None
+        self._loop = None
+        self._stop = None
+
+    def start(self):
+        if self._thread is None:
+            self.backend.writer.start()
+            self.backend.payment_worker.start()
+            self.backend.payment_worker.resume_pending()
+            self.expiration_sweeper.start()
+            self.checkpointer.start()
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run, name="api-server", daemon=True)
+            self._thread.start()
+            self._ready.wait()
+        return self
+
+    def close(self):
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+            self._thread.join()
+            self._thread = None
+            self._executor.shutdown()
+            self.backend.payment_worker.close()
+            self.expiration_sweeper.close()
+            self.backend.writer.close()  # Last: the payment worker and the sweeper write through it
+            self.checkpointer.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        expiry = asyncio.create_task(self._expire_forever())
+        async with server:
+            await self._stop.wait()
+        expiry.cancel()
+
+    async def _expire_forever(self):
+        while True:
+            await asyncio.sleep(EXPIRY_INTERVAL)
+            self.expire()
+
+    def expire(self, now=None):
+        """Drop the expired sessions and the charges nobody fetched in time."""
+        now = now or time.monotonic()
+        with self._lock:
+            for token in [token for token, (_, expires) in self._sessions.items() if expires <= now]:
+                del self._sessions[token]
+            for purchase_id in [purchase_id for purchase_id, (_, future, expires) in self._payments.items()
+                                if expires <= now and future.done()]:
+                del self._payments[purchase_id]
+
+    def _session_user(self, token):
+        """The user id of token's session, extending it; None if unknown or expired."""
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            if session[1] <= now:
+                del self._sessions[token]
+                return None
+            session[1] = now + self.session_ttl
+            return session[0]
+
+    def _connection(self):
+        """This worker thread's read-only database connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = get_read_connection(self.database)
+        return conn
+
+    async def _serve_client(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, payload = await self._dispatch(method, target, headers, body)
+                self.requests += 1
+
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        f"Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(data)}\r\n")
+                if not keep_alive:
+                    head += "Connection: close\r\n"
+                writer.write(head.encode("latin-1") + b"\r\n" + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, headers, body):
+        url = urllib.parse.urlsplit(target)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        token = headers.get("authorization", "").partition("Bearer ")[2]
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"erro": "JSON inválido."}
+        if method == "GET" and PAYMENT_PATH.match(url.path):
+            # Waiting for a charge must not hold one of the database threads
+            return await self._await_payment(url.path, token)
+        return await self._loop.run_in_executor(
+            self._executor, self._handle, method, url.path, query, payload, token
+        )
+
+    def _handle(self, method, path, query, body, token):
+        """Run one request on this thread's connection; returns (status, payload)."""
+        try:
+            for route_method, pattern, handler, needs_user in self._routes:
+                match = pattern.match(path)
+                if match and route_method == method:
+                    user_id = self._session_user(token)
+                    if needs_user and user_id is None:
+                        raise ApiError(401, "Faça login novamente.")
+                    return 200, handler(self._connection(), match, query, body, user_id, token)
+            raise ApiError(404, f"Rota desconhecida: {method} {path}")
+        except ApiError as e:
+            return e.status, dict({"erro": str(e)}, **e.extra)
+        except ServiceError as e:
+            return 422, {"erro": str(e)}
+        except SoldOutError as e:
+            return 409, {"erro": str(e), "data": e.day, "restantes": e.remaining}
+        except Exception as e:
+            return 500, {"erro": f"Erro interno: {e}"}
+
+    async def _await_payment(self, path, token):
+        user_id = self._session_user(token)
+        if user_id is None:
+            return 401, {"erro": "Faça login novamente."}
+        purchase_id = int(PAYMENT_PATH.match(path).group(1))
+        owner, future, _ = self._payments.get(purchase_id, (None, None, None))
+        if future is not None and owner == user_id:
+            status = await asyncio.wrap_future(future)
+            with self._lock:
+                self._payments.pop(purchase_id, None)
+            return 200, {"status": status}
+        # Not charged by this process (e.g. restarted): report the stored status
+        return await self._loop.run_in_executor(self._executor, self._payment_status, purchase_id, user_id)
+
+    def _payment_status(self, purchase_id, user_id):
+        row = self._connection().execute(
+            "SELECT status_pagamento FROM compras_ingressos WHERE id = ? AND id_usuario_sistema = ?",
+            (purchase_id, user_id)
+        ).fetchone()
+        if not row:
+            return 404, {"erro": "Compra não encontrada."}
+        return 200, {"status": row["status_pagamento"]}
+
+    # --- Route handlers: (conn, path match, query, body, user id, token) -> payload
+
+    def _catalog(self, conn, match, query, body, user_id, token):
+        return catalog(conn, match.group(1))
+
+    def _details(self, conn, match, query, body, user_id, token):
+        return details(conn, match.group(1), int(match.group(2)))
+
+    def _park_info(self, conn, match, query, body, user_id, token):
+        return park_info(conn)
+
+    def _warnings(self, conn, match, query, body, user_id, token):
+        return active_warnings(conn)
+
+    def _quote(self, conn, match, query, body, user_id, token):
+        if "tipo" not in query or "data" not in query:
+            raise ApiError(400, "Informe tipo e data.")
+        return quote(conn, self.backend.pricing_engine, _int(query["tipo"], "tipo"), query["data"])
+
+    def _login(self, conn, match, query, body, user_id, token):
+        user = self.backend.login_user(_field(body, "username"), _field(body, "password"))
+        user["token"] = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[user["token"]] = [user["id"], time.monotonic() + self.session_ttl]
+        return user
+
+    def _logout(self, conn, match, query, body, user_id, token):
+        with self._lock:
+            self._sessions.pop(token, None)
+        return {}
+
+    def _register(self, conn, match, query, body, user_id, token):
+        return {"id": self.backend.register_user(_field(body, "username"), _field(body, "email"), _field(body, "password"))}
+
+    def _purchase(self, conn, match, query, body, user_id, token):
+        ticket_type_id, day = _int(_field(body, "tipo"), "tipo"), _field(body, "data")
+        quantity, method = _int(_field(body, "quantidade"), "quantidade"), _field(body, "metodo")
+        purchase = self.backend.process_purchase(user_id, ticket_type_id, day, quantity, method)
+        future = self.backend.pay(purchase)
+        with self._lock:
+            self._payments[purchase["id"]] = (user_id, future, time.monotonic() + self.payment_ttl)
+        return purchase
+
+    def _purchases(self, conn, match, query, body, user_id, token):
+        after = [query["apos"], _int(query["apos_id"], "apos_id")] if "apos" in query and "apos_id" in query else None
+        return purchase_page(conn, user_id, after)
+
+    def _purchase_details(self, conn, match, query, body, user_id, token):
+        return purchase_details(conn, user_id, int(match.group(1)))
+
+    def _tickets(self, conn, match, query, body, user_id, token):
+        return ticket_page(conn, user_id, int(match.group(1)), _int(query.get("apos", 0), "apos"))
+
+    def _profile(self, conn, match, query, body, user_id, token):
+        return load_profile(conn, user_id) or self.backend.rebuild_profile(user_id)
+
+    def _checkin(self, conn, match, query, body, user_id, token):
+        new_badges = self.backend.do_checkin(user_id, _int(_field(body, "atracao"), "atracao"))
+        return {"conquistas": [rule.code for rule in new_badges]}
+
+    def _rating(self, conn, match, query, body, user_id, token):
+        reference_id, rating = _int(_field(body, "referencia"), "referencia"), _int(_field(body, "nota"), "nota")
+        updated = self.backend.submit_rating(user_id, reference_id, _field(body, "tipo"), rating,
+                                             body.get("comentario", ""))
+        return {"atualizada": updated}
+
+    def _itinerary(self, conn, match, query, body, user_id, token):
+        try:
+            items = [tuple(item) for item in _field(body, "itens")]
+        except TypeError:
+            raise ApiError(400, "Campo inválido: itens")
+        return {"id": self.backend.save_itinerary(user_id, _field(body, "nome"), _field(body, "data"), items)}
+
+    def _itineraries(self, conn, match, query, body, user_id, token):
+        return list_itineraries(conn, user_id)
+
+    def _delete_itinerary(self, conn, match, query, body, user_id, token):
+        self.backend.delete_itinerary(user_id, int(match.group(1)))
+        return {}
+
+    def _password(self, conn, match, query, body, user_id, token):
+        self.backend.change_password(user_id, _field(body, "atual"), _field(body, "nova"))
+        return {}
+
+    def _batch(self, conn, match, query, body, user_id, token):
+        responses = []
+        for request in _field(body, "requisicoes"):
+            url = urllib.parse.urlsplit(request.get("caminho", ""))
+            method = request.get("metodo", "GET")
+            if url.path == "/lote" or PAYMENT_PATH.match(url.path):
+                status, payload = 400, {"erro": f"Não permitido em lote: {url.path}"}
+            else:
+                status, payload = self._handle(method, url.path, dict(urllib.parse.parse_qsl(url.query)),
+                                               request.get("corpo") or {}, token)
+            responses.append({"status": status, "corpo": payload})
+        return {"respostas": responses}
+
+
+class ApiClient(object):
+    """The app's backend when it runs as a client of an ApiServer.
+
+    Same methods as services.LocalBackend. Requests reuse one keep-alive
+    connection; pay() waits for the charge on a connection of its own, so it
+    does not hold up the screens' requests.
+    """
+
+    def __init__(self, base_url, timeout=30):
+        url = urllib.parse.urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or DEFAULT_PORT
+        self.timeout = timeout
+        self.token = None
+        self._conn = None
+        self._lock = threading.Lock()
+        self._payments = ThreadPoolExecutor(4, thread_name_prefix="api-payment")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._payments.shutdown(wait=False)
+
+    def _send(self, conn, method, path, body):
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        conn.request(method, path, body=data, headers=headers)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read() or b"null")
+
+    def request(self, method, path, body=None):
+        """Send one request; returns the payload or raises what the server reported."""
+        with self._lock:
+            for attempt in (1, 2):
+                if self._conn is None:
+                    self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+                try:
+                    status, payload = self._send(self._conn, method, path, body)
+                    break
+                except (http.client.HTTPException, OSError):
+                    self._conn.close()
+                    self._conn = None
+                    # Only reads are retried: a write may have been applied before the connection broke
+                    if attempt == 2 or method != "GET":
+                        raise
+        return self._result(status, payload)
+
+    @staticmethod
+    def _result(status, payload):
+        if status == 200:
+            return payload
+        if status == 409:
+            raise SoldOutError(payload["data"], payload["restantes"])
+        if status in (400, 401, 404, 422):
+            raise ServiceError(payload["erro"])
+        raise ApiError(status, payload.get("erro", "Erro no servidor.") if isinstance(payload, dict) else status)
+
+    def batch(self, requests):
+        """Send (method, path, body) requests in one round trip; returns [(status, payload)]."""
+        payload = self.request("POST", "/lote", {"requisicoes": [
+            {"metodo": method, "caminho": path, "corpo": body} for method, path, body in requests
+        ]})
+        return [(response["status"], response["corpo"]) for response in payload["respostas"]]
+
+    def catalog(self, kind):
+        return self.request("GET", f"/catalogo/{kind}")
+
+    def details(self, kind, item_id):
+        return self.request("GET", f"/catalogo/{kind}/{item_id}")
+
+    def park_info(self):
+        return self.request("GET", "/parque/informacoes")
+
+    def warnings(self):
+        return self.request("GET", "/parque/avisos")
+
+    def quote(self, ticket_type_id, day):
+        return self.request("GET", "/cotacao?" + urllib.parse.urlencode({"tipo": ticket_type_id, "data": day}))
+
+    def login_user(self, username, password):
+        user = self.request("POST", "/login", {"username": username, "password": password})
+        self.token = user.pop("token")
+        return user
+
+    def logout(self):
+        """End the session on the server and forget its token."""
+        if self.token is None:
+            return
+        try:
+            self.request("POST", "/logout", {})
+        except (ServiceError, ApiError, http.client.HTTPException, OSError):
+            pass  # An unreachable server or an expired session leaves nothing to end
+        finally:
+            self.token = None
+
+    def register_user(self, username, email, password, confirm_password=None):
+        if confirm_password is not None and password != confirm_password:
+            raise ServiceError("As senhas nao coincidem.")
+        return self.request("POST", "/cadastro", {"username": username, "email": email, "password": password})["id"]
+
+    def process_purchase(self, user_id, ticket_type_id, day, quantity, payment_method):
+        return self.request("POST", "/compras", {
+            "tipo": ticket_type_id, "data": day, "quantidade": quantity, "metodo": payment_method
+        })
+
+    def pay(self, purchase):
+        return self._payments.submit(self._wait_for_payment, purchase["id"])
+
+    def _wait_for_payment(self, purchase_id):
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            status, payload = self._send(conn, "GET", f"/compras/{purchase_id}/pagamento", None)
+        finally:
+            conn.close()
+        return self._result(status, payload)["status"]
+
+    def do_checkin(self, user_id, attraction_id):
+        codes = self.request("POST", "/checkins", {"atracao": attraction_id})["conquistas"]
+        return [RULES_BY_CODE[code] for code in codes if code in RULES_BY_CODE]
+
+    def submit_rating(self, user_id, reference_id, reference_type, rating, comment=""):
+        return self.request("POST", "/avaliacoes", {
+            "referencia": reference_id, "tipo": reference_type, "nota": rating, "comentario": comment
+        })["atualizada"]
+
+    def save_itinerary(self, user_id, name, visit_date, items):
+        return self.request("POST", "/itinerarios", {"nome": name, "data": visit_date, "itens": items})["id"]
+
+    def itineraries(self, user_id):
+        return self.request("GET", "/itinerarios")
+
+    def delete_itinerary(self, user_id, itinerary_id):
+        self.request("DELETE", f"/itinerarios/{itinerary_id}")
+
+    def change_password(self, user_id, current_password, new_password):
+        self.request("POST", "/senha", {"atual": current_password, "nova": new_password})
+
+    def profile(self, user_id):
+        return self.request("GET", "/perfil")
+
+    def purchase_page(self, user_id, after=None):
+        query = "?" + urllib.parse.urlencode({"apos": after[0], "apos_id": after[1]}) if after else ""
+        return self.request("GET", "/compras" + query)
+
+    def purchase_details(self, user_id, purchase_id):
+        return self.request("GET", f"/compras/{purchase_id}")
+
+    def ticket_page(self, user_id, purchase_id, after=0):
+        return self.request("GET", f"/compras/{purchase_id}/ingressos?apos={after}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API HTTP/JSON do Infinity Park 215 para os quiosques.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (0.0.0.0 para a rede do parque)")
+    parser.add_argument("--porta", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=8, help="Threads com conexão própria ao banco")
+    args = parser.parse_args(argv)
+
+    init_db(args.db)
+    server = ApiServer(args.db, args.host, args.porta, args.workers).start()
+    print(f"API ouvindo em http://{args.host}:{server.port} (Ctrl+C para parar)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Incremental achievement (badge) engine driven by attraction check-ins.
+
+Each user has one row in ``estado_conquistas_usuario`` holding running
+counters and a bitset of visited attraction ids. A check-in updates that row
+and evaluates every rule against it, so the cost per event does not depend on
+how many check-ins the user already has.
+"""
+
+from collections import namedtuple
+
+BadgeRule = namedtuple("BadgeRule", "bit code nome descricao predicate")
+
+
+def _visited_all(tipo_atracao):
+    def predicate(state, masks):
+        mask = masks.get(tipo_atracao, 0)
+        return mask != 0 and state.visited & mask == mask
+    return predicate
+
+
+# Bits are persisted in estado_conquistas_usuario.conquistas_obtidas, so a
+# rule must keep its bit forever; new rules take the next free one.
+BADGE_RULES = (
+    BadgeRule(0, "primeiro_checkin", "Primeira Aventura", "Fez o primeiro check-in.",
+              lambda state, masks: state.total_checkins >= 1),
+    BadgeRule(1, "dez_checkins", "Visitante Frequente", "Fez 10 check-ins em atrações.",
+              lambda state, masks: state.total_checkins >= 10),
+    BadgeRule(2, "cinco_no_dia", "Maratonista", "Fez 5 check-ins no mesmo dia.",
+              lambda state, masks: state.checkins_no_dia >= 5),
+    BadgeRule(3, "todas_radicais", "Coração de Aço", "Visitou todas as atrações Radicais.",
+              _visited_all("Radical")),
+    BadgeRule(4, "todas_familiares", "Diversão em Família", "Visitou todas as atrações Familiares.",
+              _visited_all("Familiar")),
+    BadgeRule(5, "todas_atracoes", "Explorador Infinito", "Visitou todas as atrações do parque.",
+              _visited_all("*")),
+)
+
+RULES_BY_CODE = {rule.code: rule for rule in BADGE_RULES}
+
+
+class BadgeState(object):
+    """Per-user counters kept in estado_conquistas_usuario."""
+
+    def __init__(self, user_id, total_checkins=0, last_checkin_day=None,
+                 checkins_no_dia=0, visited=0, earned=0):
+        self.user_id = user_id
+        self.total_checkins = total_checkins
+        self.last_checkin_day = last_checkin_day
+        self.checkins_no_dia = checkins_no_dia
+        self.visited = visited
+        self.earned = earned
+
+    def apply_checkin(self, attraction_id, day):
+        self.total_checkins += 1
+        if day == self.last_checkin_day:
+            self.checkins_no_dia += 1
+        else:
+            self.last_checkin_day = day
+            self.checkins_no_dia = 1
+        self.visited |= 1 << attraction_id
+
+
+def _bits_to_blob(value):
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, "little")
+
+
+def _blob_to_bits(blob):
+    return int.from_bytes(blob, "little") if blob else 0
+
+
+class BadgeEngine(object):
+    """Evaluates BADGE_RULES against incrementally maintained user state.
+
+    Attraction masks (one bitset per tipo_atracao plus "*" for all of them)
+    are loaded once and cached; call invalidate() after attractions change.
+    """
+
+    def __init__(self, rules=BADGE_RULES):
+        self.rules = rules
+        self._masks = None
+
+    def invalidate(self):
+        self._masks = None
+
+    def masks(self, cursor):
+        if self._masks is None:
+            masks = {"*": 0}
+            cursor.execute("SELECT id, tipo_atracao FROM atracoes")
+            for row in cursor.fetchall():
+                bit = 1 << row["id"]
+                masks["*"] |= bit
+                if row["tipo_atracao"]:
+                    masks[row["tipo_atracao"]] = masks.get(row["tipo_atracao"], 0) | bit
+            self._masks = masks
+        return self._masks
+
+    def load_state(self, cursor, user_id):
+        cursor.execute(
+            "SELECT total_checkins, data_ultimo_checkin, checkins_no_dia, atracoes_visitadas, conquistas_obtidas "
+            "FROM estado_conquistas_usuario WHERE id_usuario_sistema = ?",
+            (user_id,)
+        )
+        row = cursor.fetchone()
+        if row:
+            return BadgeState(
+                user_id, row["total_checkins"], row["data_ultimo_checkin"], row["checkins_no_dia"],
+                _blob_to_bits(row["atracoes_visitadas"]), row["conquistas_obtidas"]
+            )
+        return self.rebuild_state(cursor, user_id)
+
+    def rebuild_state(self, cursor, user_id):
+        """Replay the user's check-in history once, for users that predate the engine."""
+        state = BadgeState(user_id)
+        # data_checkin is UTC (CURRENT_TIMESTAMP); record_checkin() is given the local day
+        cursor.execute(
+            "SELECT id_atracao, date(data_checkin, 'localtime') AS dia FROM checkins_atracao "
+            "WHERE id_usuario_sistema = ? ORDER BY data_checkin, id",
+            (user_id,)
+        )
+        for row in cursor.fetchall():
+            state.apply_checkin(row["id_atracao"], row["dia"])
+        cursor.execute(
+            "SELECT codigo_conquista FROM conquistas_usuario WHERE id_usuario_sistema = ?",
+            (user_id,)
+        )
+        for row in cursor.fetchall():
+            rule = RULES_BY_CODE.get(row["codigo_conquista"])
+            if rule:
+                state.earned |= 1 << rule.bit
+        return state
+
+    def save_state(self, cursor, state):
+        cursor.execute(
+            "INSERT OR REPLACE INTO estado_conquistas_usuario "
+            "(id_usuario_sistema, total_checkins, data_ultimo_checkin, checkins_no_dia, atracoes_visitadas, conquistas_obtidas) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (state.user_id, state.total_checkins, state.last_checkin_day, state.checkins_no_dia,
+             _bits_to_blob(state.visited), state.earned)
+        )
+
+    def evaluate(self, state, masks):
+        """Return the rules newly satisfied by state, marking them as earned."""
+        new_badges = []
+        for rule in self.rules:
+            bit = 1 << rule.bit
+            if not state.earned & bit and rule.predicate(state, masks):
+                state.earned |= bit
+                new_badges.append(rule)
+        return new_badges
+
+    def record_checkin(self, cursor, user_id, attraction_id, day):
+        """Apply a check-in to the user's state; the caller owns the commit.
+
+        Must run in the same transaction as the checkins_atracao insert and
+        before it, so a state rebuilt from history does not count it twice.
+        Returns the list of BadgeRule earned by this check-in.
+        """
+        masks = self.masks(cursor)
+        state = self.load_state(cursor, user_id)
+        state.apply_checkin(attraction_id, day)
+        new_badges = self.evaluate(state, masks)
+        self.save_state(cursor, state)
+        for rule in new_badges:
+            cursor.execute(
+                "INSERT OR IGNORE INTO conquistas_usuario (id_usuario_sistema, codigo_conquista) VALUES (?, ?)",
+                (user_id, rule.code)
+            )
+        return new_badges
+
+
+def get_user_badges(cursor, user_id):
+    """Return (BadgeRule, data_conquista) pairs earned by the user, oldest first."""
+    cursor.execute(
+        "SELECT codigo_conquista, data_conquista FROM conquistas_usuario "
+        "WHERE id_usuario_sistema = ? ORDER BY data_conquista, id",
+        (user_id,)
+    )
+    return [
+        (RULES_BY_CODE[row["codigo_conquista"]], row["data_conquista"])
+        for row in cursor.fetchall()
+        if row["codigo_conquista"] in RULES_BY_CODE
+    ]
@@ -0,0 +1,35 @@
+"""Global definitions shared by the app and its headless tools."""
+
+import os
+
+DATABASE_NAME = "infinity_park_215.db"
+APP_NAME = "Infinity Park 215"
+ASSETS_PATH = "assets"  # Relative path for assets
+LOGO_FILE = os.path.join(ASSETS_PATH, "logo_infinity_park_215.png")
+DAILY_TICKET_CAPACITY = 5000  # Park capacity per visit date unless set in estoque_ingressos_dia
+QR_CACHE_PATH = os.path.join("cache", "qr")  # Rendered ticket QR codes, see infinity_park.qr
+# Screens the app builds in the background after the login screen appears
+# (the rest are built on first visit); empty to build every screen on demand
+PREWARM_SCREENS = ("user_home", "admin_home", "attractions_list", "tickets_list")
+# Base URL of an infinity_park.api server (e.g. http://192.168.0.10:8215); when
+# set the app sends its operations there instead of to the local database
+API_URL = os.environ.get("INFINITY_PARK_API")
+API_SESSION_TTL = 8 * 3600  # Seconds without requests before a kiosk login expires on the server
+API_PAYMENT_TTL = 600  # Seconds the server keeps a charge's result for the kiosk to poll
+# SQLite storage profile applied to every connection, see infinity_park.storage
+SQLITE_BUSY_TIMEOUT_MS = 5000  # How long a connection waits for a lock before failing
+SQLITE_CACHE_SIZE_KB = 16384  # Page cache per connection
+SQLITE_MMAP_SIZE = 64 * 1024 * 1024  # Bytes of the file read through memory mapping
+WAL_CHECKPOINT_INTERVAL = 5  # Seconds between background checkpoints
+WAL_MAX_BYTES = 16 * 1024 * 1024  # WAL size that makes a checkpoint wait for readers and truncate it
+# SQL instrumentation (INFINITY_PARK_SQL_PROFILE=1), see infinity_park.instrumentation
+SQL_PROFILE = os.environ.get("INFINITY_PARK_SQL_PROFILE") == "1"
+SLOW_QUERY_MS = 50  # Statements at least this slow go to the slow-query log
+SLOW_QUERY_LOG = os.path.join("logs", "sql_lentas.log")
+SQL_REPORT_PATH = os.path.join("logs", "sql_relatorio.txt")  # Written on exit and on F9
+SQL_PROFILE_SAMPLES = 1024  # Timings kept per query and per method for the percentiles
+# Frame and screen-method profiler (INFINITY_PARK_UI_PROFILE=1), see infinity_park.ui.profiler
+UI_PROFILE = os.environ.get("INFINITY_PARK_UI_PROFILE") == "1"
+FRAME_BUDGET_MS = 1000 / 60  # Frames longer than this are counted as over budget
+UI_PROFILE_WORST_FRAMES = 20  # Worst frames kept, with the methods that ran in them
+UI_PROFILE_REPORT = os.path.join("logs", "ui_perfil.json")  # Written on exit and on F10
@@ -0,0 +1,632 @@
+"""SQLite connection helpers, schema creation and example data."""
+
+import hashlib
+import os
+import sqlite3
+from urllib.parse import quote
+
+from infinity_park.config import ASSETS_PATH, DATABASE_NAME
+from infinity_park.instrumentation import connection_factory
+from infinity_park.sales import rebuild_summary
+from infinity_park.storage import configure, enable_wal
+from infinity_park.ticket_codes import is_compact_code, new_ticket_codes
+
+
+def get_db_connection(database=None):
+    conn = configure(sqlite3.connect(database or DATABASE_NAME, factory=connection_factory()))
+    conn.row_factory = sqlite3.Row  # To access columns by name
+    return conn
+
+def get_read_connection(database=None, snapshot=False):
+    """A connection that can only read, for screens that display data.
+
+    It is opened with mode=ro and query_only, so it never takes a write lock
+    and, with WAL, never waits for writers. With snapshot=True all its
+    queries until close() see the same committed version of the database
+    (the one current at the first query), even if writes commit in between.
+    """
+    path = os.path.abspath(database or DATABASE_NAME)
+    conn = configure(sqlite3.connect(f"file:{quote(path)}?mode=ro", uri=True, factory=connection_factory()))
+    conn.execute("PRAGMA query_only = ON")
+    conn.row_factory = sqlite3.Row
+    if snapshot:
+        conn.isolation_level = None
+        conn.execute("BEGIN")  # Deferred: the snapshot is taken by the first SELECT
+    return conn
+
+def init_db(database=None):
+    """Initialize the SQLite database and create tables if they don't exist."""
+    conn = get_db_connection(database)
+    enable_wal(conn)
+    cursor = conn.cursor()
+
+    # Ticket Types Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS tipos_ingressos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        descricao TEXT,
+        preco_base REAL NOT NULL,
+        idade_minima INTEGER DEFAULT 0,
+        idade_maxima INTEGER DEFAULT 120,
+        ativo INTEGER DEFAULT 1 -- 1 for TRUE, 0 for FALSE
+    );
+    """)
+
+    # Visitors Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS visitantes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        cpf TEXT UNIQUE NOT NULL,
+        nome_completo TEXT NOT NULL,
+        data_nascimento TEXT NOT NULL, -- Format YYYY-MM-DD
+        altura_cm INTEGER,
+        email TEXT UNIQUE NOT NULL,
+        telefone TEXT,
+        restricoes_medicas TEXT,
+        data_cadastro TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+    # Attractions Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS atracoes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        descricao_curta TEXT,
+        descricao_detalhada TEXT,
+        capacidade_por_ciclo INTEGER NOT NULL,
+        duracao_ciclo_minutos INTEGER,
+        altura_minima_cm INTEGER,
+        altura_maxima_cm INTEGER,
+        idade_minima_anos INTEGER,
+        acompanhante_obrigatorio_ate_idade INTEGER,
+        tipo_atracao TEXT, -- Ex: Radical, Familiar, Infantil, Aquatica, Show
+        localizacao_mapa TEXT,
+        local_image_path TEXT, -- Path to local image
+        status TEXT DEFAULT "Operacional", -- Operacional, Manutencao Programada, etc.
+        data_ultima_manutencao TEXT, -- Format YYYY-MM-DD
+        proxima_manutencao_programada TEXT, -- Format YYYY-MM-DD
+        nivel_emocao TEXT, -- Baixo, Medio, Alto
+        acessibilidade TEXT
+    );
+    """)
+
+    # Employees Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS funcionarios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        cpf TEXT UNIQUE NOT NULL,
+        nome_completo TEXT NOT NULL,
+        data_nascimento TEXT, -- Format YYYY-MM-DD
+        cargo TEXT NOT NULL,
+        departamento TEXT,
+        turno TEXT, -- Manha, Tarde, Noite, Integral
+        data_admissao TEXT NOT NULL, -- Format YYYY-MM-DD
+        data_desligamento TEXT, -- Format YYYY-MM-DD
+        salario REAL,
+        email_corporativo TEXT UNIQUE,
+        telefone_contato TEXT,
+        status TEXT DEFAULT "Ativo" -- Ativo, Inativo, Ferias, Licenca
+    );
+    """)
+
+    # System Users Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS usuarios_sistema (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_visitante INTEGER NULL UNIQUE,
+        id_funcionario INTEGER NULL UNIQUE,
+        username TEXT NOT NULL UNIQUE,
+        senha_hash TEXT NOT NULL,
+        tipo_perfil TEXT NOT NULL DEFAULT "Comum", -- Comum, Administrador, Operador
+        email_recuperacao TEXT NOT NULL UNIQUE,
+        ativo INTEGER DEFAULT 1, -- 1 for TRUE, 0 for FALSE
+        data_criacao TEXT DEFAULT CURRENT_TIMESTAMP,
+        ultimo_login TEXT,
+        FOREIGN KEY (id_visitante) REFERENCES visitantes(id) ON DELETE SET NULL,
+        FOREIGN KEY (id_funcionario) REFERENCES funcionarios(id) ON DELETE SET NULL
+    );
+    """)
+
+    # Ticket Purchases Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS compras_ingressos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_usuario_sistema INTEGER NOT NULL,
+        id_visitante_responsavel INTEGER NULL, -- Can be null if the user is not a registered visitor
+        data_compra TEXT DEFAULT CURRENT_TIMESTAMP,
+        valor_total_compra REAL NOT NULL,
+        metodo_pagamento TEXT,
+        status_pagamento TEXT DEFAULT "Pendente", -- Pendente, Aprovado, Recusado
+        codigo_transacao TEXT UNIQUE,
+        total_ingressos INTEGER NOT NULL DEFAULT 0, -- Number of itens_compra_ingressos rows
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id),
+        FOREIGN KEY (id_visitante_responsavel) REFERENCES visitantes(id)
+    );
+    """)
+
+    # Ticket Purchase Items Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS itens_compra_ingressos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_compra_ingresso INTEGER NOT NULL,
+        id_tipo_ingresso INTEGER NOT NULL,
+        quantidade INTEGER NOT NULL DEFAULT 1,
+        preco_unitario_cobrado REAL NOT NULL,
+        data_utilizacao_prevista TEXT NOT NULL, -- Format YYYY-MM-DD
+        codigo_ingresso_unico TEXT UNIQUE NOT NULL,
+        status_ingresso TEXT DEFAULT "Nao Utilizado", -- Nao Utilizado, Utilizado, Cancelado, Expirado
+        id_visitante_portador INTEGER NULL,
+        FOREIGN KEY (id_compra_ingresso) REFERENCES compras_ingressos(id) ON DELETE CASCADE,
+        FOREIGN KEY (id_tipo_ingresso) REFERENCES tipos_ingressos(id),
+        FOREIGN KEY (id_visitante_portador) REFERENCES visitantes(id) ON DELETE SET NULL
+    );
+    """)
+
+    # Park Operating Hours Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS horarios_funcionamento_parque (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        data_especifica TEXT UNIQUE, -- Format YYYY-MM-DD
+        dia_semana TEXT, -- Segunda, Terca, etc. or NULL if data_especifica is filled
+        horario_abertura TEXT, -- Format HH:MM
+        horario_fechamento TEXT, -- Format HH:MM
+        observacao TEXT
+    );
+    """)
+
+    # Attraction Maintenance Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS manutencoes_atracoes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_atracao INTEGER NOT NULL,
+        data_inicio_manutencao TEXT NOT NULL, -- Format YYYY-MM-DD HH:MM
+        data_fim_prevista_manutencao TEXT,
+        data_fim_real_manutencao TEXT,
+        tipo_manutencao TEXT NOT NULL, -- Preventiva, Corretiva
+        descricao_servico TEXT NOT NULL,
+        id_funcionario_responsavel INTEGER,
+        custo_estimado REAL,
+        custo_real REAL,
+        status_manutencao TEXT DEFAULT "Agendada", -- Agendada, Em Andamento, Concluida
+        FOREIGN KEY (id_atracao) REFERENCES atracoes(id) ON DELETE CASCADE,
+        FOREIGN KEY (id_funcionario_responsavel) REFERENCES funcionarios(id) ON DELETE SET NULL
+    );
+    """)
+
+    # Shows Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS shows (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        descricao TEXT,
+        tipo_show TEXT, -- Ex: Musical, Teatro, Personagens
+        localizacao TEXT,
+        horarios TEXT, -- Can be JSON or formatted text
+        duracao_minutos INTEGER,
+        url_imagem_divulgacao TEXT, -- Path to local image or URL
+        ativo INTEGER DEFAULT 1
+    );
+    """)
+
+    # Park Information Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS informacoes_parque (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        chave TEXT NOT NULL UNIQUE, -- Ex: "sobre_nos", "regras_gerais", "historia"
+        titulo TEXT NOT NULL,
+        conteudo TEXT NOT NULL,
+        data_atualizacao TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+    # Food Courts Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS lanchonetes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        descricao TEXT,
+        tipo_culinaria TEXT, -- Ex: "Fast Food", "Doces", "Bebidas"
+        localizacao_mapa TEXT,
+        horario_funcionamento TEXT,
+        url_imagem_logo TEXT, -- Path to local image or URL
+        ativo INTEGER DEFAULT 1
+    );
+    """)
+
+    # Menu Items Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS cardapio_itens (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_lanchonete INTEGER NOT NULL,
+        nome_item TEXT NOT NULL,
+        descricao_item TEXT,
+        preco REAL NOT NULL,
+        categoria TEXT, -- Ex: "Sanduiches", "Sobremesas", "Bebidas"
+        disponivel INTEGER DEFAULT 1,
+        url_imagem_item TEXT, -- Path to local image or URL
+        FOREIGN KEY (id_lanchonete) REFERENCES lanchonetes(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Special Attraction Tickets Table (Fast Pass / Scheduling)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS bilhetes_atracao_especial (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_item_compra_ingresso INTEGER NULL, -- If purchased
+        id_usuario_sistema INTEGER NOT NULL,
+        id_atracao INTEGER NOT NULL,
+        data_agendamento TEXT NOT NULL, -- Format YYYY-MM-DD
+        horario_agendado TEXT NOT NULL, -- Format HH:MM
+        status TEXT DEFAULT "Agendado", -- Agendado, Utilizado, Cancelado, Expirado
+        codigo_bilhete TEXT UNIQUE NOT NULL,
+        data_criacao TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (id_item_compra_ingresso) REFERENCES itens_compra_ingressos(id) ON DELETE SET NULL,
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE,
+        FOREIGN KEY (id_atracao) REFERENCES atracoes(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Park Notices Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS avisos_parque (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        titulo TEXT NOT NULL,
+        mensagem TEXT NOT NULL,
+        tipo_aviso TEXT DEFAULT "Informativo", -- Informativo, Alerta, Urgente
+        data_publicacao TEXT DEFAULT CURRENT_TIMESTAMP,
+        data_expiracao TEXT,
+        ativo INTEGER DEFAULT 1
+    );
+    """)
+
+    # Ratings Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS avaliacoes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_usuario_sistema INTEGER NOT NULL,
+        id_referencia INTEGER NOT NULL, -- ID of attraction, food court, show, etc.
+        tipo_referencia TEXT NOT NULL, -- "atracao", "lanchonete", "show"
+        nota INTEGER NOT NULL, -- Ex: 1 to 5
+        comentario TEXT,
+        data_avaliacao TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Attraction Check-ins Table (Gamification)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS checkins_atracao (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_usuario_sistema INTEGER NOT NULL,
+        id_atracao INTEGER NOT NULL,
+        data_checkin TEXT DEFAULT CURRENT_TIMESTAMP,
+        pontos_ganhos INTEGER DEFAULT 0,
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE,
+        FOREIGN KEY (id_atracao) REFERENCES atracoes(id) ON DELETE CASCADE,
+        UNIQUE (id_usuario_sistema, id_atracao, data_checkin) -- Uniqueness per day should be handled in application logic if needed
+    );
+    """)
+
+    # Achievement Engine State Table (one row per user, updated on each check-in)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS estado_conquistas_usuario (
+        id_usuario_sistema INTEGER PRIMARY KEY,
+        total_checkins INTEGER NOT NULL DEFAULT 0,
+        data_ultimo_checkin TEXT, -- Format YYYY-MM-DD
+        checkins_no_dia INTEGER NOT NULL DEFAULT 0,
+        atracoes_visitadas BLOB, -- Bitset of visited attraction ids
+        conquistas_obtidas INTEGER NOT NULL DEFAULT 0, -- Bitset of earned badge rules
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Earned Badges Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS conquistas_usuario (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_usuario_sistema INTEGER NOT NULL,
+        codigo_conquista TEXT NOT NULL, -- Code of a rule in infinity_park.badges.BADGE_RULES
+        data_conquista TEXT DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE,
+        UNIQUE (id_usuario_sistema, codigo_conquista)
+    );
+    """)
+
+    # Itinerary Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS itinerarios (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_usuario_sistema INTEGER NOT NULL,
+        nome TEXT NOT NULL,
+        data_criacao TEXT DEFAULT CURRENT_TIMESTAMP,
+        data_visita TEXT NOT NULL, -- Format YYYY-MM-DD
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Itinerary Items Table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS itens_itinerario (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_itinerario INTEGER NOT NULL,
+        tipo_item TEXT NOT NULL, -- "atracao", "show", "lanchonete"
+        id_referencia INTEGER NOT NULL, -- ID of attraction, show, food court
+        horario_previsto TEXT, -- Format HH:MM
+        ordem INTEGER NOT NULL,
+        observacao TEXT,
+        FOREIGN KEY (id_itinerario) REFERENCES itinerarios(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Daily Ticket Inventory Table (see infinity_park.inventory)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS estoque_ingressos_dia (
+        data_visita TEXT PRIMARY KEY, -- Format YYYY-MM-DD
+        capacidade INTEGER NOT NULL,
+        vendidos INTEGER NOT NULL DEFAULT 0
+    );
+    """)
+
+    # Daily Demand Table (see infinity_park.pricing)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS demanda_ingressos_dia (
+        data_visita TEXT PRIMARY KEY, -- Format YYYY-MM-DD
+        velocidade REAL NOT NULL DEFAULT 0, -- Exponentially decayed tickets sold
+        atualizado_em REAL -- Unix time of the last sale
+    );
+    """)
+
+    # Sales Summary Table (see infinity_park.sales)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS vendas_agregadas (
+        dia TEXT NOT NULL, -- Purchase day, format YYYY-MM-DD
+        id_tipo_ingresso INTEGER NOT NULL,
+        metodo_pagamento TEXT NOT NULL,
+        status_pagamento TEXT NOT NULL,
+        compras INTEGER NOT NULL DEFAULT 0,
+        ingressos INTEGER NOT NULL DEFAULT 0,
+        receita REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (dia, id_tipo_ingresso, metodo_pagamento, status_pagamento)
+    ) WITHOUT ROWID;
+    """)
+
+    # Profile Summary Table (one row per user, see infinity_park.profile)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS resumo_perfil_usuario (
+        id_usuario_sistema INTEGER PRIMARY KEY,
+        username TEXT NOT NULL,
+        email_recuperacao TEXT,
+        tipo_perfil TEXT NOT NULL,
+        data_criacao TEXT,
+        total_pontos INTEGER NOT NULL DEFAULT 0,
+        total_checkins INTEGER NOT NULL DEFAULT 0,
+        conquistas TEXT NOT NULL DEFAULT '[]', -- JSON list of earned badge codes, oldest first
+        compras_recentes TEXT NOT NULL DEFAULT '[]', -- JSON list of the latest purchases, newest first
+        FOREIGN KEY (id_usuario_sistema) REFERENCES usuarios_sistema(id) ON DELETE CASCADE
+    );
+    """)
+
+    # Lookup of a day's tickets (gate validation loads them in one query)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_itens_compra_data_utilizacao
+    ON itens_compra_ingressos (data_utilizacao_prevista, status_ingresso);
+    """)
+
+    # Expiration sweeper: unused tickets and scheduled bookings by date
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_itens_compra_status_data
+    ON itens_compra_ingressos (status_ingresso, data_utilizacao_prevista);
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_bilhetes_status_data
+    ON bilhetes_atracao_especial (status, data_agendamento);
+    """)
+
+    # Items of one purchase (details screen, payment status updates)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_itens_compra_compra
+    ON itens_compra_ingressos (id_compra_ingresso);
+    """)
+
+    # Keyset pagination of a user's purchase history, newest first
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_compras_usuario_data
+    ON compras_ingressos (id_usuario_sistema, data_compra DESC, id DESC);
+    """)
+
+    migrate_db(cursor)
+
+    cursor.execute("SELECT COUNT(*) FROM atracoes")
+    if cursor.fetchone()["COUNT(*)"] == 0:  # Adjusted to access by column name
+        populate_example_data(cursor)
+
+    conn.commit()
+    conn.close()
+
+def migrate_db(cursor):
+    """Apply the pending MIGRATIONS; the last one applied is kept in PRAGMA user_version."""
+    cursor.execute("PRAGMA user_version")
+    version = cursor.fetchone()[0]
+    for target_version, migration in MIGRATIONS:
+        if version < target_version:
+            migration(cursor)
+            version = target_version
+            cursor.execute(f"PRAGMA user_version = {version}")
+
+def _migrate_compact_ticket_codes(cursor):
+    """Replace uuid4-derived codigo_ingresso_unico values with compact codes."""
+    cursor.execute("SELECT id, codigo_ingresso_unico FROM itens_compra_ingressos")
+    legacy_ids = [row["id"] for row in cursor.fetchall() if not is_compact_code(row["codigo_ingresso_unico"])]
+    for start in range(0, len(legacy_ids), 1000):
+        batch = legacy_ids[start:start + 1000]
+        cursor.executemany(
+            "UPDATE itens_compra_ingressos SET codigo_ingresso_unico = ? WHERE id = ?",
+            zip(new_ticket_codes(len(batch)), batch)
+        )
+
+def _migrate_purchase_ticket_count(cursor):
+    """Add compras_ingressos.total_ingressos and fill it from the existing items."""
+    cursor.execute("PRAGMA table_info(compras_ingressos)")
+    if "total_ingressos" not in [row["name"] for row in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE compras_ingressos ADD COLUMN total_ingressos INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("""
+        UPDATE compras_ingressos SET total_ingressos = (
+            SELECT COUNT(*) FROM itens_compra_ingressos ici WHERE ici.id_compra_ingresso = compras_ingressos.id
+        )
+    """)
+
+def _migrate_sales_summary(cursor):
+    """Fill vendas_agregadas with the purchases made before it existed."""
+    rebuild_summary(cursor)
+
+def _migrate_sales_purchase_counts(cursor):
+    """Recount purchases once each; the cube used to count them once per ticket type."""
+    rebuild_summary(cursor)
+
+MIGRATIONS = [
+    (1, _migrate_compact_ticket_codes),
+    (2, _migrate_purchase_ticket_count),
+    (3, _migrate_sales_summary),
+    (4, _migrate_sales_purchase_counts),
+]
+
+def populate_example_data(cursor):
+    """Populate the database with example data, including new tables."""
+    # Add default admin user
+    admin_username = "admin"
+    admin_password = "admin123"  # Default password
+    admin_email = "admin@infinitypark.com"
+    hashed_password = hashlib.sha256(admin_password.encode("utf-8")).hexdigest()
+
+    try:
+        cursor.execute(
+            "INSERT INTO usuarios_sistema (username, senha_hash, email_recuperacao, tipo_perfil) "
+            "VALUES (?, ?, ?, ?)",
+            (admin_username, hashed_password, admin_email, "Administrador")
+        )
+    except sqlite3.IntegrityError:
+        pass 
+    
+    # Ticket Types
+    tipos_ingressos_data = [
+        ("Adulto", "Ingresso para maiores de 12 anos.", 150.00, 13, 59, 1),
+        ("Crianca", "Ingresso para criancas de 3 a 12 anos.", 75.00, 3, 12, 1),
+        ("Idoso", "Ingresso para maiores de 60 anos.", 70.00, 60, 120, 1),
+        ("PCD", "Ingresso para Pessoa com Deficiencia (acompanhante verificar regras).", 0.00, 0, 120, 1),
+        ("VIP Pass", "Acesso rapido a atracoes selecionadas e areas exclusivas.", 300.00, 0, 120, 1)
+    ]
+    for tipo_ingresso in tipos_ingressos_data:
+        try:
+            cursor.execute("INSERT INTO tipos_ingressos (nome, descricao, preco_base, idade_minima, idade_maxima, ativo) VALUES (?, ?, ?, ?, ?, ?)", tipo_ingresso)
+        except sqlite3.IntegrityError:  # Avoid error if they already exist
+            pass
+
+    # Attractions
+    atracoes_data = [
+        ("Montanha Russa Alpha", "Loopings e adrenalina!", "Sinta a adrenalina pura na Montanha Russa Alpha, uma jornada de alta velocidade com loopings verticais e quedas de tirar o folego. Prepare-se para gritar!", 32, 3, 140, None, 12, None, "Radical", "Area Radical Leste, Setor Vermelho", os.path.join(ASSETS_PATH, "atracao_montanha_russa_alpha.png"), "Operacional", "2025-04-10", "2025-07-10", "Muito Alto", "Nao acessivel para cadeirantes. Restricoes para gestantes e problemas cardiacos."),
+        ("Roda Gigante Vista Bela", "Vista panoramica do parque.", "Desfrute de uma vista espetacular de todo o parque e da paisagem ao redor na Roda Gigante Vista Bela. Perfeita para fotos e momentos relaxantes em familia.", 40, 15, 100, None, 0, None, "Familiar", "Praca Central, Proximo a Entrada Principal", os.path.join(ASSETS_PATH, "atracao_roda_gigante_vista_bela.png"), "Operacional", "2025-03-15", "2025-09-15", "Baixo", "Acessivel para cadeirantes (gondola especial)."),
+        ("Carrinho Bate-Bate Diversao", "Classica diversao para todos.", "Acelere e divirta-se com os amigos e familia no classico Carrinho Bate-Bate. Risadas garantidas para todas as idades!", 20, 4, 90, None, 6, None, "Familiar", "Area Infantil Oeste, Setor Amarelo", os.path.join(ASSETS_PATH, "atracao_carrinho_bate_bate_diversao.png"), "Manutencao Programada", "2025-05-12", "2025-05-17", "Medio", "Acessivel com auxilio para embarque."),
+        ("Rio Bravo Kids", "Aventura aquatica para os pequenos.", "Navegue por corredeiras suaves e divirta-se com esguichos dagua no Rio Bravo Kids. Perfeito para refrescar e para os pequenos aventureiros explorarem.", 20, 10, 80, 120, 4, 8, "Infantil", "Aqua Parque, Setor Azul", os.path.join(ASSETS_PATH, "atracao_rio_bravo_kids.png"), "Operacional", "2025-04-20", "2025-08-20", "Medio", "Acessivel. Criancas pequenas devem estar acompanhadas.")
+    ]
+    for atracao_tuple in atracoes_data:
+        try:
+            cursor.execute("""
+                INSERT INTO atracoes (
+                    nome, descricao_curta, descricao_detalhada, capacidade_por_ciclo, duracao_ciclo_minutos,
+                    altura_minima_cm, altura_maxima_cm, idade_minima_anos, acompanhante_obrigatorio_ate_idade,
+                    tipo_atracao, localizacao_mapa, local_image_path, status, data_ultima_manutencao,
+                    proxima_manutencao_programada, nivel_emocao, acessibilidade
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, atracao_tuple)
+        except sqlite3.IntegrityError:
+            pass
+
+    # Shows
+    shows_data = [
+        ("O Reino Encantado", "Um musical magico com princesas e herois.", "Musical", "Teatro Principal", "14:00, 17:00", 60, os.path.join(ASSETS_PATH, "show_reino_encantado.png"), 1),
+        ("Acrobatas do Fogo", "Performances radicais com fogo e luzes.", "Performance", "Arena Radical", "20:00", 45, os.path.join(ASSETS_PATH, "show_acrobatas_fogo.png"), 1),
+        ("Parada dos Personagens", "Desfile com todos os personagens do parque.", "Desfile", "Rua Principal", "16:00", 30, os.path.join(ASSETS_PATH, "show_parada_personagens.png"), 1)
+    ]
+    for show_tuple in shows_data:
+        try:
+            cursor.execute("INSERT INTO shows (nome, descricao, tipo_show, localizacao, horarios, duracao_minutos, url_imagem_divulgacao, ativo) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", show_tuple)
+        except sqlite3.IntegrityError:
+            pass
+
+    # Park Information
+    info_parque_data = [
+        ("sobre_nos", "Sobre o Infinity Park 215", "O Infinity Park 215 e o seu destino de diversao sem limites! Inaugurado em 2020, nosso parque oferece atracoes emocionantes, shows espetaculares e experiencias inesqueciveis para toda a familia. Venha criar memorias magicas conosco!"),
+        ("regras_gerais", "Regras Gerais do Parque", "Para a seguranca e conforto de todos, siga nossas regras: Nao e permitido entrar com alimentos e bebidas (exceto agua e alimentos para bebes). Respeite as filas e as indicacoes dos funcionarios. Proibido fumar fora das areas designadas. Divirta-se com responsabilidade!"),
+        ("horarios_funcionamento", "Horarios de Funcionamento", "Consulte a secao especifica de horarios para detalhes atualizados, incluindo dias especiais e feriados.")
+    ]
+    for info_tuple in info_parque_data:
+        try:
+            cursor.execute("INSERT INTO informacoes_parque (chave, titulo, conteudo) VALUES (?, ?, ?)", info_tuple)
+        except sqlite3.IntegrityError:
+            pass    
+    
+    # Operating Hours
+    horarios_data = [
+        (None, "Segunda-feira", "10:00", "18:00", "Atracoes aquaticas podem fechar mais cedo dependendo do clima."),
+        (None, "Terca-feira", "10:00", "18:00", None),
+        (None, "Quarta-feira", "10:00", "18:00", None),
+        (None, "Quinta-feira", "10:00", "20:00", "Show noturno as 19:00"),
+        (None, "Sexta-feira", "10:00", "22:00", "Parada especial as 21:00"),
+        (None, "Sabado", "09:00", "22:00", None),
+        (None, "Domingo", "09:00", "20:00", None),
+        ("2025-12-25", None, "12:00", "18:00", "Horario especial de Natal"),
+        ("2026-01-01", None, "12:00", "20:00", "Horario especial de Ano Novo")
+    ]
+    for horario_tuple in horarios_data:
+        try:
+            cursor.execute("INSERT INTO horarios_funcionamento_parque (data_especifica, dia_semana, horario_abertura, horario_fechamento, observacao) VALUES (?, ?, ?, ?, ?)", horario_tuple)
+        except sqlite3.IntegrityError:
+            pass
+
+    # Food Courts
+    lanchonetes_data = [
+        ("Burger Mania", "Os melhores hamburgueres do parque!", "Fast Food", "Praca de Alimentacao Central", "10:00 - 21:30", os.path.join(ASSETS_PATH, "lanchonete_burger_mania.png"), 1),
+        ("Doce Sonho", "Sobremesas, bolos e cafes deliciosos.", "Doceria", "Rua Principal, proximo a Roda Gigante", "11:00 - 19:00", os.path.join(ASSETS_PATH, "lanchonete_doce_sonho.png"), 1),
+        ("Refrescos Tropicais", "Sucos naturais, smoothies e agua de coco.", "Bebidas", "Aqua Parque, entrada", "10:00 - 17:00", os.path.join(ASSETS_PATH, "lanchonete_refrescos_tropicais.png"), 1)
+    ]
+    for lanchonete_tuple in lanchonetes_data:
+        try:
+            cursor.execute("INSERT INTO lanchonetes (nome, descricao, tipo_culinaria, localizacao_mapa, horario_funcionamento, url_imagem_logo, ativo) VALUES (?, ?, ?, ?, ?, ?, ?)", lanchonete_tuple)
+        except sqlite3.IntegrityError:
+            pass
+
+    # Menu Items (Example for Burger Mania, ID 1)
+    cardapio_burger_mania = [
+        (1, "X-Burger Classico", "Pao, carne, queijo, alface, tomate e molho especial.", 25.50, "Sanduiches", 1, os.path.join(ASSETS_PATH, "item_xburger.png")),
+        (1, "Batata Frita Media", "Porcao generosa de batatas fritas crocantes.", 12.00, "Acompanhamentos", 1, os.path.join(ASSETS_PATH, "item_batata_frita.png")),
+        (1, "Refrigerante Lata", "Coca-Cola, Guarana, Fanta.", 8.00, "Bebidas", 1, None)
+    ]
+    for item_tuple in cardapio_burger_mania:
+        try:
+            cursor.execute("INSERT INTO cardapio_itens (id_lanchonete, nome_item, descricao_item, preco, categoria, disponivel, url_imagem_item) VALUES (?, ?, ?, ?, ?, ?, ?)", item_tuple)
+        except sqlite3.IntegrityError:
+            pass    
+    
+    # Menu Items (Example for Doce Sonho, ID 2)
+    cardapio_doce_sonho = [
+        (2, "Bolo de Chocolate Fatiado", "Fatia generosa de bolo de chocolate com cobertura.", 15.00, "Bolos", 1, os.path.join(ASSETS_PATH, "item_bolo_chocolate.png")),
+        (2, "Cafe Expresso", "Cafe forte e aromatico.", 7.00, "Cafes", 1, None)
+    ]
+    for item_tuple in cardapio_doce_sonho:
+        try:
+            cursor.execute("INSERT INTO cardapio_itens (id_lanchonete, nome_item, descricao_item, preco, categoria, disponivel, url_imagem_item) VALUES (?, ?, ?, ?, ?, ?, ?)", item_tuple)
+        except sqlite3.IntegrityError:
+            pass
+
+    # Park Notices
+    avisos_data = [
+        ("Manutencao Montanha Russa", "A Montanha Russa Alpha estara em manutencao programada de 12/05/2025 a 17/05/2025. Agradecemos a compreensao.", "Informativo", "2025-05-10 10:00:00", "2025-05-18 00:00:00", 1),
+        ("Show de Encerramento Especial", "Neste sabado, teremos um show de fogos especial as 21:30 na Praca Central! Nao perca!", "Alerta", "2025-05-13 09:00:00", "2025-05-18 00:00:00", 1)
+    ]
+    for aviso_tuple in avisos_data:
+        try:
+            cursor.execute("INSERT INTO avisos_parque (titulo, mensagem, tipo_aviso, data_publicacao, data_expiracao, ativo) VALUES (?, ?, ?, ?, ?, ?)", aviso_tuple)
+        except sqlite3.IntegrityError:
+            pass
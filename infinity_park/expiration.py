@@ -0,0 +1,126 @@
+"""Marks past-date tickets and FastPass bookings as "Expirado".
+
+Unused tickets (itens_compra_ingressos) whose data_utilizacao_prevista has
+passed and "Agendado" bookings (bilhetes_atracao_especial) whose
+data_agendamento has passed are updated a bounded batch at a time, each batch
+in its own short transaction, so a sweep over a large backlog never holds the
+write lock long enough to stall purchases. Inside the app and the API server
+the batches run on their writer.WriteQueue; the command line sweep, a
+process of its own, commits them on its own connection.
+
+    python -m infinity_park.expiration --date 2025-07-02
+"""
+
+import argparse
+import sys
+import threading
+import time
+from datetime import date
+
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.gate import STATUS_UNUSED
+
+STATUS_EXPIRED = "Expirado"
+BOOKING_SCHEDULED = "Agendado"
+
+# (table, status column, date column, status that expires); each is served by
+# an index on (status column, date column)
+TARGETS = (
+    ("itens_compra_ingressos", "status_ingresso", "data_utilizacao_prevista", STATUS_UNUSED),
+    ("bilhetes_atracao_especial", "status", "data_agendamento", BOOKING_SCHEDULED),
+)
+
+
+def expire_batch(conn, table, status_column, date_column, active_status, today, batch_size):
+    """Expire up to batch_size rows of table dated before today; returns the count."""
+    cursor = conn.execute(f"""
+        UPDATE {table} SET {status_column} = ?
+        WHERE id IN (
+            SELECT id FROM {table}
+            WHERE {status_column} = ? AND {date_column} < ?
+            LIMIT ?
+        )
+    """, (STATUS_EXPIRED, active_status, today, batch_size))
+    conn.commit()
+    return cursor.rowcount
+
+
+def sweep(database=None, today=None, batch_size=500, pause=0.01, writer=None):
+    """Expire everything dated before today (default: the current date).
+
+    pause is slept between batches to let waiting writers in. Each batch is
+    one operation of writer (a started writer.WriteQueue) when given. Returns
+    a dict of expired row counts per table.
+    """
+    today = today or date.today().strftime("%Y-%m-%d")
+    expired = {}
+    conn = get_db_connection(database) if writer is None else None
+    try:
+        for table, status_column, date_column, active_status in TARGETS:
+            expired[table] = 0
+            while True:
+                args = (table, status_column, date_column, active_status, today, batch_size)
+                count = expire_batch(conn, *args) if writer is None else writer.call(expire_batch, *args)
+                expired[table] += count
+                if count < batch_size:
+                    break
+                time.sleep(pause)
+    finally:
+        if conn is not None:
+            conn.close()
+    return expired
+
+
+class ExpirationSweeper(object):
+    """Runs sweep() on a background thread every interval seconds, through writer if given."""
+
+    def __init__(self, database=None, interval=3600, batch_size=500, writer=None):
+        self.database = database
+        self.writer = writer
+        self.interval = interval
+        self.batch_size = batch_size
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="expiration-sweeper", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        if self._thread is not None:
+            self._stopping = True
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopping:
+            try:
+                sweep(self.database, batch_size=self.batch_size, writer=self.writer)
+            except Exception as e:
+                print(f"Erro ao expirar ingressos: {e}", file=sys.stderr)
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Expira ingressos e agendamentos FastPass de datas passadas.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--date", default=None, help="Data de referência (YYYY-MM-DD), padrão hoje")
+    parser.add_argument("--lote", type=int, default=500, help="Linhas atualizadas por transação")
+    args = parser.parse_args(argv)
+
+    init_db(args.db)
+    started = time.perf_counter()
+    expired = sweep(args.db, args.date, args.lote)
+    elapsed = time.perf_counter() - started
+    print(f"{expired['itens_compra_ingressos']} ingressos e {expired['bilhetes_atracao_especial']} "
+          f"agendamentos FastPass expirados em {elapsed:.2f} s.")
+
+
+if __name__ == "__main__":
+    main()
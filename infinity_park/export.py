@@ -0,0 +1,159 @@
+"""Streaming export of purchases and tickets for finance.
+
+Rows are read in short id-ordered batches and written as they arrive into
+gzip-compressed CSV or JSONL files of at most --linhas-por-arquivo rows, so
+memory use does not grow with the table and no read holds the database lock
+for the whole export. With --incremental only rows with an id above the last
+exported one are written; the last ids are kept in <saida>/export_state.json.
+Rows changed after being exported (e.g. a settled payment) are not exported
+again; use a full export when the current state of old rows is needed.
+
+    python -m infinity_park.export --saida exportacoes --incremental
+    python -m infinity_park.export --tabela itens_compra_ingressos --formato jsonl --saida exportacoes
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+
+from infinity_park.db import get_db_connection, init_db
+
+TABLES = ("compras_ingressos", "itens_compra_ingressos")
+FORMATS = ("csv", "jsonl")
+STATE_FILE = "export_state.json"
+
+
+def iter_rows(conn, table, after_id=0, batch_size=5000):
+    """Yield (columns, row) for rows of table with after_id < id <= MAX(id) at start."""
+    last_id = conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0] or 0
+    while after_id < last_id:
+        cursor = conn.execute(
+            f"SELECT * FROM {table} WHERE id > ? AND id <= ? ORDER BY id LIMIT ?",
+            (after_id, last_id, batch_size)
+        )
+        columns = [description[0] for description in cursor.description]
+        count = 0
+        for row in cursor:
+            count += 1
+            after_id = row["id"]
+            yield columns, row
+        if count == 0:
+            break
+
+
+class ChunkedWriter(object):
+    """Writes rows into numbered .csv.gz/.jsonl.gz files of at most rows_per_file rows.
+
+    Files are written under a temporary name and renamed when complete.
+    """
+
+    def __init__(self, directory, prefix, file_format, rows_per_file):
+        self.directory = directory
+        self.prefix = prefix
+        self.file_format = file_format
+        self.rows_per_file = rows_per_file
+        self.files = []
+        self._file = None
+        self._writer = None
+        self._rows_in_file = 0
+
+    def write(self, columns, row):
+        if self._file is None or self._rows_in_file >= self.rows_per_file:
+            self._open(columns)
+        if self.file_format == "csv":
+            self._writer.writerow(tuple(row))
+        else:
+            self._file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n")
+        self._rows_in_file += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            os.replace(self._path + ".tmp", self._path)
+            self.files.append(self._path)
+            self._file = None
+
+    def _open(self, columns):
+        self.close()
+        self._path = os.path.join(
+            self.directory, f"{self.prefix}_{len(self.files) + 1:04d}.{self.file_format}.gz"
+        )
+        self._file = gzip.open(self._path + ".tmp", "wt", encoding="utf-8", newline="")
+        self._rows_in_file = 0
+        if self.file_format == "csv":
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(columns)
+
+
+def load_state(directory):
+    path = os.path.join(directory, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(directory, state):
+    path = os.path.join(directory, STATE_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def export_table(conn, table, directory, file_format="csv", rows_per_file=100000, after_id=0, batch_size=5000):
+    """Export rows of table with id > after_id; returns (rows, files, last exported id)."""
+    prefix = f"{table}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    writer = ChunkedWriter(directory, prefix, file_format, rows_per_file)
+    rows = 0
+    last_id = after_id
+    try:
+        for columns, row in iter_rows(conn, table, after_id, batch_size):
+            writer.write(columns, row)
+            rows += 1
+            last_id = row["id"]
+    finally:
+        writer.close()
+    return rows, writer.files, last_id
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exportação de compras e ingressos para o financeiro.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--saida", required=True, help="Diretório dos arquivos exportados")
+    parser.add_argument("--tabela", choices=TABLES + ("todas",), default="todas")
+    parser.add_argument("--formato", choices=FORMATS, default="csv")
+    parser.add_argument("--linhas-por-arquivo", type=int, default=100000)
+    parser.add_argument("--incremental", action="store_true",
+                        help="Exporta só as linhas novas desde a última exportação incremental")
+    parser.add_argument("--desde-id", type=int, default=None, help="Exporta linhas com id maior que este")
+    args = parser.parse_args(argv)
+
+    tables = TABLES if args.tabela == "todas" else (args.tabela,)
+    os.makedirs(args.saida, exist_ok=True)
+    state = load_state(args.saida) if args.incremental else {}
+
+    init_db(args.db)
+    conn = get_db_connection(args.db)
+    try:
+        for table in tables:
+            after_id = args.desde_id if args.desde_id is not None else state.get(table, 0)
+            started = time.perf_counter()
+            rows, files, last_id = export_table(
+                conn, table, args.saida, args.formato, args.linhas_por_arquivo, after_id
+            )
+            elapsed = time.perf_counter() - started
+            print(f"{table}: {rows} linhas em {len(files)} arquivo(s), ids {after_id + 1 if rows else '-'}"
+                  f"..{last_id if rows else '-'} ({rows / elapsed if elapsed else 0:.0f} linhas/s)")
+            if args.incremental:
+                state[table] = last_id
+                save_state(args.saida, state)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Entrance gate ticket validation backed by an in-memory code index.
+
+The day's tickets are loaded at startup into a dict keyed by
+codigo_ingresso_unico, so a scan of a known ticket never touches the
+database. A code missing from the index is looked up once before it is
+rejected, since purchases are approved by the payment worker after the gate
+opens. Accepted tickets are queued and marked "Utilizado" by a background
+thread in batched transactions, run on a writer.WriteQueue when the
+validator shares a process with one.
+
+Run ``python -m infinity_park.gate`` to validate codes read from stdin (USB
+barcode scanners type the code followed by Enter).
+"""
+
+import argparse
+import sys
+import threading
+from collections import deque
+from datetime import date
+
+from infinity_park.db import get_db_connection, get_read_connection, init_db
+from infinity_park.ticket_codes import normalize
+
+VALID = "VALIDO"
+ALREADY_USED = "JA_UTILIZADO"
+INVALID = "INVALIDO"
+
+STATUS_UNUSED = "Nao Utilizado"
+STATUS_USED = "Utilizado"
+
+# The day's usable tickets: unused or used, from approved purchases
+TICKETS_QUERY = """
+    SELECT ici.id, ici.codigo_ingresso_unico, ici.status_ingresso
+    FROM itens_compra_ingressos ici
+    JOIN compras_ingressos ci ON ci.id = ici.id_compra_ingresso
+    WHERE ici.data_utilizacao_prevista = ?
+      AND ici.status_ingresso IN (?, ?)
+      AND ci.status_pagamento = 'Aprovado'
+"""
+
+
+def mark_used(conn, item_ids):
+    """Mark the unused tickets with these ids "Utilizado" in one transaction."""
+    try:
+        conn.executemany(
+            "UPDATE itens_compra_ingressos SET status_ingresso = ? WHERE id = ? AND status_ingresso = ?",
+            ((STATUS_USED, item_id, STATUS_UNUSED) for item_id in item_ids)
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+class TicketValidator(object):
+    """Validates ticket codes for one day against an in-memory index.
+
+    Use as a context manager (or call start()/close()) so pending writes are
+    flushed when the gate shuts down. With a writer (a started
+    writer.WriteQueue, closed after the validator) the batches are committed
+    on its thread.
+    """
+
+    def __init__(self, database=None, day=None, batch_size=500, flush_interval=0.5, writer=None):
+        self.database = database
+        self.writer = writer
+        self.day = day or date.today().strftime("%Y-%m-%d")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._index = {}  # codigo_ingresso_unico -> [item id, used flag]
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._writer = None
+        self._local = threading.local()  # Read connection of each scanning thread, for _lookup()
+
+    def load(self):
+        """(Re)load the day's approved tickets; codes already in the index keep their state."""
+        conn = get_db_connection(self.database)
+        try:
+            cursor = conn.execute(TICKETS_QUERY, (self.day, STATUS_UNUSED, STATUS_USED))
+            with self._lock:
+                for item_id, code, status in cursor:
+                    if code not in self._index:
+                        self._index[code] = [item_id, status == STATUS_USED]
+        finally:
+            conn.close()
+        return len(self._index)
+
+    def validate(self, code):
+        """Return VALID, ALREADY_USED or INVALID for a scanned code."""
+        key = code.strip()
+        if key not in self._index:
+            # Typed codes may be lowercase or use Crockford aliases (O/I/L)
+            key = normalize(key) or key
+        if key not in self._index:
+            self._lookup(key)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return INVALID
+            if entry[1]:
+                return ALREADY_USED
+            entry[1] = True
+            self._pending.append(entry[0])
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return VALID
+
+    def _lookup(self, code):
+        """Add code to the index if it was bought or approved after load()."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = get_read_connection(self.database)
+        row = conn.execute(
+            TICKETS_QUERY + " AND ici.codigo_ingresso_unico = ?", (self.day, STATUS_UNUSED, STATUS_USED, code)
+        ).fetchone()
+        if row is not None:
+            with self._lock:
+                self._index.setdefault(code, [row["id"], row["status_ingresso"] == STATUS_USED])
+
+    def start(self):
+        if self._writer is None:
+            self._stopping = False
+            self._writer = threading.Thread(target=self._run_writer, name="gate-writer", daemon=True)
+            self._writer.start()
+        return self
+
+    def close(self):
+        """Stop the writer thread after flushing every pending update."""
+        if self._writer is not None:
+            self._stopping = True
+            self._wakeup.set()
+            self._writer.join()
+            self._writer = None
+        self.flush()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def flush(self):
+        """Write queued "Utilizado" updates in one transaction; returns the count written."""
+        batch = []
+        while self._pending:
+            batch.append(self._pending.popleft())
+        if not batch:
+            return 0
+        try:
+            if self.writer is not None:
+                self.writer.call(mark_used, batch)
+            else:
+                conn = get_db_connection(self.database)
+                try:
+                    mark_used(conn, batch)
+                finally:
+                    conn.close()
+        except Exception:
+            # Put the batch back so the next flush retries it
+            self._pending.extendleft(reversed(batch))
+            raise
+        return len(batch)
+
+    def _run_writer(self):
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Erro ao gravar ingressos utilizados: {e}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validação de ingressos na entrada do parque.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--date", default=None, help="Data de utilização (YYYY-MM-DD), padrão hoje")
+    args = parser.parse_args(argv)
+
+    init_db(args.db)
+    validator = TicketValidator(args.db, args.date)
+    loaded = validator.load()
+    print(f"{loaded} ingressos carregados para {validator.day}.", file=sys.stderr)
+    with validator:
+        for line in sys.stdin:
+            code = line.strip()
+            if code:
+                print(f"{code}\t{validator.validate(code)}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
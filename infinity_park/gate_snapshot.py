@@ -0,0 +1,219 @@
+"""Offline gate support: daily ticket snapshot, mmap validator and delta sync.
+
+The snapshot is a small binary file that gate devices copy before opening:
+
+    header  "<4sHHI10s2x" magic, version, record width, record count, day
+    records  codigo_ingresso_unico NUL-padded to the record width, sorted
+
+The validator memory-maps it and binary-searches the records, so startup cost
+and memory do not grow with the number of tickets. Accepted codes are appended
+to a delta log (one "code<TAB>timestamp" line each) which is pushed back to the
+database in bulk by sync_delta() once the device is online again (through a
+writer.WriteQueue when called from a process that has one).
+
+    python -m infinity_park.gate_snapshot export --date 2025-07-01 --out gate.snap
+    python -m infinity_park.gate_snapshot check --snapshot gate.snap --delta gate.log
+    python -m infinity_park.gate_snapshot sync --delta gate.log
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+from datetime import date, datetime
+
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.gate import ALREADY_USED, INVALID, STATUS_UNUSED, STATUS_USED, VALID
+from infinity_park.ticket_codes import normalize
+
+MAGIC = b"IPGS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI10s2x")
+
+
+def export_snapshot(day, path, database=None):
+    """Write the snapshot of approved, unused tickets for day; returns the record count."""
+    conn = get_db_connection(database)
+    try:
+        codes = [
+            row[0].encode("utf-8") for row in conn.execute("""
+                SELECT ici.codigo_ingresso_unico
+                FROM itens_compra_ingressos ici
+                JOIN compras_ingressos ci ON ci.id = ici.id_compra_ingresso
+                WHERE ici.data_utilizacao_prevista = ?
+                  AND ici.status_ingresso = ?
+                  AND ci.status_pagamento = 'Aprovado'
+            """, (day, STATUS_UNUSED))
+        ]
+    finally:
+        conn.close()
+
+    codes.sort()
+    width = max((len(code) for code in codes), default=1)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, width, len(codes), day.encode("ascii")))
+        for code in codes:
+            f.write(code.ljust(width, b"\0"))
+    os.replace(tmp_path, path)
+    return len(codes)
+
+
+class SnapshotValidator(object):
+    """Validates codes against a memory-mapped snapshot, logging accepted ones.
+
+    Codes already present in the delta log are treated as used, so a gate that
+    restarts during the day keeps rejecting tickets it has let through.
+    """
+
+    def __init__(self, snapshot_path, delta_path):
+        self._file = open(snapshot_path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.width, self.count, day = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Arquivo de snapshot invalido: {snapshot_path}")
+        self.day = day.decode("ascii")
+        self._lock = threading.Lock()
+        self._used = set()
+        if os.path.exists(delta_path):
+            with open(delta_path, "r", encoding="utf-8") as f:
+                self._used.update(line.split("\t", 1)[0] for line in f if line.strip())
+        self._delta = open(delta_path, "a", encoding="utf-8")
+
+    def contains(self, code):
+        key = code.encode("utf-8")
+        if len(key) > self.width:
+            return False
+        key = key.ljust(self.width, b"\0")
+        mm, width = self._mm, self.width
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * width
+            record = mm[offset:offset + width]
+            if record < key:
+                lo = mid + 1
+            elif record > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def validate(self, code):
+        """Return VALID, ALREADY_USED or INVALID for a scanned code."""
+        code = code.strip()
+        if not self.contains(code):
+            # Typed codes may be lowercase or use Crockford aliases (O/I/L)
+            code = normalize(code)
+            if code is None or not self.contains(code):
+                return INVALID
+        with self._lock:
+            if code in self._used:
+                return ALREADY_USED
+            self._used.add(code)
+            self._delta.write(f"{code}\t{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            self._delta.flush()
+        return VALID
+
+    def close(self):
+        if getattr(self, "_delta", None):
+            self._delta.close()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def mark_codes_used(conn, codes):
+    """Mark the unused tickets with these codes "Utilizado" in one transaction."""
+    try:
+        conn.executemany(
+            "UPDATE itens_compra_ingressos SET status_ingresso = ? "
+            "WHERE codigo_ingresso_unico = ? AND status_ingresso = ?",
+            ((STATUS_USED, code, STATUS_UNUSED) for code in codes)
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def sync_delta(delta_path, database=None, writer=None):
+    """Mark every code logged since the last sync as "Utilizado" in one transaction.
+
+    The byte offset already synced is kept next to the log (<delta>.offset), so
+    the log stays append-only and sync can run while the gate is scanning.
+    The transaction runs on writer (a started writer.WriteQueue) when given.
+    Returns the number of codes pushed.
+    """
+    offset_path = delta_path + ".offset"
+    offset = 0
+    if os.path.exists(offset_path):
+        with open(offset_path, "r") as f:
+            offset = int(f.read().strip() or 0)
+    if not os.path.exists(delta_path):
+        return 0
+
+    with open(delta_path, "rb") as f:
+        f.seek(offset)
+        chunk = f.read()
+    # Only complete lines; a partially written last line waits for the next sync
+    end = chunk.rfind(b"\n") + 1
+    codes = [line.split(b"\t", 1)[0].decode("utf-8") for line in chunk[:end].splitlines() if line.strip()]
+    if codes and writer is not None:
+        writer.call(mark_codes_used, codes)
+    elif codes:
+        conn = get_db_connection(database)
+        try:
+            mark_codes_used(conn, codes)
+        finally:
+            conn.close()
+    with open(offset_path + ".tmp", "w") as f:
+        f.write(str(offset + end))
+    os.replace(offset_path + ".tmp", offset_path)
+    return len(codes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot offline de ingressos para as catracas.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_cmd = commands.add_parser("export", help="Gera o snapshot do dia")
+    export_cmd.add_argument("--date", default=None, help="Data de utilização (YYYY-MM-DD), padrão hoje")
+    export_cmd.add_argument("--out", required=True)
+
+    check_cmd = commands.add_parser("check", help="Valida códigos lidos do stdin usando o snapshot")
+    check_cmd.add_argument("--snapshot", required=True)
+    check_cmd.add_argument("--delta", required=True)
+
+    sync_cmd = commands.add_parser("sync", help="Envia ao banco os códigos utilizados do log")
+    sync_cmd.add_argument("--delta", required=True)
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        init_db(args.db)
+        day = args.date or date.today().strftime("%Y-%m-%d")
+        count = export_snapshot(day, args.out, args.db)
+        print(f"{count} ingressos exportados para {args.out} ({os.path.getsize(args.out)} bytes).")
+    elif args.command == "check":
+        with SnapshotValidator(args.snapshot, args.delta) as validator:
+            print(f"Snapshot de {validator.day}: {validator.count} ingressos.", file=sys.stderr)
+            for line in sys.stdin:
+                code = line.strip()
+                if code:
+                    print(f"{code}\t{validator.validate(code)}", flush=True)
+    elif args.command == "sync":
+        init_db(args.db)
+        print(f"{sync_delta(args.delta, args.db)} ingressos sincronizados.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""SQL instrumentation: timings per query and per calling screen method, and a slow-query log.
+
+Enabled by INFINITY_PARK_SQL_PROFILE=1 (config.SQL_PROFILE). get_db_connection()
+and get_read_connection() then create InstrumentedConnections. Their cursors
+time each execute()/executemany() and the fetchone()/fetchall()/fetchmany()
+calls that follow it. Rows read by iterating over a cursor are not timed.
+
+Each statement is recorded in STATS under its normalized text, with literals
+and IN lists replaced by "?", and under the method that ran it:
+"AttractionsListScreen.load_attractions" for code in infinity_park.ui,
+otherwise the innermost public infinity_park function outside this module,
+db, storage and writer, such as "services.catalog", or else the thread's
+name, such as "[db-writer]" for its BEGIN and COMMIT. Writes that run on the
+writer queue's thread are credited to the code that submitted them (see
+attributed_to()). Statements slower than SLOW_QUERY_MS are appended to
+SLOW_QUERY_LOG. report() prints count, total, max and p50/p95/p99 per method
+and per query; the app writes it to SQL_REPORT_PATH on exit and when F9 is
+pressed. Count, total and max are exact; the percentiles come from a uniform
+sample of at most SQL_PROFILE_SAMPLES timings per method and per query, so a
+kiosk profiled all day does not grow in memory.
+"""
+
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from infinity_park.config import SLOW_QUERY_LOG, SLOW_QUERY_MS, SQL_PROFILE, SQL_PROFILE_SAMPLES, SQL_REPORT_PATH
+from infinity_park.stats import percentile
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)+\s*\)", re.IGNORECASE)
+_SKIPPED_MODULES = (
+    "infinity_park.instrumentation", "infinity_park.db", "infinity_park.storage", "infinity_park.writer",
+)
+_attribution = threading.local()
+
+
+def normalize(sql):
+    """sql with whitespace collapsed and literals and IN lists replaced by ?."""
+    sql = _LITERALS.sub("?", " ".join(sql.split()))
+    return _IN_LISTS.sub("IN (?)", sql)
+
+
+def current_caller():
+    """Name of the code running the current statement, as recorded in QueryStats."""
+    caller = getattr(_attribution, "caller", None)
+    if caller:
+        return caller
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        name = frame.f_code.co_name
+        if module.startswith("infinity_park.ui."):
+            return _qualified(frame, module, name)
+        if (fallback is None and module.startswith(("infinity_park.", "__main__"))
+                and module not in _SKIPPED_MODULES and not name.startswith("_")):
+            fallback = _qualified(frame, module, name)
+        frame = frame.f_back
+    return fallback or f"[{threading.current_thread().name}]"
+
+
+def _qualified(frame, module, name):
+    owner = frame.f_locals.get("self")
+    if owner is not None:
+        return f"{type(owner).__name__}.{name}"
+    return f"{module.rpartition('.')[2]}.{name}"
+
+
+@contextmanager
+def attributed_to(caller):
+    """Credit the statements run in this block, on this thread, to caller."""
+    previous = getattr(_attribution, "caller", None)
+    _attribution.caller = caller
+    try:
+        yield
+    finally:
+        _attribution.caller = previous
+
+
+class _Timings(object):
+    """Exact count, total and max of one key's samples, and a reservoir of at most size of them."""
+
+    def __init__(self, size):
+        self.size = size
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = []
+
+    def add(self, sample, rng):
+        self.count += 1
+        self.total += sample[0]
+        self.max = max(self.max, sample[0])
+        if len(self.samples) < self.size:
+            self.samples.append(sample)
+        else:
+            # Algorithm R: every sample so far stays with probability size / count
+            slot = rng.randrange(self.count)
+            if slot < self.size:
+                self.samples[slot] = sample
+
+    def extend(self, sample, seconds):
+        self.total += seconds
+        self.max = max(self.max, sample[0])
+
+
+class QueryStats(object):
+    """Statement timings by normalized query and by caller; thread-safe.
+
+    Memory is bounded by the number of distinct queries and callers:
+    each keeps at most samples timings for its percentiles.
+    """
+
+    def __init__(self, slow_ms=SLOW_QUERY_MS, slow_log=SLOW_QUERY_LOG, samples=SQL_PROFILE_SAMPLES):
+        self.slow_ms = slow_ms
+        self.slow_log = slow_log
+        self.samples = samples
+        self.slow = 0
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        self._queries = {}  # normalized sql -> _Timings
+        self._callers = {}  # caller -> _Timings
+
+    def record(self, sql, seconds):
+        """Add one execution; returns its sample, which extend() adds fetch time to."""
+        sample = [seconds, normalize(sql), current_caller(), False]
+        with self._lock:
+            for timings, key in ((self._queries, sample[1]), (self._callers, sample[2])):
+                if key not in timings:
+                    timings[key] = _Timings(self.samples)
+                timings[key].add(sample, self._random)
+        self._check_slow(sample)
+        return sample
+
+    def extend(self, sample, seconds):
+        with self._lock:
+            sample[0] += seconds
+            for timings, key in ((self._queries, sample[1]), (self._callers, sample[2])):
+                if key in timings:  # Unless reset() ran since record()
+                    timings[key].extend(sample, seconds)
+        self._check_slow(sample)
+
+    def reset(self):
+        with self._lock:
+            self._queries.clear()
+            self._callers.clear()
+            self.slow = 0
+
+    def _check_slow(self, sample):
+        if sample[3] or sample[0] * 1000 < self.slow_ms:
+            return
+        sample[3] = True
+        self.slow += 1
+        if not self.slow_log:
+            return
+        directory = os.path.dirname(self.slow_log)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.slow_log, "a", encoding="utf-8") as log:
+            log.write(f"{datetime.now():%Y-%m-%d %H:%M:%S}\t{sample[0] * 1000:.1f} ms\t{sample[2]}\t{sample[1]}\n")
+
+    def summary(self):
+        """{"consultas": {sql: stats}, "metodos": {caller: stats}} with count, total, max and percentiles in ms."""
+
+        def stats(timings):
+            count, total, slowest, values = timings
+            return {
+                "quantidade": count,
+                "total_ms": total * 1000,
+                "max_ms": slowest * 1000,
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p95_ms": percentile(values, 0.95) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+            }
+
+        def snapshot(timings):
+            return {key: (entry.count, entry.total, entry.max, [sample[0] for sample in entry.samples])
+                    for key, entry in timings.items()}
+
+        with self._lock:
+            queries = snapshot(self._queries)
+            callers = snapshot(self._callers)
+        return {
+            "consultas": {sql: stats(timings) for sql, timings in queries.items()},
+            "metodos": {caller: stats(timings) for caller, timings in callers.items()},
+        }
+
+    def report(self, top=20):
+        """Text report of the top callers and queries by total time."""
+        summary = self.summary()
+        count = sum(entry["quantidade"] for entry in summary["consultas"].values())
+        total = sum(entry["total_ms"] for entry in summary["consultas"].values())
+        lines = [
+            f"Consultas SQL: {count} em {total:.1f} ms; lentas (>= {self.slow_ms} ms): {self.slow}",
+        ]
+        for title, key, width in (("Por método", "metodos", 60), ("Por consulta", "consultas", 110)):
+            lines += ["", f"{title}:",
+                      f"  {'qtd':>6s} {'total ms':>9s} {'p50':>7s} {'p95':>7s} {'p99':>7s} {'max':>7s}"]
+            entries = sorted(summary[key].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+            for name, entry in entries[:top]:
+                lines.append(f"  {entry['quantidade']:6d} {entry['total_ms']:9.1f} {entry['p50_ms']:7.2f} "
+                             f"{entry['p95_ms']:7.2f} {entry['p99_ms']:7.2f} {entry['max_ms']:7.2f}  {name[:width]}")
+        return "\n".join(lines)
+
+    def dump(self, path=SQL_REPORT_PATH):
+        """Write report() to path; returns path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(self.report() + "\n")
+        return path
+
+
+STATS = QueryStats()
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    _sample = None
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super(InstrumentedCursor, self).execute(sql, parameters)
+        finally:
+            self._sample = STATS.record(sql, time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super(InstrumentedCursor, self).executemany(sql, seq_of_parameters)
+        finally:
+            self._sample = STATS.record(sql, time.perf_counter() - started)
+
+    def _timed_fetch(self, fetch, *args):
+        started = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            if self._sample is not None:
+                STATS.extend(self._sample, time.perf_counter() - started)
+
+    def fetchone(self):
+        return self._timed_fetch(super(InstrumentedCursor, self).fetchone)
+
+    def fetchmany(self, size=None):
+        fetchmany = super(InstrumentedCursor, self).fetchmany
+        return self._timed_fetch(fetchmany) if size is None else self._timed_fetch(fetchmany, size)
+
+    def fetchall(self):
+        return self._timed_fetch(super(InstrumentedCursor, self).fetchall)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """sqlite3 connection whose cursors, including those of execute(), record into STATS."""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super(InstrumentedConnection, self).cursor(factory)
+
+    # sqlite3's own shortcuts run the statement in C, past InstrumentedCursor.execute()
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connection_factory():
+    """The factory for sqlite3.connect(): InstrumentedConnection when SQL_PROFILE is on."""
+    return InstrumentedConnection if SQL_PROFILE else sqlite3.Connection
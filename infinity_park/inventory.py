@@ -0,0 +1,83 @@
+"""Per-date ticket inventory with atomic decrement-if-available semantics.
+
+estoque_ingressos_dia keeps one row per visit date with its capacity and the
+number of tickets sold. reserve() is a single conditional UPDATE, so two
+buyers racing for the last tickets can never both succeed, and no purchase
+needs to COUNT itens_compra_ingressos.
+"""
+
+from infinity_park.config import DAILY_TICKET_CAPACITY
+
+
+class SoldOutError(Exception):
+    def __init__(self, day, remaining):
+        super(SoldOutError, self).__init__(f"Ingressos esgotados para {day}: restam {remaining}.")
+        self.day = day
+        self.remaining = remaining
+
+
+def _ensure_day(cursor, day):
+    """Create the inventory row for day, counting tickets sold before it existed."""
+    cursor.execute(
+        "INSERT OR IGNORE INTO estoque_ingressos_dia (data_visita, capacidade, vendidos) "
+        "SELECT ?, ?, COUNT(*) FROM itens_compra_ingressos "
+        "WHERE data_utilizacao_prevista = ? AND status_ingresso != 'Cancelado'",
+        (day, DAILY_TICKET_CAPACITY, day)
+    )
+
+
+def reserve(cursor, day, quantity):
+    """Take quantity tickets from day's inventory or raise SoldOutError.
+
+    Runs inside the caller's purchase transaction: a rollback returns them.
+    The UPDATE comes first so the transaction takes the write lock before
+    reading, avoiding lock-upgrade deadlocks between concurrent buyers.
+    """
+    update = (
+        "UPDATE estoque_ingressos_dia SET vendidos = vendidos + ? "
+        "WHERE data_visita = ? AND vendidos + ? <= capacidade"
+    )
+    cursor.execute(update, (quantity, day, quantity))
+    if cursor.rowcount == 1:
+        return
+    remaining_now = remaining(cursor, day)
+    if remaining_now is None:
+        _ensure_day(cursor, day)
+        cursor.execute(update, (quantity, day, quantity))
+        if cursor.rowcount == 1:
+            return
+        remaining_now = remaining(cursor, day)
+    raise SoldOutError(day, remaining_now)
+
+
+def release(cursor, day, quantity):
+    """Give back tickets of a cancelled or refused purchase."""
+    cursor.execute(
+        "UPDATE estoque_ingressos_dia SET vendidos = MAX(vendidos - ?, 0) WHERE data_visita = ?",
+        (quantity, day)
+    )
+
+
+def remaining(cursor, day):
+    """Tickets still available for day, or None if the day has no inventory row yet."""
+    cursor.execute("SELECT capacidade - vendidos FROM estoque_ingressos_dia WHERE data_visita = ?", (day,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def available(cursor, day):
+    """Like remaining(), counting past sales for days without a row (read-only)."""
+    left = remaining(cursor, day)
+    if left is None:
+        cursor.execute(
+            "SELECT COUNT(*) FROM itens_compra_ingressos "
+            "WHERE data_utilizacao_prevista = ? AND status_ingresso != 'Cancelado'",
+            (day,)
+        )
+        left = DAILY_TICKET_CAPACITY - cursor.fetchone()[0]
+    return max(left, 0)
+
+
+def set_capacity(cursor, day, capacity):
+    _ensure_day(cursor, day)
+    cursor.execute("UPDATE estoque_ingressos_dia SET capacidade = ? WHERE data_visita = ?", (capacity, day))
@@ -0,0 +1,282 @@
+"""Asynchronous payment processing for ticket purchases.
+
+Purchases are recorded "Pendente" and submitted to a PaymentWorker, which runs
+an asyncio loop on its own thread, charges them through a PaymentGateway with
+bounded concurrency and writes the results back in batched transactions,
+through the app's writer.WriteQueue when it is given one.
+submit() returns a concurrent.futures.Future resolved with the final status
+once it is committed; UI code adds a done callback, asyncio code can await
+asyncio.wrap_future(future).
+
+SimulatedGateway stands in for the payment provider in development and in
+benchmarks/bench_payments.py: it answers after a random delay and can fail or
+decline a configurable share of the charges.
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+
+from infinity_park.db import get_db_connection
+from infinity_park.inventory import release
+from infinity_park.sales import move_sale
+from infinity_park.stats import percentile
+from infinity_park.storage import retry_busy
+
+PENDING = "Pendente"
+APPROVED = "Aprovado"
+DECLINED = "Recusado"
+
+TICKET_CANCELLED = "Cancelado"
+
+PaymentRequest = namedtuple("PaymentRequest", "purchase_id amount method")
+
+
+class GatewayError(Exception):
+    """Transient gateway failure (timeout, connection reset); the charge is retried."""
+
+
+class PaymentGateway(object):
+    """Interface of a payment provider."""
+
+    async def charge(self, request):
+        """Return APPROVED or DECLINED for request, or raise GatewayError."""
+        raise NotImplementedError
+
+
+class SimulatedGateway(PaymentGateway):
+    """Local gateway stand-in with random latency, failures and declines."""
+
+    def __init__(self, latency=(0.05, 0.3), failure_rate=0.0, decline_rate=0.0, seed=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.decline_rate = decline_rate
+        self._random = random.Random(seed)
+
+    async def charge(self, request):
+        await asyncio.sleep(self._random.uniform(*self.latency))
+        if self._random.random() < self.failure_rate:
+            raise GatewayError("Tempo de resposta do gateway esgotado")
+        if self._random.random() < self.decline_rate:
+            return DECLINED
+        return APPROVED
+
+
+def settle_batch(conn, results):
+    """Commit one batch of (purchase id, status) charge results in a single transaction.
+
+    Results still PENDING are skipped, and so are purchases another worker
+    already settled. Declined purchases release their tickets.
+    """
+    try:
+        cursor = conn.cursor()
+        for purchase_id, status in results:
+            if status == PENDING:
+                continue
+            cursor.execute(
+                "UPDATE compras_ingressos SET status_pagamento = ? WHERE id = ? AND status_pagamento = ?",
+                (status, purchase_id, PENDING)
+            )
+            if cursor.rowcount == 0:
+                continue  # Already settled by another worker
+            cursor.execute("""
+                SELECT id_tipo_ingresso, SUM(quantidade) AS quantidade, preco_unitario_cobrado, data_utilizacao_prevista
+                FROM itens_compra_ingressos WHERE id_compra_ingresso = ?
+                GROUP BY id_tipo_ingresso, preco_unitario_cobrado, data_utilizacao_prevista
+                ORDER BY id_tipo_ingresso
+            """, (purchase_id,))
+            for index, item in enumerate(cursor.fetchall()):
+                # The purchase itself is counted in the cell of its lowest ticket type
+                move_sale(cursor, purchase_id, item["id_tipo_ingresso"], item["quantidade"],
+                          item["preco_unitario_cobrado"], PENDING, status, count_purchase=index == 0)
+                if status == DECLINED:
+                    release(cursor, item["data_utilizacao_prevista"], item["quantidade"])
+            if status == DECLINED:
+                cursor.execute(
+                    "UPDATE itens_compra_ingressos SET status_ingresso = ? WHERE id_compra_ingresso = ?",
+                    (TICKET_CANCELLED, purchase_id)
+                )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+class PaymentWorker(object):
+    """Charges submitted purchases and settles their status.
+
+    concurrency bounds the charges in flight; results are committed every
+    flush_interval seconds or once batch_size of them are waiting. A charge
+    still failing after max_attempts stays "Pendente" and is picked up again
+    by resume_pending() on the next start. With a writer (a started
+    writer.WriteQueue, closed after this worker) the batches are committed
+    on its thread; otherwise on a connection of their own.
+    """
+
+    def __init__(self, database=None, gateway=None, concurrency=16, batch_size=100,
+                 flush_interval=0.1, max_attempts=3, retry_delay=0.2, writer=None):
+        self.database = database
+        self.writer = writer
+        self.gateway = gateway or SimulatedGateway()
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.latencies = []  # Seconds from submit() to committed status
+        self._loop = None
+        self._thread = None
+        self._queue = None
+        self._results = []
+        self._results_ready = None
+        self._stop = None
+        self._draining = False
+        self._ready = threading.Event()
+
+    def start(self):
+        if self._thread is None:
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run, name="payment-worker", daemon=True)
+            self._thread.start()
+            self._ready.wait()
+        return self
+
+    def close(self):
+        """Finish the charges already submitted, commit them and stop the loop."""
+        if self._thread is not None:
+            asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._stop.set)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, purchase_id, amount, method):
+        """Queue a pending purchase for charging; returns a Future of its final status.
+
+        Only valid between start() and close().
+        """
+        future = Future()
+        item = (PaymentRequest(purchase_id, amount, method), future, time.perf_counter())
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        return future
+
+    def resume_pending(self):
+        """Submit every purchase still "Pendente" in the database; returns their futures."""
+        conn = get_db_connection(self.database)
+        try:
+            rows = conn.execute(
+                "SELECT id, valor_total_compra, metodo_pagamento FROM compras_ingressos WHERE status_pagamento = ?",
+                (PENDING,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [self.submit(row["id"], row["valor_total_compra"], row["metodo_pagamento"]) for row in rows]
+
+    def stats(self):
+        """Latency percentiles, in seconds, of the payments settled so far."""
+        latencies = list(self.latencies)
+        return {
+            "pagamentos": len(latencies),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": max(latencies, default=0.0),
+        }
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._main())
+        finally:
+            self._loop.close()
+
+    async def _main(self):
+        self._queue = asyncio.Queue()
+        self._results_ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._draining = False
+        self._ready.set()
+        chargers = [asyncio.create_task(self._charge_forever()) for _ in range(self.concurrency)]
+        flusher = asyncio.create_task(self._flush_forever())
+        await self._stop.wait()
+        for task in chargers:
+            task.cancel()
+        await asyncio.gather(*chargers, return_exceptions=True)
+        # No result can arrive anymore; wake the flusher for its last batch
+        self._draining = True
+        self._results_ready.set()
+        await flusher
+
+    async def _charge_forever(self):
+        while True:
+            request, future, submitted = await self._queue.get()
+            try:
+                status = await self._charge(request)
+            except Exception as e:
+                # A gateway bug must not kill this charger; the purchase stays "Pendente"
+                print(f"Pagamento da compra #{request.purchase_id} falhou: {e!r}", file=sys.stderr)
+                future.set_exception(e)
+            else:
+                self._results.append((request.purchase_id, status, future, submitted))
+                if len(self._results) >= self.batch_size:
+                    self._results_ready.set()
+            finally:
+                self._queue.task_done()
+
+    async def _charge(self, request):
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await self.gateway.charge(request)
+            except GatewayError as e:
+                if attempt == self.max_attempts:
+                    print(f"Pagamento da compra #{request.purchase_id} não concluído: {e}", file=sys.stderr)
+                    return PENDING
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+
+    async def _flush_forever(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._results_ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._results_ready.clear()
+            draining = self._draining
+            await self._flush()
+            if draining:
+                return
+
+    async def _flush(self):
+        batch, self._results = self._results, []
+        if not batch:
+            return
+        results = [(pid, status) for pid, status, _, _ in batch]
+        try:
+            if self.writer is not None:
+                await asyncio.wrap_future(self.writer.submit(settle_batch, results))
+            else:
+                await self._loop.run_in_executor(None, retry_busy, self._write_batch, results)
+        except Exception as e:
+            for _, _, future, _ in batch:
+                future.set_exception(e)
+            return
+        settled = time.perf_counter()
+        for _, status, future, submitted in batch:
+            self.latencies.append(settled - submitted)
+            future.set_result(status)
+
+    def _write_batch(self, results):
+        conn = get_db_connection(self.database)
+        try:
+            settle_batch(conn, results)
+        finally:
+            conn.close()
@@ -0,0 +1,173 @@
+"""Demand-based ticket prices per (ticket type, visit date).
+
+The price of a ticket is tipos_ingressos.preco_base times a multiplier for
+the visit date, built from two signals:
+
+- occupancy: the share of the date's capacity already sold; the price starts
+  rising once OCCUPANCY_THRESHOLD is passed.
+- velocity: tickets sold per hour for the date, as an exponentially decayed
+  counter kept in demanda_ingressos_dia. Each sale updates it in O(1), so
+  the price reacts to a rush without scanning recent purchases.
+
+PricingEngine caches the resulting prices, so the purchase screen gets one
+with a dict lookup, together with the demand of each date; a sale updates
+that demand and the cached prices in place instead of querying again.
+"""
+
+import math
+import threading
+import time
+
+from infinity_park.config import DAILY_TICKET_CAPACITY
+from infinity_park.db import get_read_connection
+from infinity_park.inventory import available
+
+OCCUPANCY_THRESHOLD = 0.5  # Share sold before occupancy raises the price
+OCCUPANCY_MARKUP = 0.3  # Extra multiplier when the date is sold out
+VELOCITY_MARKUP_PER_SHARE = 10.0  # Extra multiplier per share of capacity sold per hour
+VELOCITY_MAX_MARKUP = 0.2
+MAX_MULTIPLIER = 1.5
+VELOCITY_HALF_LIFE = 6 * 3600  # Seconds for a sale to count half as much
+
+
+def _decayed(velocity, updated_at, now):
+    if not updated_at:
+        return 0.0
+    return velocity * math.pow(0.5, max(now - updated_at, 0) / VELOCITY_HALF_LIFE)
+
+
+def record_demand(cursor, day, quantity, now=None):
+    """Add a sale of quantity tickets for day to its velocity counter.
+
+    Runs in the purchase transaction. The counter holds decayed tickets; its
+    value divided by the mean age of a sale (half-life / ln 2) is tickets/hour.
+    """
+    now = now or time.time()
+    cursor.execute("SELECT velocidade, atualizado_em FROM demanda_ingressos_dia WHERE data_visita = ?", (day,))
+    row = cursor.fetchone()
+    velocity = _decayed(row["velocidade"], row["atualizado_em"], now) if row else 0.0
+    cursor.execute(
+        "INSERT OR REPLACE INTO demanda_ingressos_dia (data_visita, velocidade, atualizado_em) VALUES (?, ?, ?)",
+        (day, velocity + quantity, now)
+    )
+
+
+def _per_hour(velocity, updated_at, now):
+    return _decayed(velocity, updated_at, now) * math.log(2) / (VELOCITY_HALF_LIFE / 3600)
+
+
+def tickets_per_hour(cursor, day, now=None):
+    now = now or time.time()
+    cursor.execute("SELECT velocidade, atualizado_em FROM demanda_ingressos_dia WHERE data_visita = ?", (day,))
+    row = cursor.fetchone()
+    if not row:
+        return 0.0
+    return _per_hour(row["velocidade"], row["atualizado_em"], now)
+
+
+def demand(cursor, day):
+    """[capacity, tickets sold, velocity counter, updated at] of day."""
+    cursor.execute("SELECT capacidade FROM estoque_ingressos_dia WHERE data_visita = ?", (day,))
+    row = cursor.fetchone()
+    capacity = row["capacidade"] if row else DAILY_TICKET_CAPACITY
+    sold = max(capacity - available(cursor, day), 0)
+    cursor.execute("SELECT velocidade, atualizado_em FROM demanda_ingressos_dia WHERE data_visita = ?", (day,))
+    row = cursor.fetchone()
+    if not row:
+        return [capacity, sold, 0.0, None]
+    return [capacity, sold, row["velocidade"], row["atualizado_em"]]
+
+
+def _multiplier(capacity, sold, per_hour):
+    if capacity <= 0:
+        return MAX_MULTIPLIER
+    occupancy = sold / capacity
+    occupancy_markup = OCCUPANCY_MARKUP * max(occupancy - OCCUPANCY_THRESHOLD, 0) / (1 - OCCUPANCY_THRESHOLD)
+    velocity_markup = min(VELOCITY_MARKUP_PER_SHARE * per_hour / capacity, VELOCITY_MAX_MARKUP)
+    return min(1 + occupancy_markup + velocity_markup, MAX_MULTIPLIER)
+
+
+def multiplier(cursor, day, now=None):
+    """Price multiplier for day, between 1.0 and MAX_MULTIPLIER."""
+    capacity, sold, velocity, updated_at = demand(cursor, day)
+    return _multiplier(capacity, sold, _per_hour(velocity, updated_at, now or time.time()))
+
+
+class PricingEngine(object):
+    """Cached ticket prices per (ticket type, visit date).
+
+    Dates older than ttl seconds are read again, so sales made by other
+    processes are picked up too; call sold() after committing a sale to
+    apply it to the cached demand and prices right away.
+    """
+
+    def __init__(self, database=None, ttl=60):
+        self.database = database
+        self.ttl = ttl
+        self._demand = {}  # day -> [capacity, sold, velocity, updated at, read at]
+        self._prices = {}  # day -> {id_tipo_ingresso: price}
+        self._base_prices = None
+        self._lock = threading.Lock()  # Guards the three caches: the API server prices on many threads
+
+    def price(self, ticket_type_id, day):
+        with self._lock:
+            state = self._demand.get(day)
+            if state is not None and time.monotonic() - state[4] < self.ttl and ticket_type_id in self._base_prices:
+                return self._cached_price(ticket_type_id, day, state)
+        base_prices, state = self._load(day, ticket_type_id)  # Queries run outside the lock
+        with self._lock:
+            self._base_prices = base_prices
+            self._demand[day] = state
+            self._prices[day] = {}
+            return self._cached_price(ticket_type_id, day, state)
+
+    def sold(self, day, quantity, now=None):
+        """Apply a committed sale of quantity tickets for day to the cache.
+
+        Mirrors record_demand() on the cached counter, so the new prices
+        need no query; a date not cached yet is read on its next price().
+        """
+        now = now or time.time()
+        with self._lock:
+            state = self._demand.get(day)
+            if state is None:
+                return
+            state[1] = min(state[1] + quantity, state[0])
+            state[2] = _decayed(state[2], state[3], now) + quantity
+            state[3] = now
+            prices = self._prices.get(day, {})
+            for ticket_type_id in prices:
+                prices[ticket_type_id] = self._price(ticket_type_id, state, now)
+
+    def invalidate(self):
+        """Drop every cached price, e.g. after preco_base changes."""
+        with self._lock:
+            self._demand.clear()
+            self._prices.clear()
+            self._base_prices = None
+
+    def _cached_price(self, ticket_type_id, day, state):
+        """The price of ticket_type_id on day, computed from state if missing; call with the lock held."""
+        prices = self._prices.setdefault(day, {})
+        if ticket_type_id not in prices:
+            prices[ticket_type_id] = self._price(ticket_type_id, state, time.time())
+        return prices[ticket_type_id]
+
+    def _price(self, ticket_type_id, state, now):
+        capacity, sold, velocity, updated_at = state[:4]
+        factor = _multiplier(capacity, sold, _per_hour(velocity, updated_at, now))
+        return round(self._base_prices[ticket_type_id] * factor, 2)
+
+    def _load(self, day, ticket_type_id):
+        """Read the base prices and the demand of day; returns (base prices, demand state)."""
+        conn = get_read_connection(self.database)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id, preco_base FROM tipos_ingressos")
+            base_prices = {row["id"]: row["preco_base"] for row in cursor.fetchall()}
+            if ticket_type_id not in base_prices:
+                raise KeyError(ticket_type_id)
+            state = demand(cursor, day) + [time.monotonic()]
+        finally:
+            conn.close()
+        return base_prices, state
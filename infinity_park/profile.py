@@ -0,0 +1,111 @@
+"""Per-user profile summary read by the profile screen with one primary-key lookup.
+
+resumo_perfil_usuario holds what MyProfileScreen shows: account data, points
+and check-in totals, earned badge codes and the most recent purchases. It is
+rebuilt on login and updated in place by check-ins and purchases, inside the
+transaction that records them.
+
+load_profile_summary() returns it split into SECTIONS so the screen can
+re-render only the sections whose value changed since it last drew them.
+"""
+
+import json
+
+RECENT_PURCHASES = 3
+SECTIONS = ("conta", "pontos", "conquistas", "compras")
+
+
+def _recent_purchase(row):
+    return {
+        "id": row["id"],
+        "data_compra": row["data_compra"],
+        "total_ingressos": row["total_ingressos"],
+        "valor_total_compra": row["valor_total_compra"],
+    }
+
+
+def rebuild_profile_summary(cursor, user_id):
+    """Compute the user's summary from the base tables and store it; None if no such user."""
+    cursor.execute(
+        "SELECT username, email_recuperacao, tipo_perfil, data_criacao FROM usuarios_sistema WHERE id = ?",
+        (user_id,)
+    )
+    user = cursor.fetchone()
+    if not user:
+        return None
+    cursor.execute(
+        "SELECT COALESCE(SUM(pontos_ganhos), 0), COUNT(*) FROM checkins_atracao WHERE id_usuario_sistema = ?",
+        (user_id,)
+    )
+    total_points, total_checkins = cursor.fetchone()
+    cursor.execute(
+        "SELECT codigo_conquista FROM conquistas_usuario WHERE id_usuario_sistema = ? ORDER BY data_conquista, id",
+        (user_id,)
+    )
+    badges = [row["codigo_conquista"] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT id, data_compra, total_ingressos, valor_total_compra FROM compras_ingressos "
+        "WHERE id_usuario_sistema = ? ORDER BY data_compra DESC, id DESC LIMIT ?",
+        (user_id, RECENT_PURCHASES)
+    )
+    purchases = [_recent_purchase(row) for row in cursor.fetchall()]
+    cursor.execute(
+        "INSERT OR REPLACE INTO resumo_perfil_usuario "
+        "(id_usuario_sistema, username, email_recuperacao, tipo_perfil, data_criacao, "
+        "total_pontos, total_checkins, conquistas, compras_recentes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (user_id, user["username"], user["email_recuperacao"], user["tipo_perfil"], user["data_criacao"],
+         total_points, total_checkins, json.dumps(badges), json.dumps(purchases))
+    )
+    return load_profile_summary(cursor, user_id)
+
+
+def load_profile_summary(cursor, user_id):
+    """Return {section: value} for the user, or None if the summary was never built."""
+    cursor.execute("SELECT * FROM resumo_perfil_usuario WHERE id_usuario_sistema = ?", (user_id,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    return {
+        "conta": {
+            "username": row["username"],
+            "email_recuperacao": row["email_recuperacao"],
+            "tipo_perfil": row["tipo_perfil"],
+            "data_criacao": row["data_criacao"],
+        },
+        "pontos": {"total_pontos": row["total_pontos"], "total_checkins": row["total_checkins"]},
+        "conquistas": json.loads(row["conquistas"]),
+        "compras": json.loads(row["compras_recentes"]),
+    }
+
+
+def record_checkin(cursor, user_id, points, new_badges=()):
+    """Count a check-in (and the BadgeRule list it earned); call after inserting it."""
+    cursor.execute("SELECT conquistas FROM resumo_perfil_usuario WHERE id_usuario_sistema = ?", (user_id,))
+    row = cursor.fetchone()
+    if not row:
+        rebuild_profile_summary(cursor, user_id)
+        return
+    badges = json.loads(row["conquistas"]) + [rule.code for rule in new_badges]
+    cursor.execute(
+        "UPDATE resumo_perfil_usuario SET total_pontos = total_pontos + ?, total_checkins = total_checkins + 1, "
+        "conquistas = ? WHERE id_usuario_sistema = ?",
+        (points, json.dumps(badges), user_id)
+    )
+
+
+def record_purchase(cursor, user_id, purchase_id):
+    """Put a just-inserted purchase at the top of the user's recent purchases."""
+    cursor.execute("SELECT compras_recentes FROM resumo_perfil_usuario WHERE id_usuario_sistema = ?", (user_id,))
+    row = cursor.fetchone()
+    if not row:
+        rebuild_profile_summary(cursor, user_id)
+        return
+    cursor.execute(
+        "SELECT id, data_compra, total_ingressos, valor_total_compra FROM compras_ingressos WHERE id = ?",
+        (purchase_id,)
+    )
+    purchases = [_recent_purchase(cursor.fetchone())] + json.loads(row["compras_recentes"])
+    cursor.execute(
+        "UPDATE resumo_perfil_usuario SET compras_recentes = ? WHERE id_usuario_sistema = ?",
+        (json.dumps(purchases[:RECENT_PURCHASES]), user_id)
+    )
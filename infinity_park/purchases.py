@@ -0,0 +1,113 @@
+"""Ticket purchase recording shared by every purchase path."""
+
+import uuid
+
+from infinity_park.inventory import reserve
+from infinity_park.pricing import record_demand
+from infinity_park.profile import record_purchase
+from infinity_park.sales import record_sale
+from infinity_park.ticket_codes import new_ticket_codes
+
+PAGE_SIZE = 20
+TICKET_PAGE_SIZE = 20
+
+
+def create_purchase(cursor, user_id, ticket_type_id, unit_price, day, quantity, payment_method,
+                    status_pagamento="Pendente"):
+    """Reserve day's inventory and record the purchase with one item per ticket.
+
+    Purchases start "Pendente" until infinity_park.payments settles them.
+
+    Raises inventory.SoldOutError when the date has not enough tickets left.
+    The caller commits, or rolls back to return the reserved tickets.
+    Returns the new compras_ingressos id.
+    """
+    reserve(cursor, day, quantity)
+    record_demand(cursor, day, quantity)
+    cursor.execute(
+        "INSERT INTO compras_ingressos (id_usuario_sistema, data_compra, valor_total_compra, metodo_pagamento, status_pagamento, codigo_transacao, total_ingressos) "
+        "VALUES (?, CURRENT_TIMESTAMP, ?, ?, ?, ?, ?)",
+        (user_id, quantity * unit_price, payment_method, status_pagamento, str(uuid.uuid4()), quantity)
+    )
+    purchase_id = cursor.lastrowid
+    cursor.executemany(
+        "INSERT INTO itens_compra_ingressos (id_compra_ingresso, id_tipo_ingresso, quantidade, preco_unitario_cobrado, data_utilizacao_prevista, codigo_ingresso_unico) "
+        "VALUES (?, ?, 1, ?, ?, ?)",
+        [(purchase_id, ticket_type_id, unit_price, day, ticket_code)
+         for ticket_code in new_ticket_codes(quantity)]
+    )
+    record_sale(cursor, purchase_id, ticket_type_id, quantity, unit_price)
+    record_purchase(cursor, user_id, purchase_id)
+    return purchase_id
+
+
+def fetch_purchase_page(cursor, user_id, after=None, limit=PAGE_SIZE):
+    """Return one page of the user's purchases, newest first, and the key of the next page.
+
+    Pages are keyed on (data_compra, id) of the last row instead of an OFFSET,
+    so every page is a range scan of idx_compras_usuario_data no matter how
+    deep the user has scrolled. The next key is None on the last page.
+    """
+    query = (
+        "SELECT id, data_compra, valor_total_compra, status_pagamento, total_ingressos "
+        "FROM compras_ingressos WHERE id_usuario_sistema = ? "
+    )
+    params = [user_id]
+    if after is not None:
+        query += "AND (data_compra, id) < (?, ?) "
+        params.extend(after)
+    query += "ORDER BY data_compra DESC, id DESC LIMIT ?"
+    params.append(limit + 1)
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, (rows[-1]["data_compra"], rows[-1]["id"])
+    return rows, None
+
+
+def get_purchase_details(cursor, purchase_id):
+    """Return (purchase, groups) for a purchase, or None if it does not exist.
+
+    One query brings the purchase with its items grouped by ticket type, price
+    and visit date; each group row has tipo_ingresso, quantidade, subtotal,
+    preco_unitario_cobrado and data_utilizacao_prevista. groups is empty for a
+    purchase without items.
+    """
+    cursor.execute("""
+        SELECT ci.id, ci.data_compra, ci.valor_total_compra, ci.metodo_pagamento,
+               ci.status_pagamento, ci.codigo_transacao,
+               ti.nome AS tipo_ingresso, ici.preco_unitario_cobrado, ici.data_utilizacao_prevista,
+               COUNT(ici.id) AS quantidade, SUM(ici.preco_unitario_cobrado) AS subtotal
+        FROM compras_ingressos ci
+        LEFT JOIN itens_compra_ingressos ici ON ici.id_compra_ingresso = ci.id
+        LEFT JOIN tipos_ingressos ti ON ti.id = ici.id_tipo_ingresso
+        WHERE ci.id = ?
+        GROUP BY ici.id_tipo_ingresso, ici.preco_unitario_cobrado, ici.data_utilizacao_prevista
+        ORDER BY ti.nome, ici.data_utilizacao_prevista
+    """, (purchase_id,))
+    rows = cursor.fetchall()
+    if not rows:
+        return None
+    return rows[0], [row for row in rows if row["quantidade"]]
+
+
+def fetch_ticket_page(cursor, purchase_id, after_id=0, limit=TICKET_PAGE_SIZE):
+    """Return one page of a purchase's tickets in id order and the id to continue after.
+
+    The next id is None on the last page.
+    """
+    cursor.execute("""
+        SELECT ici.id, ici.preco_unitario_cobrado, ici.data_utilizacao_prevista,
+               ici.codigo_ingresso_unico, ici.status_ingresso, ti.nome AS tipo_ingresso
+        FROM itens_compra_ingressos ici
+        JOIN tipos_ingressos ti ON ti.id = ici.id_tipo_ingresso
+        WHERE ici.id_compra_ingresso = ? AND ici.id > ?
+        ORDER BY ici.id
+        LIMIT ?
+    """, (purchase_id, after_id, limit + 1))
+    rows = cursor.fetchall()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, rows[-1]["id"]
+    return rows, None
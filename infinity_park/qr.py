@@ -0,0 +1,110 @@
+"""Ticket QR codes rendered on a worker thread and cached as PNG files.
+
+Images are keyed by codigo_ingresso_unico, so each ticket is rendered once
+and later screens only check the file exists. Requires the optional qrcode
+package (pip install qrcode); without it available() is False and the app
+shows ticket codes as text only.
+"""
+
+import hashlib
+import os
+import queue
+import struct
+import threading
+import zlib
+
+try:
+    import qrcode
+except ImportError:
+    qrcode = None
+
+from infinity_park.config import QR_CACHE_PATH
+
+
+def available():
+    return qrcode is not None
+
+
+def qr_matrix(data):
+    """Module matrix (rows of booleans, quiet zone included) of a QR code for data."""
+    code = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_M, border=4)
+    code.add_data(data)
+    code.make(fit=True)
+    return code.get_matrix()
+
+
+def _png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+
+def write_png(matrix, path, scale=4):
+    """Write matrix as an 8-bit grayscale PNG, scale pixels per module."""
+    size = len(matrix) * scale
+    rows = []
+    for modules in matrix:
+        row = b"\0" + b"".join((b"\x00" if dark else b"\xff") * scale for dark in modules)
+        rows.extend([row] * scale)
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 0, 0, 0, 0)))
+        f.write(_png_chunk(b"IDAT", zlib.compress(b"".join(rows), 9)))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+class QRRenderer(object):
+    """Renders ticket QR codes on demand on one background thread.
+
+    request() calls back with the PNG path (or None on failure) on the worker
+    thread, or right away when the image is already cached. The most recent
+    requests are served first, so rows the user scrolled past wait behind the
+    ones on screen.
+    """
+
+    def __init__(self, cache_dir=QR_CACHE_PATH, scale=4):
+        self.cache_dir = cache_dir
+        self.scale = scale
+        self._queue = queue.LifoQueue()
+        self._pending = {}  # code -> callbacks waiting for it
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def path_for(self, code):
+        name = code if code.replace("-", "").isalnum() else hashlib.sha256(code.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, name + ".png")
+
+    def request(self, code, callback):
+        path = self.path_for(code)
+        if os.path.exists(path):
+            callback(path)
+            return
+        with self._lock:
+            if code in self._pending:
+                self._pending[code].append(callback)
+                return
+            self._pending[code] = [callback]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="qr-renderer", daemon=True)
+                self._thread.start()
+        self._queue.put(code)
+
+    def render(self, code):
+        """Render code's image into the cache now; returns its path."""
+        path = self.path_for(code)
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            write_png(qr_matrix(code), tmp_path, self.scale)
+            os.replace(tmp_path, path)
+        return path
+
+    def _run(self):
+        while True:
+            code = self._queue.get()
+            try:
+                path = self.render(code)
+            except Exception:
+                path = None
+            with self._lock:
+                callbacks = self._pending.pop(code, [])
+            for callback in callbacks:
+                callback(path)
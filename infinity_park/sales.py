@@ -0,0 +1,129 @@
+"""Pre-aggregated sales figures (the vendas_agregadas cube).
+
+Each row holds the purchase count, ticket count and revenue of one
+(dia, id_tipo_ingresso, metodo_pagamento, status_pagamento) cell. Purchases
+add to their cell as they are recorded, so a report reads a few hundred
+summary rows instead of scanning the purchase history.
+
+Tickets and revenue are split by ticket type, but each purchase is counted
+once, in the cell of its lowest id_tipo_ingresso, so purchase counts add up
+across cells. Grouped by type, a purchase with several types counts under
+its first one.
+"""
+
+# Report dimensions: option name -> (column, label)
+DIMENSIONS = {
+    "dia": ("v.dia", "Dia"),
+    "tipo": ("t.nome", "Tipo de Ingresso"),
+    "metodo": ("v.metodo_pagamento", "Método de Pagamento"),
+    "status": ("v.status_pagamento", "Status"),
+}
+
+
+def record_sale(cursor, purchase_id, ticket_type_id, quantity, unit_price, status=None, sign=1,
+                count_purchase=True):
+    """Add a purchase's tickets of one type to their cell (or take them out with sign=-1).
+
+    The cell's day and payment method come from the compras_ingressos row, and
+    its status too unless given. count_purchase adds the purchase itself to
+    the count, and is only true for the purchase's lowest ticket type. Runs in
+    the caller's transaction.
+    """
+    cursor.execute("""
+        INSERT INTO vendas_agregadas (dia, id_tipo_ingresso, metodo_pagamento, status_pagamento, compras, ingressos, receita)
+        SELECT date(data_compra), ?, COALESCE(metodo_pagamento, ''), COALESCE(?, status_pagamento, ''), ?, ?, ?
+        FROM compras_ingressos WHERE id = ?
+        ON CONFLICT (dia, id_tipo_ingresso, metodo_pagamento, status_pagamento) DO UPDATE SET
+            compras = compras + excluded.compras,
+            ingressos = ingressos + excluded.ingressos,
+            receita = receita + excluded.receita
+    """, (ticket_type_id, status, sign if count_purchase else 0, sign * quantity, sign * quantity * unit_price,
+          purchase_id))
+
+
+def move_sale(cursor, purchase_id, ticket_type_id, quantity, unit_price, old_status, new_status,
+              count_purchase=True):
+    """Move a purchase's tickets of one type between status cells after its payment status changed."""
+    record_sale(cursor, purchase_id, ticket_type_id, quantity, unit_price, old_status, -1, count_purchase)
+    record_sale(cursor, purchase_id, ticket_type_id, quantity, unit_price, new_status, 1, count_purchase)
+
+
+def rebuild_summary(cursor):
+    """Recompute the whole cube from compras_ingressos and itens_compra_ingressos."""
+    cursor.execute("DELETE FROM vendas_agregadas")
+    cursor.execute("""
+        INSERT INTO vendas_agregadas (dia, id_tipo_ingresso, metodo_pagamento, status_pagamento, compras, ingressos, receita)
+        WITH primeiro_tipo AS (
+            SELECT id_compra_ingresso, MIN(id_tipo_ingresso) AS id_tipo_ingresso
+            FROM itens_compra_ingressos GROUP BY id_compra_ingresso
+        )
+        SELECT date(ci.data_compra), ici.id_tipo_ingresso,
+               COALESCE(ci.metodo_pagamento, ''), COALESCE(ci.status_pagamento, ''),
+               COUNT(DISTINCT CASE WHEN ici.id_tipo_ingresso = pt.id_tipo_ingresso THEN ci.id END),
+               SUM(ici.quantidade), SUM(ici.quantidade * ici.preco_unitario_cobrado)
+        FROM compras_ingressos ci
+        JOIN itens_compra_ingressos ici ON ici.id_compra_ingresso = ci.id
+        JOIN primeiro_tipo pt ON pt.id_compra_ingresso = ci.id
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def check_summary(cursor):
+    """Compare the cube with compras_ingressos; returns the mismatching (dia, metodo, status) groups.
+
+    Each mismatch is (dia, metodo_pagamento, status_pagamento, (compras,
+    ingressos, receita) in the cube, the same from the purchases). An empty
+    list means the cube is consistent.
+    """
+    cursor.execute("""
+        SELECT dia, metodo_pagamento, status_pagamento, SUM(compras), SUM(ingressos), ROUND(SUM(receita), 2)
+        FROM vendas_agregadas GROUP BY 1, 2, 3 HAVING SUM(compras) OR SUM(ingressos)
+    """)
+    cube = {tuple(row[:3]): tuple(row[3:]) for row in cursor.fetchall()}
+    cursor.execute("""
+        SELECT date(ci.data_compra), COALESCE(ci.metodo_pagamento, ''), COALESCE(ci.status_pagamento, ''),
+               COUNT(*), SUM(itens.ingressos), ROUND(SUM(itens.receita), 2)
+        FROM compras_ingressos ci
+        JOIN (
+            SELECT id_compra_ingresso, SUM(quantidade) AS ingressos, SUM(quantidade * preco_unitario_cobrado) AS receita
+            FROM itens_compra_ingressos GROUP BY id_compra_ingresso
+        ) itens ON itens.id_compra_ingresso = ci.id
+        GROUP BY 1, 2, 3
+    """)
+    purchases = {tuple(row[:3]): tuple(row[3:]) for row in cursor.fetchall()}
+    return [key + (cube.get(key), purchases.get(key)) for key in sorted(set(cube) | set(purchases))
+            if cube.get(key) != purchases.get(key)]
+
+
+def query_sales(cursor, group_by=("dia",), start=None, end=None, ticket_type_id=None,
+                payment_method=None, status=None):
+    """Return one row per group with compras, ingressos and receita totals.
+
+    group_by is a sequence of DIMENSIONS keys (empty for the grand total);
+    start and end are inclusive YYYY-MM-DD bounds on the purchase day.
+    """
+    unknown = [name for name in group_by if name not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Dimensão desconhecida: {', '.join(unknown)}")
+    columns = [f"{DIMENSIONS[name][0]} AS {name}" for name in group_by]
+    conditions, params = [], []
+    for sql, value in (("v.dia >= ?", start), ("v.dia <= ?", end),
+                       ("v.id_tipo_ingresso = ?", ticket_type_id),
+                       ("v.metodo_pagamento = ?", payment_method),
+                       ("v.status_pagamento = ?", status)):
+        if value is not None:
+            conditions.append(sql)
+            params.append(value)
+
+    query = (
+        "SELECT " + ", ".join(columns + ["SUM(v.compras) AS compras", "SUM(v.ingressos) AS ingressos",
+                                         "SUM(v.receita) AS receita"]) +
+        " FROM vendas_agregadas v LEFT JOIN tipos_ingressos t ON t.id = v.id_tipo_ingresso"
+    )
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    if group_by:
+        query += " GROUP BY " + ", ".join(group_by) + " ORDER BY " + ", ".join(group_by)
+    cursor.execute(query, params)
+    # Cells emptied by move_sale stay behind with zero purchases and tickets
+    return [row for row in cursor.fetchall() if row["compras"] or row["ingressos"]]
@@ -0,0 +1,74 @@
+"""Headless sales report over the vendas_agregadas cube.
+
+    python -m infinity_park.sales_report --por dia,metodo --de 2025-07-01 --ate 2025-07-31
+    python -m infinity_park.sales_report --por tipo --status Aprovado
+    python -m infinity_park.sales_report --reconstruir
+    python -m infinity_park.sales_report --verificar
+"""
+
+import argparse
+import sys
+import time
+
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.sales import DIMENSIONS, check_summary, query_sales, rebuild_summary
+
+
+def format_report(rows, group_by):
+    header = [DIMENSIONS[name][1] for name in group_by] + ["Compras", "Ingressos", "Receita (R$)"]
+    lines = [header]
+    for row in rows:
+        lines.append([str(row[name] if row[name] is not None else "-") for name in group_by] +
+                     [str(row["compras"]), str(row["ingressos"]), f"{row['receita']:.2f}".replace(".", ",")])
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relatório de vendas de ingressos.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--por", default="dia",
+                        help=f"Dimensões separadas por vírgula ({', '.join(DIMENSIONS)}); vazio para o total geral")
+    parser.add_argument("--de", default=None, help="Primeiro dia da compra (YYYY-MM-DD)")
+    parser.add_argument("--ate", default=None, help="Último dia da compra (YYYY-MM-DD)")
+    parser.add_argument("--tipo", type=int, default=None, help="Id do tipo de ingresso")
+    parser.add_argument("--metodo", default=None, help="Método de pagamento")
+    parser.add_argument("--status", default=None, help="Status do pagamento")
+    parser.add_argument("--reconstruir", action="store_true", help="Recalcula o agregado a partir das compras")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Confere os totais do agregado com compras_ingressos (sai com status 1 se diferirem)")
+    args = parser.parse_args(argv)
+
+    group_by = [name.strip() for name in args.por.split(",") if name.strip()]
+    unknown = [name for name in group_by if name not in DIMENSIONS]
+    if unknown:
+        parser.error(f"dimensão desconhecida: {', '.join(unknown)}")
+
+    init_db(args.db)
+    conn = get_db_connection(args.db)
+    try:
+        cursor = conn.cursor()
+        if args.reconstruir:
+            rebuild_summary(cursor)
+            conn.commit()
+        mismatches = check_summary(cursor) if args.verificar else []
+        started = time.perf_counter()
+        rows = query_sales(cursor, group_by, args.de, args.ate, args.tipo, args.metodo, args.status)
+        elapsed = time.perf_counter() - started
+    finally:
+        conn.close()
+
+    if args.verificar:
+        for day, method, status, cube, purchases in mismatches:
+            print(f"Divergência em {day} / {method or '-'} / {status or '-'}: "
+                  f"agregado {cube or (0, 0, 0.0)}, compras {purchases or (0, 0, 0.0)}")
+        if mismatches:
+            sys.exit(1)
+        print("Agregado confere com compras_ingressos.\n")
+
+    print(format_report(rows, group_by))
+    print(f"\n{len(rows)} linhas em {elapsed * 1000:.2f} ms.")
+
+
+if __name__ == "__main__":
+    main()
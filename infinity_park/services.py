@@ -0,0 +1,527 @@
+"""The app's data operations as plain functions, usable without Kivy.
+
+Each function runs one operation as one transaction on the given connection:
+it commits on success, rolls back on failure and re-raises. Problems the user
+can fix raise ServiceError with the message the screens show; anything else
+(including inventory.SoldOutError from process_purchase) propagates as is.
+
+    conn = get_db_connection()
+    user = login_user(conn, "admin", "admin123")
+    purchase_id = process_purchase(conn, user["id"], 1, 150.0, "2025-07-01", 2, "PIX")
+"""
+
+import hashlib
+import sqlite3
+import sys
+from datetime import datetime
+
+from infinity_park.badges import BadgeEngine
+from infinity_park.db import get_db_connection, get_read_connection
+from infinity_park.inventory import available
+from infinity_park.pricing import PricingEngine
+from infinity_park.profile import load_profile_summary, rebuild_profile_summary, record_checkin
+from infinity_park.purchases import create_purchase, fetch_purchase_page, fetch_ticket_page, get_purchase_details
+from infinity_park.storage import retry_busy
+
+CHECKIN_POINTS = 10  # Points per attraction check-in
+MIN_PASSWORD_LENGTH = 6
+REFERENCE_TYPES = ("atracao", "show", "lanchonete")  # What ratings and itinerary items point to
+
+# Catalog name -> query listing it as the app's list screens show it
+CATALOGS = {
+    "atracoes": "SELECT id, nome, descricao_curta, local_image_path, tipo_atracao, status FROM atracoes ORDER BY nome",
+    "shows": "SELECT id, nome, tipo_show, url_imagem_divulgacao, horarios FROM shows WHERE ativo = 1 ORDER BY nome",
+    "lanchonetes": "SELECT id, nome, descricao, tipo_culinaria, url_imagem_logo, horario_funcionamento "
+                   "FROM lanchonetes WHERE ativo = 1 ORDER BY nome",
+    "ingressos": "SELECT id, nome, descricao, preco_base, idade_minima, idade_maxima "
+                 "FROM tipos_ingressos WHERE ativo = 1 ORDER BY preco_base",
+}
+
+
+# Catalog name -> (table of its items, tipo_referencia of their ratings), for details()
+DETAILS = {
+    "atracoes": ("atracoes", "atracao"),
+    "shows": ("shows", "show"),
+    "lanchonetes": ("lanchonetes", "lanchonete"),
+}
+
+
+class ServiceError(Exception):
+    """An operation refused for a reason the user can act on; str() is the message to show."""
+
+
+def hash_password(password):
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+def _ensure_admin(conn):
+    cursor = conn.execute("SELECT COUNT(*) FROM usuarios_sistema WHERE username = 'admin'")
+    if cursor.fetchone()[0] == 0:
+        conn.execute(
+            "INSERT INTO usuarios_sistema (username, senha_hash, email_recuperacao, tipo_perfil, ativo) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ("admin", hash_password("admin123"), "admin@infinitypark.com", "Administrador", 1)
+        )
+        conn.commit()
+
+
+def catalog(conn, kind):
+    """Rows of one of CATALOGS as dicts."""
+    if kind not in CATALOGS:
+        raise ServiceError(f"Catálogo desconhecido: {kind}")
+    return [dict(row) for row in conn.execute(CATALOGS[kind])]
+
+
+def details(conn, kind, item_id):
+    """One item of a catalog with its ratings: {"item", "avaliacao": {"media", "total_avaliacoes"}}.
+
+    Food courts also get their available menu as "cardapio", a list of
+    {"categoria", "itens"} in category order.
+    """
+    if kind not in DETAILS:
+        raise ServiceError(f"Catálogo desconhecido: {kind}")
+    table, reference_type = DETAILS[kind]
+    item = conn.execute(f"SELECT * FROM {table} WHERE id = ?", (item_id,)).fetchone()
+    if not item:
+        raise ServiceError("Item não encontrado.")
+    rating = conn.execute(
+        "SELECT AVG(nota) AS media, COUNT(id) AS total_avaliacoes "
+        "FROM avaliacoes WHERE id_referencia = ? AND tipo_referencia = ?",
+        (item_id, reference_type)
+    ).fetchone()
+    result = {"item": dict(item), "avaliacao": dict(rating)}
+    if kind == "lanchonetes":
+        menu = []
+        for row in conn.execute(
+            "SELECT id, categoria, nome_item, descricao_item, preco, url_imagem_item FROM cardapio_itens "
+            "WHERE id_lanchonete = ? AND disponivel = 1 ORDER BY categoria, nome_item",
+            (item_id,)
+        ):
+            if not menu or menu[-1]["categoria"] != row["categoria"]:
+                menu.append({"categoria": row["categoria"], "itens": []})
+            menu[-1]["itens"].append(dict(row))
+        result["cardapio"] = menu
+    return result
+
+
+def park_info(conn):
+    """The sections of the "Sobre o Parque" screen: dicts with chave, titulo and conteudo."""
+    return [dict(row) for row in conn.execute("SELECT chave, titulo, conteudo FROM informacoes_parque ORDER BY id")]
+
+
+def active_warnings(conn):
+    """Active, unexpired park warnings, newest first."""
+    return [dict(row) for row in conn.execute("""
+        SELECT id, titulo, mensagem, tipo_aviso, data_publicacao, data_expiracao
+        FROM avisos_parque
+        WHERE ativo = 1 AND (data_expiracao IS NULL OR date(data_expiracao) >= date('now'))
+        ORDER BY data_publicacao DESC
+    """)]
+
+
+def ticket_price(pricing_engine, ticket_type_id, day):
+    """pricing_engine.price(), with an unknown ticket type reported as a ServiceError."""
+    try:
+        return pricing_engine.price(ticket_type_id, day)
+    except KeyError:
+        raise ServiceError(f"Tipo de ingresso não encontrado: {ticket_type_id}")
+
+
+def quote(conn, pricing_engine, ticket_type_id, day):
+    """Current price of a ticket type for day and the tickets still available that day."""
+    return {"preco": ticket_price(pricing_engine, ticket_type_id, day), "disponiveis": available(conn.cursor(), day)}
+
+
+def login_user(conn, username, password):
+    """Check the credentials and rebuild the user's profile summary.
+
+    Creates the default admin user if it is missing. Returns a dict with the
+    user's id, username and tipo_perfil.
+    """
+    if not username or not password:
+        raise ServiceError("Preencha usuario e senha.")
+    _ensure_admin(conn)
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, senha_hash, tipo_perfil FROM usuarios_sistema WHERE username = ?", (username,))
+    user = cursor.fetchone()
+    if not user:
+        raise ServiceError("Usuario nao encontrado ou inativo.")
+    if hash_password(password) != user["senha_hash"]:
+        raise ServiceError("Senha incorreta.")
+    try:
+        rebuild_profile_summary(cursor, user["id"])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return {"id": user["id"], "username": username, "tipo_perfil": user["tipo_perfil"]}
+
+
+def register_user(conn, username, email, password, confirm_password=None):
+    """Create a "Comum" user; returns its id."""
+    if confirm_password is None:
+        confirm_password = password
+    if not all([username, email, password, confirm_password]):
+        raise ServiceError("Todos os campos sao obrigatorios.")
+    if password != confirm_password:
+        raise ServiceError("As senhas nao coincidem.")
+    if len(password) < MIN_PASSWORD_LENGTH:
+        raise ServiceError(f"A senha deve ter pelo menos {MIN_PASSWORD_LENGTH} caracteres.")
+    try:
+        cursor = conn.execute(
+            "INSERT INTO usuarios_sistema (username, senha_hash, email_recuperacao, tipo_perfil) VALUES (?, ?, ?, ?)",
+            (username, hash_password(password), email, "Comum")
+        )
+        conn.commit()
+    except sqlite3.IntegrityError as e:
+        conn.rollback()
+        if "username" in str(e).lower():
+            raise ServiceError("Nome de usuario ja existe.")
+        if "email_recuperacao" in str(e).lower():
+            raise ServiceError("Email ja cadastrado.")
+        raise ServiceError(f"Erro de integridade: {e}")
+    except Exception:
+        conn.rollback()
+        raise
+    return cursor.lastrowid
+
+
+def process_purchase(conn, user_id, ticket_type_id, unit_price, day, quantity, payment_method):
+    """Record a "Pendente" purchase of quantity tickets for day; returns its id.
+
+    Settling the payment is left to the caller (see payments.PaymentWorker).
+    Raises inventory.SoldOutError when day has not enough tickets left.
+    """
+    if quantity < 1:
+        raise ServiceError("Selecione pelo menos um ingresso.")
+    try:
+        purchase_id = create_purchase(
+            conn.cursor(), user_id, ticket_type_id, unit_price, day, quantity, payment_method
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return purchase_id
+
+
+def do_checkin(conn, badge_engine, user_id, attraction_id, today=None, points=CHECKIN_POINTS):
+    """Check the user in at an attraction; returns the BadgeRules it earned.
+
+    A user checks in at most once per attraction per day.
+    """
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT id FROM checkins_atracao WHERE id_usuario_sistema = ? AND id_atracao = ? AND date(data_checkin, 'localtime') = ?",
+            (user_id, attraction_id, today)
+        )
+        if cursor.fetchone():
+            raise ServiceError("Você já fez check-in nesta atração hoje!")
+
+        # Update achievement state before inserting, in the same transaction
+        new_badges = badge_engine.record_checkin(cursor, user_id, attraction_id, today)
+        cursor.execute(
+            "INSERT INTO checkins_atracao (id_usuario_sistema, id_atracao, pontos_ganhos) VALUES (?, ?, ?)",
+            (user_id, attraction_id, points)
+        )
+        record_checkin(cursor, user_id, points, new_badges)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return new_badges
+
+
+def submit_rating(conn, user_id, reference_id, reference_type, rating, comment=""):
+    """Rate an attraction, show or food court from 1 to 5, replacing the user's earlier rating.
+
+    Returns True when an earlier rating was updated.
+    """
+    if not 1 <= rating <= 5:
+        raise ServiceError("Por favor, selecione uma avaliação de 1 a 5 estrelas.")
+    if reference_type not in REFERENCE_TYPES:
+        raise ServiceError(f"Tipo de avaliação inválido: {reference_type}")
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT id FROM avaliacoes WHERE id_usuario_sistema = ? AND id_referencia = ? AND tipo_referencia = ?",
+            (user_id, reference_id, reference_type)
+        )
+        existing_rating = cursor.fetchone()
+        if existing_rating:
+            cursor.execute(
+                "UPDATE avaliacoes SET nota = ?, comentario = ?, data_avaliacao = CURRENT_TIMESTAMP "
+                "WHERE id = ?",
+                (rating, comment, existing_rating["id"])
+            )
+        else:
+            cursor.execute(
+                "INSERT INTO avaliacoes (id_usuario_sistema, id_referencia, tipo_referencia, nota, comentario) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (user_id, reference_id, reference_type, rating, comment)
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return existing_rating is not None
+
+
+def save_itinerary(conn, user_id, name, visit_date, items):
+    """Save an itinerary for visit_date (YYYY-MM-DD); returns its id.
+
+    items is a list of (tipo_item, id_referencia, horario_previsto) in visit order.
+    """
+    if not name:
+        raise ServiceError("Digite um nome para o itinerário.")
+    if not items:
+        raise ServiceError("Adicione pelo menos uma atração ao itinerário.")
+    for item_type, _, _ in items:
+        if item_type not in REFERENCE_TYPES:
+            raise ServiceError(f"Tipo de item inválido: {item_type}")
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "INSERT INTO itinerarios (id_usuario_sistema, nome, data_visita) VALUES (?, ?, ?)",
+            (user_id, name, visit_date)
+        )
+        itinerary_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO itens_itinerario (id_itinerario, tipo_item, id_referencia, horario_previsto, ordem) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(itinerary_id, item_type, reference_id, planned_time, order)
+             for order, (item_type, reference_id, planned_time) in enumerate(items, 1)]
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return itinerary_id
+
+
+def change_password(conn, user_id, current_password, new_password):
+    """Replace the user's password after checking the current one."""
+    if not current_password:
+        raise ServiceError("Digite sua senha atual.")
+    if not new_password:
+        raise ServiceError("Digite a nova senha.")
+    if len(new_password) < MIN_PASSWORD_LENGTH:
+        raise ServiceError(f"A senha deve ter pelo menos {MIN_PASSWORD_LENGTH} caracteres.")
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT senha_hash FROM usuarios_sistema WHERE id = ?", (user_id,))
+        user = cursor.fetchone()
+        if not user:
+            raise ServiceError("Erro ao verificar usuário.")
+        if hash_password(current_password) != user["senha_hash"]:
+            raise ServiceError("Senha atual incorreta.")
+        cursor.execute("UPDATE usuarios_sistema SET senha_hash = ? WHERE id = ?", (hash_password(new_password), user_id))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def delete_itinerary(conn, user_id, itinerary_id):
+    """Delete one of the user's itineraries with its items."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT 1 FROM itinerarios WHERE id = ? AND id_usuario_sistema = ?", (itinerary_id, user_id)
+        )
+        if not cursor.fetchone():
+            raise ServiceError("Itinerário não encontrado.")
+        cursor.execute("DELETE FROM itens_itinerario WHERE id_itinerario = ?", (itinerary_id,))
+        cursor.execute("DELETE FROM itinerarios WHERE id = ?", (itinerary_id,))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def load_profile(conn, user_id):
+    """The user's profile summary by section (see infinity_park.profile), or None if never built."""
+    return load_profile_summary(conn.cursor(), user_id)
+
+
+def rebuild_profile(conn, user_id):
+    """Rebuild the user's profile summary from the base tables; returns it."""
+    try:
+        summary = rebuild_profile_summary(conn.cursor(), user_id)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if summary is None:
+        raise ServiceError("Usuário não encontrado.")
+    return summary
+
+
+def purchase_page(conn, user_id, after=None):
+    """One page of the user's purchases, newest first: {"compras": [...], "proxima": key or None}.
+
+    Pass "proxima" back as after to get the following page.
+    """
+    purchases, next_after = fetch_purchase_page(conn.cursor(), user_id, after)
+    return {"compras": [dict(row) for row in purchases], "proxima": list(next_after) if next_after else None}
+
+
+def _check_owner(conn, user_id, purchase_id):
+    row = conn.execute(
+        "SELECT 1 FROM compras_ingressos WHERE id = ? AND id_usuario_sistema = ?", (purchase_id, user_id)
+    ).fetchone()
+    if not row:
+        raise ServiceError("Compra não encontrada.")
+
+
+def purchase_details(conn, user_id, purchase_id):
+    """One of the user's purchases and its tickets grouped by type: {"compra", "grupos"}."""
+    _check_owner(conn, user_id, purchase_id)
+    purchase, groups = get_purchase_details(conn.cursor(), purchase_id)
+    return {"compra": dict(purchase), "grupos": [dict(group) for group in groups]}
+
+
+def ticket_page(conn, user_id, purchase_id, after=0):
+    """One page of a purchase's tickets: {"ingressos": [...], "proxima": id to continue after or None}."""
+    _check_owner(conn, user_id, purchase_id)
+    tickets, next_after = fetch_ticket_page(conn.cursor(), purchase_id, after)
+    return {"ingressos": [dict(row) for row in tickets], "proxima": next_after}
+
+
+def list_itineraries(conn, user_id):
+    """The user's itineraries, latest visit first, each with its "itens" in visit order."""
+    itineraries = [dict(row) for row in conn.execute(
+        "SELECT id, nome, data_criacao, data_visita FROM itinerarios WHERE id_usuario_sistema = ? "
+        "ORDER BY data_visita DESC",
+        (user_id,)
+    )]
+    for itinerary in itineraries:
+        itinerary["itens"] = [dict(row) for row in conn.execute("""
+            SELECT ii.horario_previsto, ii.ordem,
+                   CASE
+                       WHEN ii.tipo_item = 'atracao' THEN a.nome
+                       WHEN ii.tipo_item = 'show' THEN s.nome
+                       WHEN ii.tipo_item = 'lanchonete' THEN l.nome
+                       ELSE 'Item desconhecido'
+                   END AS nome_item
+            FROM itens_itinerario ii
+            LEFT JOIN atracoes a ON ii.tipo_item = 'atracao' AND ii.id_referencia = a.id
+            LEFT JOIN shows s ON ii.tipo_item = 'show' AND ii.id_referencia = s.id
+            LEFT JOIN lanchonetes l ON ii.tipo_item = 'lanchonete' AND ii.id_referencia = l.id
+            WHERE ii.id_itinerario = ?
+            ORDER BY ii.ordem
+        """, (itinerary["id"],))]
+    return itineraries
+
+
+class LocalBackend(object):
+    """The operations the app's screens need, run on the local database.
+
+    Reads open their own read-only connection. Writes go through writer (a
+    writer.WriteQueue) when given, so concurrent ones share commits, and
+    otherwise also open their own connection. Purchases are priced with
+    pricing_engine and, with a payment_worker, charged by pay(). The API
+    client (infinity_park.api.ApiClient) has the same methods, so the app
+    uses either one as app.backend.
+    """
+
+    def __init__(self, database=None, badge_engine=None, pricing_engine=None, payment_worker=None, writer=None):
+        self.database = database
+        self.badge_engine = badge_engine or BadgeEngine()
+        self.pricing_engine = pricing_engine or PricingEngine(database)
+        self.payment_worker = payment_worker
+        self.writer = writer
+
+    def _call(self, operation, *args):
+        conn = get_db_connection(self.database)
+        try:
+            return operation(conn, *args)
+        finally:
+            conn.close()
+
+    def _read(self, operation, *args):
+        conn = get_read_connection(self.database, snapshot=True)
+        try:
+            return operation(conn, *args)
+        finally:
+            conn.close()
+
+    def _write(self, operation, *args):
+        if self.writer is not None:
+            return self.writer.call(operation, *args)
+        return retry_busy(self._call, operation, *args)
+
+    def catalog(self, kind):
+        return self._read(catalog, kind)
+
+    def details(self, kind, item_id):
+        return self._read(details, kind, item_id)
+
+    def park_info(self):
+        return self._read(park_info)
+
+    def warnings(self):
+        return self._read(active_warnings)
+
+    def quote(self, ticket_type_id, day):
+        return self._read(quote, self.pricing_engine, ticket_type_id, day)
+
+    def login_user(self, username, password):
+        return self._write(login_user, username, password)
+
+    def logout(self):
+        pass  # Local logins keep no session
+
+    def register_user(self, username, email, password, confirm_password=None):
+        return self._write(register_user, username, email, password, confirm_password)
+
+    def process_purchase(self, user_id, ticket_type_id, day, quantity, payment_method):
+        """Record the purchase at the current price; returns {"id", "valor_total"}."""
+        unit_price = ticket_price(self.pricing_engine, ticket_type_id, day)
+        purchase_id = self._write(process_purchase, user_id, ticket_type_id, unit_price, day, quantity, payment_method)
+        try:
+            self.pricing_engine.sold(day, quantity)
+        except Exception as e:
+            # The purchase is committed; a stale price only lasts until the cache's TTL
+            print(f"Erro ao atualizar os preços de {day}: {e}", file=sys.stderr)
+        return {"id": purchase_id, "valor_total": unit_price * quantity, "metodo_pagamento": payment_method}
+
+    def pay(self, purchase):
+        """Charge a purchase returned by process_purchase; returns a Future of its final status."""
+        return self.payment_worker.submit(purchase["id"], purchase["valor_total"], purchase["metodo_pagamento"])
+
+    def do_checkin(self, user_id, attraction_id):
+        return self._write(do_checkin, self.badge_engine, user_id, attraction_id)
+
+    def submit_rating(self, user_id, reference_id, reference_type, rating, comment=""):
+        return self._write(submit_rating, user_id, reference_id, reference_type, rating, comment)
+
+    def save_itinerary(self, user_id, name, visit_date, items):
+        return self._write(save_itinerary, user_id, name, visit_date, items)
+
+    def itineraries(self, user_id):
+        return self._read(list_itineraries, user_id)
+
+    def delete_itinerary(self, user_id, itinerary_id):
+        return self._write(delete_itinerary, user_id, itinerary_id)
+
+    def change_password(self, user_id, current_password, new_password):
+        return self._write(change_password, user_id, current_password, new_password)
+
+    def profile(self, user_id):
+        """The user's profile summary, rebuilt first if it is missing."""
+        return self._read(load_profile, user_id) or self.rebuild_profile(user_id)
+
+    def rebuild_profile(self, user_id):
+        return self._write(rebuild_profile, user_id)
+
+    def purchase_page(self, user_id, after=None):
+        return self._read(purchase_page, user_id, after)
+
+    def purchase_details(self, user_id, purchase_id):
+        return self._read(purchase_details, user_id, purchase_id)
+
+    def ticket_page(self, user_id, purchase_id, after=0):
+        return self._read(ticket_page, user_id, purchase_id, after)
@@ -0,0 +1,12 @@
+"""Small statistics helpers shared by the profilers, the payment worker and the benchmarks.
+
+Imports nothing from infinity_park, so any module can import it at load time.
+"""
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of values for fraction in [0, 1]; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
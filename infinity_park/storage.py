@@ -0,0 +1,172 @@
+"""SQLite storage profile: WAL journal, connection pragmas, busy handling and checkpoints.
+
+With SQLite's default rollback journal a writer blocks every reader. A
+connection that finds the database locked waits out the driver's timeout and
+then fails with "database is locked", so kiosks sharing one file fail once
+they overlap for long enough. This profile changes that in four ways:
+
+- init_db() switches the file to WAL (write-ahead log). Readers then keep
+  reading the last committed state while one writer appends to the log.
+- configure() sets each new connection's pragmas from config. It sets the
+  busy timeout, synchronous=NORMAL (safe with WAL, one sync per checkpoint
+  instead of per commit), the page cache, memory-mapped reads and a size
+  limit for the WAL file once it has been checkpointed.
+- retry_busy() retries a write that still finds the database locked after
+  the busy timeout. It waits a random (jittered) delay that grows with each
+  attempt, so the processes waiting on the lock do not all retry together.
+- Checkpointer copies the WAL back into the database file in the background,
+  so the log stays bounded without making a user's commit pay for it.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+
+from infinity_park.config import (
+    SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE_KB, SQLITE_MMAP_SIZE, WAL_CHECKPOINT_INTERVAL, WAL_MAX_BYTES,
+)
+
+
+def configure(conn):
+    """Apply the profile's per-connection pragmas to conn; returns conn."""
+    conn.execute(f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_MS)}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{int(SQLITE_CACHE_SIZE_KB)}")
+    conn.execute(f"PRAGMA mmap_size = {int(SQLITE_MMAP_SIZE)}")
+    conn.execute(f"PRAGMA journal_size_limit = {int(WAL_MAX_BYTES)}")
+    return conn
+
+
+def enable_wal(conn):
+    """Switch conn's database file to WAL (persistent); returns the resulting journal mode."""
+    return conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+
+
+def is_busy(error):
+    return isinstance(error, sqlite3.OperationalError) and (
+        "locked" in str(error) or "busy" in str(error)
+    )
+
+
+def retry_busy(operation, *args, attempts=5, delay=0.05, **kwargs):
+    """Call operation(*args, **kwargs), retrying while it fails because the database is locked.
+
+    Before attempt n + 1 it sleeps a random time up to delay * 2 ** (n - 1).
+    operation must leave nothing behind when it fails (the services
+    functions roll back), so running it again is safe.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return operation(*args, **kwargs)
+        except sqlite3.OperationalError as e:
+            if not is_busy(e) or attempt == attempts:
+                raise
+            time.sleep(random.uniform(0, delay * 2 ** (attempt - 1)))
+
+
+def wal_size(conn):
+    """Size in bytes of the WAL file of conn's database (0 if there is none)."""
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    try:
+        return os.path.getsize(path + "-wal")
+    except OSError:
+        return 0
+
+
+def checkpoint(conn, mode="PASSIVE"):
+    """Run a WAL checkpoint; returns (busy, log pages, pages checkpointed)."""
+    return tuple(conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone())
+
+
+class Checkpointer(object):
+    """Checkpoints the WAL on a background thread every interval seconds.
+
+    A PASSIVE checkpoint copies what it can without waiting for anyone. But
+    while readers keep using the WAL it can never start over, and it grows
+    with every commit. Once the file is past max_bytes, a TRUNCATE checkpoint
+    waits for those readers (up to the busy timeout) and resets it to zero
+    bytes. The writers' automatic checkpoints often hold the checkpoint lock,
+    and SQLite reports that as busy without waiting. So the TRUNCATE is
+    retried up to attempts times, after a random pause of up to retry_delay.
+    """
+
+    def __init__(self, database=None, interval=WAL_CHECKPOINT_INTERVAL, max_bytes=WAL_MAX_BYTES,
+                 attempts=50, retry_delay=0.01):
+        self.database = database
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self.attempts = attempts
+        self.retry_delay = retry_delay
+        self.checkpoints = 0
+        self.truncations = 0
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="wal-checkpointer", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        if self._thread is not None:
+            self._stopping = True
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+
+    def run_once(self, conn):
+        """Checkpoint once on conn; returns checkpoint()'s result."""
+        self.checkpoints += 1
+        if wal_size(conn) <= self.max_bytes:
+            return checkpoint(conn, "PASSIVE")
+        for attempt in range(self.attempts):
+            result = checkpoint(conn, "TRUNCATE")
+            if not result[0]:
+                self.truncations += 1
+                break
+            time.sleep(random.uniform(0, self.retry_delay))
+        return result
+
+    def _run(self):
+        from infinity_park.db import get_db_connection  # db imports this module
+        conn = get_db_connection(self.database)
+        try:
+            while not self._stopping:
+                try:
+                    self.run_once(conn)
+                except sqlite3.Error as e:
+                    print(f"Erro no checkpoint do WAL: {e}", file=sys.stderr)
+                self._wakeup.wait(self.interval)
+                self._wakeup.clear()
+        finally:
+            conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mostra o modo de journal do banco e faz um checkpoint do WAL.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--modo", default="TRUNCATE", choices=("PASSIVE", "FULL", "RESTART", "TRUNCATE"))
+    args = parser.parse_args(argv)
+
+    from infinity_park.db import get_db_connection
+    conn = get_db_connection(args.db)
+    try:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        before = wal_size(conn)
+        busy, log_pages, done = checkpoint(conn, args.modo)
+        after = wal_size(conn)
+    finally:
+        conn.close()
+    print(f"journal_mode={journal_mode}  WAL {before} -> {after} bytes  "
+          f"páginas no log {log_pages}, copiadas {done}{' (ocupado)' if busy else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""Deterministic synthetic park data for load tests, written in bulk.
+
+Generates visitors and, for most of them, an account with its purchases,
+tickets, check-ins, ratings and itineraries, with park-like distributions:
+
+- visit days weighted by season (school holidays) and weekday (weekends)
+- purchases made a few days ahead, for groups of one to six
+- a mix of ticket types, payment methods and payment outcomes
+- tickets used or expired once their day has passed
+
+The same --semente and arguments produce the same rows on a fresh database,
+including dates, ticket codes and transaction codes; nothing depends on the
+clock. Rows are written with executemany() in one transaction per --lote
+visitors, on a connection with synchronous=OFF (a crash can lose the load,
+which only matters for a throwaway database). About ten rows are written per
+visitor, so --visitantes 1000000 gives a database of roughly 10M rows.
+
+Afterwards the sales cube (vendas_agregadas) and the daily inventory are
+recomputed from the new rows, and ANALYZE refreshes the planner statistics.
+Badge state and profile summaries are left to be rebuilt on first use, as
+for users that predate those tables.
+
+    python -m infinity_park.synthetic --db carga.db --visitantes 1000000 --semente 215
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+
+from infinity_park.config import DAILY_TICKET_CAPACITY
+from infinity_park.db import get_db_connection, init_db
+from infinity_park.expiration import STATUS_EXPIRED
+from infinity_park.gate import STATUS_UNUSED, STATUS_USED
+from infinity_park.payments import APPROVED, DECLINED, PENDING, TICKET_CANCELLED
+from infinity_park.sales import rebuild_summary
+from infinity_park.services import CHECKIN_POINTS, hash_password
+from infinity_park.ticket_codes import BITS, encode
+
+FIRST_NAMES = (
+    "Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Heitor", "Isabela", "João",
+    "Larissa", "Lucas", "Mariana", "Miguel", "Natália", "Pedro", "Rafaela", "Samuel", "Sofia", "Thiago",
+    "Valentina", "Vitor", "Yasmin", "Arthur", "Beatriz", "Caio", "Helena", "Enzo", "Laura", "Gustavo",
+)
+LAST_NAMES = (
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima", "Gomes",
+    "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa",
+)
+MEDICAL_RESTRICTIONS = ("Asma", "Cardiopatia", "Gestante", "Labirintite", "Marca-passo")
+
+# (value, weight) tables
+ACCOUNT_SHARE = 0.85  # Visitors with an app account; the rest only exist at the ticket office
+PURCHASES_PER_ACCOUNT = ((0, 10), (1, 55), (2, 20), (3, 9), (4, 4), (5, 2))
+GROUP_SIZES = ((1, 25), (2, 35), (3, 15), (4, 17), (5, 6), (6, 2))
+TICKET_TYPE_WEIGHTS = {"Adulto": 60, "Crianca": 25, "Idoso": 8, "PCD": 2, "VIP Pass": 5}  # Others weigh 5
+PAYMENT_METHODS = (("PIX", 45), ("Cartão de Crédito", 35), ("Cartão de Débito", 15), ("Boleto", 5))
+PAYMENT_OUTCOMES = ((APPROVED, 93), (DECLINED, 5), (PENDING, 2))  # Pending only for days still ahead
+USED_SHARE = 0.88  # Approved tickets of past days that went through a gate; the rest expired
+CHECKINS_PER_VISIT = ((0, 15), (1, 15), (2, 20), (3, 20), (4, 15), (5, 10), (6, 5))
+RATINGS = ((5, 40), (4, 30), (3, 15), (2, 8), (1, 7))
+RATING_SHARE = 0.25  # Check-ins followed by a rating of the attraction
+OTHER_RATING_SHARE = 0.10  # Visits with a rating of a show or a food court
+ITINERARY_SHARE = 0.20  # Purchases whose buyer plans the day in the app
+COMMENTS = ("Incrível!", "Muito bom", "Fila longa", "Vale a pena", "Poderia ser melhor", "")
+# Visit day demand by month (January = 1) and by weekday (Monday = 0)
+MONTH_WEIGHTS = (1.5, 1.1, 0.8, 0.9, 0.8, 0.9, 1.5, 0.8, 0.8, 1.0, 0.9, 1.4)
+WEEKDAY_WEIGHTS = (0.6, 0.6, 0.7, 0.8, 1.0, 1.6, 1.4)
+# Odd multiplier: counter * MULTIPLIER mod 2 ** BITS is a bijection, so ticket codes never repeat
+CODE_MULTIPLIER = 0x5DEECE66D2F1B7A5 % (1 << BITS) | 1
+
+
+def _table(pairs):
+    """(values, cumulative weights) of a (value, weight) table, for Random.choices()."""
+    return [value for value, _ in pairs], list(accumulate(weight for _, weight in pairs))
+
+
+def cpf(number):
+    """Valid CPF (with check digits) for a 9-digit number."""
+    digits = [int(d) for d in f"{number % 10 ** 9:09d}"]
+    for length in (9, 10):
+        total = sum(d * w for d, w in zip(digits, range(length + 1, 1, -1)))
+        digits.append(total * 10 % 11 % 10)
+    text = "".join(map(str, digits))
+    return f"{text[:3]}.{text[3:6]}.{text[6:9]}-{text[9:]}"
+
+
+class SyntheticPark(object):
+    """Generates batches of synthetic rows for the database behind conn.
+
+    Row ids continue after the largest existing ones, and ticket types,
+    attractions, shows and food courts are the ones already in the database.
+    """
+
+    def __init__(self, conn, seed=215, start="2025-01-01", days=365, today="2025-11-01"):
+        self.rng = random.Random(seed)
+        self.today = date.fromisoformat(today)
+        self.password_hash = hash_password("senha123")
+        self.code_offset = self.rng.getrandbits(BITS)
+
+        self.next_ids = {}
+        for table in ("visitantes", "usuarios_sistema", "compras_ingressos", "itens_compra_ingressos",
+                      "checkins_atracao", "avaliacoes", "itinerarios", "itens_itinerario"):
+            self.next_ids[table] = (conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0] or 0) + 1
+        self.ticket_counter = self.next_ids["itens_compra_ingressos"]
+
+        ticket_types = conn.execute("SELECT id, nome, preco_base FROM tipos_ingressos WHERE ativo = 1").fetchall()
+        self.ticket_types = _table(
+            [((row["id"], row["preco_base"]), TICKET_TYPE_WEIGHTS.get(row["nome"], 5)) for row in ticket_types]
+        )
+        self.attractions = [row[0] for row in conn.execute("SELECT id FROM atracoes ORDER BY id")]
+        self.shows = [row[0] for row in conn.execute("SELECT id FROM shows ORDER BY id")]
+        self.food_courts = [row[0] for row in conn.execute("SELECT id FROM lanchonetes ORDER BY id")]
+        self.other_references = ([("show", show_id) for show_id in self.shows]
+                                 + [("lanchonete", food_court_id) for food_court_id in self.food_courts])
+        if not self.ticket_types[0] or not self.attractions:
+            raise ValueError("O banco precisa ter tipos de ingresso e atrações (rode init_db).")
+
+        first_day = date.fromisoformat(start)
+        days = [first_day + timedelta(days=offset) for offset in range(days)]
+        self.days = _table([(day, MONTH_WEIGHTS[day.month - 1] * WEEKDAY_WEIGHTS[day.weekday()]) for day in days])
+        self.purchases_per_account = _table(PURCHASES_PER_ACCOUNT)
+        self.group_sizes = _table(GROUP_SIZES)
+        self.payment_methods = _table(PAYMENT_METHODS)
+        self.payment_outcomes = _table(PAYMENT_OUTCOMES)
+        self.checkins_per_visit = _table(CHECKINS_PER_VISIT)
+        self.ratings = _table(RATINGS)
+
+    def _new_id(self, table):
+        new_id = self.next_ids[table]
+        self.next_ids[table] = new_id + 1
+        return new_id
+
+    def _pick(self, table):
+        values, cum_weights = table
+        return self.rng.choices(values, cum_weights=cum_weights)[0]
+
+    def _timestamp(self, day, first_hour=0, last_hour=23):
+        seconds = self.rng.randrange(first_hour * 3600, (last_hour + 1) * 3600)
+        return (datetime.combine(day, datetime.min.time()) + timedelta(seconds=seconds)).strftime("%Y-%m-%d %H:%M:%S")
+
+    def _ticket_code(self):
+        self.ticket_counter += 1
+        return encode((self.ticket_counter * CODE_MULTIPLIER + self.code_offset) % (1 << BITS))
+
+    def batch(self, visitors):
+        """Rows for visitors new visitors: {table: [row tuple]}, in insertion order."""
+        rng = self.rng
+        rows = {table: [] for table in INSERTS}
+        for _ in range(visitors):
+            visitor_id = self._new_id("visitantes")
+            age = rng.choice((rng.randint(18, 59), rng.randint(18, 59), rng.randint(3, 12), rng.randint(60, 85)))
+            birth = self.today - timedelta(days=age * 365 + rng.randrange(365))
+            height = min(200, 95 + age * 6) if age < 13 else rng.randint(150, 195)
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+            email = f"visitante{visitor_id}@carga.infinitypark.com"
+            registered = self._timestamp(self.today - timedelta(days=rng.randrange(730)))
+            rows["visitantes"].append((
+                visitor_id, cpf(visitor_id), name, birth.isoformat(), height, email,
+                f"(11) 9{rng.randrange(10 ** 8):08d}",
+                rng.choice(MEDICAL_RESTRICTIONS) if rng.random() < 0.03 else None, registered,
+            ))
+            if rng.random() >= ACCOUNT_SHARE:
+                continue
+            user_id = self._new_id("usuarios_sistema")
+            rows["usuarios_sistema"].append(
+                (user_id, visitor_id, f"visitante{visitor_id}", self.password_hash, "Comum", email, registered)
+            )
+            visited = set()  # (attraction, day): one check-in per attraction per day
+            rated = set()  # (reference type, reference id): one rating each
+            for _ in range(self._pick(self.purchases_per_account)):
+                self._purchase(rows, user_id, visitor_id, visited, rated)
+        return rows
+
+    def _purchase(self, rows, user_id, visitor_id, visited, rated):
+        rng = self.rng
+        day = self._pick(self.days)
+        purchased_on = max(day - timedelta(days=min(int(rng.expovariate(1 / 7)), 60)), day - timedelta(days=60))
+        past = day < self.today
+        outcome = self._pick(self.payment_outcomes)
+        if outcome == PENDING and past:
+            outcome = APPROVED
+        tickets = [self._pick(self.ticket_types) for _ in range(self._pick(self.group_sizes))]
+
+        purchase_id = self._new_id("compras_ingressos")
+        rows["compras_ingressos"].append((
+            purchase_id, user_id, visitor_id, self._timestamp(min(purchased_on, self.today), 7),
+            sum(price for _, price in tickets), self._pick(self.payment_methods), outcome,
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)), len(tickets),
+        ))
+        for ticket_type_id, price in tickets:
+            if outcome == DECLINED:
+                status = TICKET_CANCELLED
+            elif past and outcome == APPROVED:
+                status = STATUS_USED if rng.random() < USED_SHARE else STATUS_EXPIRED
+            else:
+                status = STATUS_UNUSED
+            rows["itens_compra_ingressos"].append((
+                self._new_id("itens_compra_ingressos"), purchase_id, ticket_type_id, price,
+                day.isoformat(), self._ticket_code(), status,
+            ))
+
+        if past and outcome == APPROVED:
+            checkins = min(self._pick(self.checkins_per_visit), len(self.attractions))
+            for attraction_id in rng.sample(self.attractions, checkins):
+                if (attraction_id, day) in visited:
+                    continue
+                visited.add((attraction_id, day))
+                checked_in = self._timestamp(day, 9, 20)
+                rows["checkins_atracao"].append(
+                    (self._new_id("checkins_atracao"), user_id, attraction_id, checked_in, CHECKIN_POINTS)
+                )
+                if rng.random() < RATING_SHARE and ("atracao", attraction_id) not in rated:
+                    rated.add(("atracao", attraction_id))
+                    self._rating(rows, user_id, "atracao", attraction_id, day)
+            if self.other_references and rng.random() < OTHER_RATING_SHARE:
+                reference = rng.choice(self.other_references)
+                if reference not in rated:
+                    rated.add(reference)
+                    self._rating(rows, user_id, reference[0], reference[1], day)
+
+        if rng.random() < ITINERARY_SHARE:
+            itinerary_id = self._new_id("itinerarios")
+            rows["itinerarios"].append((
+                itinerary_id, user_id, f"Roteiro {day:%d/%m}", self._timestamp(min(purchased_on, self.today), 7),
+                day.isoformat(),
+            ))
+            minutes = 9 * 60 + rng.randrange(0, 90, 15)
+            for order in range(1, rng.randint(3, 6) + 1):
+                kind = "atracao" if rng.random() < 0.7 or not self.shows else rng.choice(("show", "lanchonete"))
+                choices = {"atracao": self.attractions, "show": self.shows, "lanchonete": self.food_courts}[kind]
+                if not choices:
+                    kind, choices = "atracao", self.attractions
+                rows["itens_itinerario"].append((
+                    self._new_id("itens_itinerario"), itinerary_id, kind, rng.choice(choices),
+                    f"{minutes // 60:02d}:{minutes % 60:02d}", order,
+                ))
+                minutes = min(minutes + rng.randrange(45, 105, 15), 21 * 60)
+
+    def _rating(self, rows, user_id, reference_type, reference_id, day):
+        rows["avaliacoes"].append((
+            self._new_id("avaliacoes"), user_id, reference_id, reference_type, self._pick(self.ratings),
+            self.rng.choice(COMMENTS), self._timestamp(day, 12),
+        ))
+
+
+# Table -> INSERT for the rows SyntheticPark.batch() builds, in foreign key order
+INSERTS = {
+    "visitantes": "INSERT INTO visitantes (id, cpf, nome_completo, data_nascimento, altura_cm, email, telefone, "
+                  "restricoes_medicas, data_cadastro) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "usuarios_sistema": "INSERT INTO usuarios_sistema (id, id_visitante, username, senha_hash, tipo_perfil, "
+                        "email_recuperacao, data_criacao) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "compras_ingressos": "INSERT INTO compras_ingressos (id, id_usuario_sistema, id_visitante_responsavel, "
+                         "data_compra, valor_total_compra, metodo_pagamento, status_pagamento, codigo_transacao, "
+                         "total_ingressos) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "itens_compra_ingressos": "INSERT INTO itens_compra_ingressos (id, id_compra_ingresso, id_tipo_ingresso, "
+                              "quantidade, preco_unitario_cobrado, data_utilizacao_prevista, codigo_ingresso_unico, "
+                              "status_ingresso) VALUES (?, ?, ?, 1, ?, ?, ?, ?)",
+    "checkins_atracao": "INSERT INTO checkins_atracao (id, id_usuario_sistema, id_atracao, data_checkin, "
+                        "pontos_ganhos) VALUES (?, ?, ?, ?, ?)",
+    "avaliacoes": "INSERT INTO avaliacoes (id, id_usuario_sistema, id_referencia, tipo_referencia, nota, "
+                  "comentario, data_avaliacao) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "itinerarios": "INSERT INTO itinerarios (id, id_usuario_sistema, nome, data_criacao, data_visita) "
+                   "VALUES (?, ?, ?, ?, ?)",
+    "itens_itinerario": "INSERT INTO itens_itinerario (id, id_itinerario, tipo_item, id_referencia, "
+                        "horario_previsto, ordem) VALUES (?, ?, ?, ?, ?, ?)",
+}
+
+
+def refresh_derived(conn):
+    """Recompute the sales cube and the daily inventory from the base tables."""
+    cursor = conn.cursor()
+    rebuild_summary(cursor)
+    # A synthetic day can sell more than the default capacity; raise it rather than oversell
+    cursor.execute("""
+        INSERT INTO estoque_ingressos_dia (data_visita, capacidade, vendidos)
+        SELECT data_utilizacao_prevista, MAX(?, COUNT(*)), COUNT(*) FROM itens_compra_ingressos
+        WHERE status_ingresso != ? GROUP BY data_utilizacao_prevista
+        ON CONFLICT (data_visita) DO UPDATE SET
+            vendidos = excluded.vendidos, capacidade = MAX(capacidade, excluded.vendidos)
+    """, (DAILY_TICKET_CAPACITY, TICKET_CANCELLED))
+    conn.commit()
+    conn.execute("ANALYZE")
+
+
+def generate(database=None, visitors=100000, seed=215, batch_size=20000, start="2025-01-01", days=365,
+             today="2025-11-01", progress=None):
+    """Add visitors synthetic visitors and their activity to database; returns {table: rows written}."""
+    init_db(database)
+    conn = get_db_connection(database)
+    try:
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -262144")  # 256 MiB: the unique and date indexes take random inserts
+        park = SyntheticPark(conn, seed, start, days, today)
+        written = dict.fromkeys(INSERTS, 0)
+        done = 0
+        while done < visitors:
+            count = min(batch_size, visitors - done)
+            rows = park.batch(count)
+            with conn:
+                for table, insert in INSERTS.items():
+                    conn.executemany(insert, rows[table])
+                    written[table] += len(rows[table])
+            done += count
+            if progress is not None:
+                progress(done, written)
+        refresh_derived(conn)
+    finally:
+        conn.close()
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos determinísticos para testes de carga.")
+    parser.add_argument("--db", default=None, help="Caminho do banco SQLite")
+    parser.add_argument("--visitantes", type=int, default=100000, help="Visitantes a gerar (~10 linhas cada)")
+    parser.add_argument("--semente", type=int, default=215, help="Semente: a mesma gera os mesmos dados")
+    parser.add_argument("--lote", type=int, default=20000, help="Visitantes por transação")
+    parser.add_argument("--inicio", default="2025-01-01", help="Primeiro dia de visita (YYYY-MM-DD)")
+    parser.add_argument("--dias", type=int, default=365, help="Dias de visita a partir de --inicio")
+    parser.add_argument("--hoje", default="2025-11-01",
+                        help="Data de referência: visitas antes dela já aconteceram (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+
+    def progress(done, written):
+        total = sum(written.values())
+        elapsed = time.perf_counter() - started
+        print(f"  {done:9d} visitantes  {total:10d} linhas  {total / elapsed:8.0f} linhas/s")
+
+    written = generate(args.db, args.visitantes, args.semente, args.lote, args.inicio, args.dias, args.hoje,
+                       progress)
+    elapsed = time.perf_counter() - started
+    print(f"{sum(written.values())} linhas em {elapsed:.1f} s:")
+    for table, count in written.items():
+        print(f"  {table:24s} {count:10d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compact ticket codes: random 63-bit numbers in Crockford base32 plus a check symbol.
+
+A code is 13 base32 symbols (the number) followed by a Luhn mod 32 check
+symbol, e.g. "3MZ8Q1VKE07XTF". It replaces the 38-character uuid4-derived
+codigo_ingresso_unico, keeping the UNIQUE index small, and the check symbol
+lets gates reject mistyped or misread codes without a lookup.
+"""
+
+import secrets
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+BITS = 63  # Fits a signed SQLite INTEGER
+BODY_LENGTH = 13
+CODE_LENGTH = BODY_LENGTH + 1
+
+_VALUES = {symbol: value for value, symbol in enumerate(ALPHABET)}
+# Crockford aliases for symbols that are easy to confuse when typed
+_VALUES.update({"O": 0, "I": 1, "L": 1})
+
+
+def _check_symbol(body):
+    """Luhn mod 32 check symbol for a string of ALPHABET symbols."""
+    total = 0
+    factor = 2
+    for symbol in reversed(body):
+        addend = factor * _VALUES[symbol]
+        total += addend // 32 + addend % 32
+        factor = 1 if factor == 2 else 2
+    return ALPHABET[(32 - total % 32) % 32]
+
+
+def encode(number):
+    body = []
+    for _ in range(BODY_LENGTH):
+        number, value = divmod(number, 32)
+        body.append(ALPHABET[value])
+    body = "".join(reversed(body))
+    return body + _check_symbol(body)
+
+
+def decode(code):
+    """Return the number of a code, or None if it is malformed or fails the check."""
+    code = code.strip().upper().replace("-", "")
+    if len(code) != CODE_LENGTH or any(symbol not in _VALUES for symbol in code):
+        return None
+    code = "".join(ALPHABET[_VALUES[symbol]] for symbol in code)
+    body = code[:BODY_LENGTH]
+    if _check_symbol(body) != code[-1]:
+        return None
+    number = 0
+    for symbol in body:
+        number = number * 32 + _VALUES[symbol]
+    return number
+
+
+def normalize(code):
+    """Canonical form of a scanned or typed code, or None if it is not valid."""
+    number = decode(code)
+    return None if number is None else encode(number)
+
+
+def is_compact_code(code):
+    return code is not None and decode(code) is not None
+
+
+def new_ticket_codes(count):
+    """Generate a batch of distinct random codes for one purchase."""
+    numbers = set()
+    while len(numbers) < count:
+        numbers.add(secrets.randbits(BITS))
+    return [encode(number) for number in numbers]
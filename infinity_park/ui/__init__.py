@@ -0,0 +1,6 @@
+"""Kivy interface of the app, one module per group of screens.
+
+Screen modules are imported when their first screen is built (see
+screen_manager.LazyScreenManager), so launching the app loads only the code
+of the login screen.
+"""
@@ -0,0 +1,740 @@
+"""Administrator area: home, attraction and show management, and the sales report."""
+
+import os
+import sqlite3
+from datetime import datetime
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.spinner import Spinner
+from kivy.uix.textinput import TextInput
+
+from infinity_park.config import ASSETS_PATH
+from infinity_park.db import get_db_connection
+from infinity_park.sales import query_sales
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_DISABLED, COLOR_PRIMARY, COLOR_SECONDARY,
+                                      COLOR_TEXT_DARK, HeaderLabel, StyledButton)
+
+
+class AdminHomeScreen(Screen):
+    def __init__(self, **kwargs):
+        super(AdminHomeScreen, self).__init__(**kwargs)
+        self.name = "admin_home"
+        layout = BoxLayout(orientation="vertical", padding=20, spacing=10)
+        layout.add_widget(HeaderLabel(text="Painel do Administrador"))
+        
+        button_grid = GridLayout(cols=2, spacing=10, size_hint_y=None, padding=10)
+        button_grid.bind(minimum_height=button_grid.setter("height"))
+
+        admin_buttons_data = [
+            ("Gerenciar Usuarios", "admin_manage_users", "users_icon.png"),
+            ("Gerenciar Atracoes", "admin_manage_attractions", "attraction_icon.png"),
+            ("Gerenciar Shows", "admin_manage_shows", "show_icon.png"),
+            ("Gerenciar Lanchonetes", "admin_manage_food_courts", "food_icon.png"),
+            ("Gerenciar Avisos", "admin_manage_warnings", "warning_icon.png"),
+            ("Relatorio de Vendas", "admin_sales_report", "report_icon.png"),
+            ("Ver Logs do Sistema", "admin_system_logs", "log_icon.png")
+        ]
+
+        for text, screen_name, icon_name in admin_buttons_data:
+            button_item_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=120, spacing=5)
+            icon_path = os.path.join(ASSETS_PATH, icon_name)
+            if os.path.exists(icon_path):
+                img = KivyImage(source=icon_path, size_hint_y=None, height=60)
+            else:
+                img = Label(text="Icone", size_hint_y=None, height=60)
+            
+            btn = StyledButton(text=text, height=50, size_hint_y=None)
+            btn.bind(on_press=lambda x, sn=screen_name: setattr(self.manager, "current", sn) if self.manager.has_screen(sn) else self.show_dev_popup(sn))
+            
+            button_item_layout.add_widget(img)
+            button_item_layout.add_widget(btn)
+            button_grid.add_widget(button_item_layout)
+
+        layout.add_widget(button_grid)
+        
+        logout_button = Button(text="Logout", size_hint_y=None, height=50, background_color=COLOR_SECONDARY, color=COLOR_TEXT_DARK)
+        logout_button.bind(on_press=self.logout)
+        layout.add_widget(logout_button)
+        self.add_widget(layout)
+
+    def logout(self, instance):
+        app = App.get_running_app()
+        app.backend.logout()
+        app.user_id = None
+        app.user_profile = None
+        self.manager.current = "login"
+    
+    def show_dev_popup(self, screen_name):
+        popup_content = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        popup_content.add_widget(Label(text=f"A tela '{screen_name}' ainda está em desenvolvimento."))
+        close_button = StyledButton(text="Fechar")        
+        popup_content.add_widget(close_button)
+        popup = Popup(title="Em Desenvolvimento", content=popup_content, size_hint=(0.8, 0.4))
+        close_button.bind(on_press=popup.dismiss)
+        popup.open()
+
+
+
+class AdminManageAttractionsScreen(Screen):
+    def __init__(self, **kwargs):
+        super(AdminManageAttractionsScreen, self).__init__(**kwargs)
+        self.name = "admin_manage_attractions"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Gerenciar Atrações"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "admin_home"))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Add Attraction button
+        add_button = StyledButton(text="Adicionar Nova Atração", size_hint_y=None, height=50)
+        add_button.bind(on_press=self.open_add_attraction_popup)
+        layout.add_widget(add_button)
+
+        # Attractions list
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.attractions_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.attractions_grid.bind(minimum_height=self.attractions_grid.setter("height"))
+        scroll_view.add_widget(self.attractions_grid)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_attractions()
+
+    def load_attractions(self):
+        self.attractions_grid.clear_widgets()
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, nome, tipo_atracao, status FROM atracoes ORDER BY nome")
+        attractions = cursor.fetchall()
+        conn.close()
+
+        if not attractions:
+            self.attractions_grid.add_widget(Label(text="Nenhuma atração cadastrada.", color=COLOR_TEXT_DARK))
+            return
+
+        for attraction in attractions:
+            item = BoxLayout(orientation="horizontal", size_hint_y=None, height=80, spacing=10, padding=5)
+            
+            # Attraction info
+            info_layout = BoxLayout(orientation="vertical", size_hint_x=0.7)
+            info_layout.add_widget(Label(
+                text=attraction["nome"],
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY if attraction["status"] == "Operacional" else COLOR_SECONDARY,
+                halign="left",
+                text_size=(Window.width * 0.6, None)
+            ))
+            info_layout.add_widget(Label(
+                text=f"Tipo: {attraction['tipo_atracao']} | Status: {attraction['status']}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                text_size=(Window.width * 0.6, None)
+            ))
+            item.add_widget(info_layout)
+            
+            # Action buttons
+            buttons_layout = BoxLayout(orientation="vertical", size_hint_x=0.3, spacing=5)
+            edit_button = Button(text="Editar", size_hint_y=None, height=35, background_color=COLOR_ACCENT)
+            edit_button.bind(on_press=lambda _, id=attraction["id"]: self.open_edit_attraction_popup(id))
+            
+            toggle_button = Button(
+                text="Manutenção" if attraction["status"] == "Operacional" else "Operacional", 
+                size_hint_y=None, 
+                height=35, 
+                background_color=COLOR_SECONDARY if attraction["status"] == "Operacional" else COLOR_PRIMARY
+            )
+            toggle_button.bind(on_press=lambda _, id=attraction["id"], status=attraction["status"]: self.toggle_attraction_status(id, status))
+            
+            buttons_layout.add_widget(edit_button)
+            buttons_layout.add_widget(toggle_button)
+            item.add_widget(buttons_layout)
+            
+            self.attractions_grid.add_widget(item)
+
+    def open_add_attraction_popup(self, instance):
+        popup = AttractionFormPopup(mode="add", callback=self.load_attractions)
+        popup.open()
+
+    def open_edit_attraction_popup(self, attraction_id):
+        popup = AttractionFormPopup(mode="edit", attraction_id=attraction_id, callback=self.load_attractions)
+        popup.open()
+
+    def toggle_attraction_status(self, attraction_id, current_status):
+        new_status = "Manutencao Programada" if current_status == "Operacional" else "Operacional"
+        try:
+            App.get_running_app().writer.call(
+                lambda conn: conn.execute("UPDATE atracoes SET status = ? WHERE id = ?", (new_status, attraction_id))
+            )
+            self.load_attractions()  # Refresh the list
+        except Exception as e:
+            print(f"Error toggling attraction status: {e}")
+
+
+
+class AttractionFormPopup(Popup):
+    def __init__(self, mode="add", attraction_id=None, callback=None, **kwargs):
+        self.mode = mode
+        self.attraction_id = attraction_id
+        self.callback = callback
+        
+        title = "Adicionar Nova Atração" if mode == "add" else "Editar Atração"
+        super(AttractionFormPopup, self).__init__(title=title, size_hint=(0.9, 0.9), **kwargs)
+        
+        layout = BoxLayout(orientation="vertical", padding=15, spacing=10)
+        
+        scroll = ScrollView(size_hint=(1, 1))
+        form_layout = BoxLayout(orientation="vertical", spacing=10, size_hint_y=None)
+        form_layout.bind(minimum_height=form_layout.setter("height"))
+        
+        # Form fields
+        form_layout.add_widget(Label(text="Nome da Atração:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.nome_input = TextInput(hint_text="Nome da atração", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.nome_input)
+        
+        form_layout.add_widget(Label(text="Descrição Curta:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.descricao_curta_input = TextInput(hint_text="Descrição curta", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.descricao_curta_input)
+        
+        form_layout.add_widget(Label(text="Descrição Detalhada:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.descricao_detalhada_input = TextInput(hint_text="Descrição detalhada", multiline=True, size_hint_y=None, height=80)
+        form_layout.add_widget(self.descricao_detalhada_input)
+        
+        form_layout.add_widget(Label(text="Tipo de Atração:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.tipo_atracao_input = TextInput(hint_text="Ex: Radical, Familiar, Infantil", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.tipo_atracao_input)
+        
+        form_layout.add_widget(Label(text="Localização:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.localizacao_input = TextInput(hint_text="Local onde a atração está", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.localizacao_input)
+        
+        form_layout.add_widget(Label(text="Capacidade por Ciclo:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.capacidade_input = TextInput(hint_text="Ex: 30", input_filter="int", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.capacidade_input)
+        
+        form_layout.add_widget(Label(text="Duração do Ciclo (minutos):", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.duracao_input = TextInput(hint_text="Ex: 5", input_filter="int", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.duracao_input)
+        
+        form_layout.add_widget(Label(text="Altura Mínima (cm):", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.altura_minima_input = TextInput(hint_text="Ex: 120", input_filter="int", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.altura_minima_input)
+        
+        form_layout.add_widget(Label(text="Idade Mínima (anos):", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.idade_minima_input = TextInput(hint_text="Ex: 10", input_filter="int", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.idade_minima_input)
+        
+        form_layout.add_widget(Label(text="Nível de Emoção:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.nivel_emocao_input = TextInput(hint_text="Ex: Baixo, Médio, Alto", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.nivel_emocao_input)
+        
+        form_layout.add_widget(Label(text="Acessibilidade:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.acessibilidade_input = TextInput(hint_text="Informações sobre acessibilidade", multiline=True, size_hint_y=None, height=60)
+        form_layout.add_widget(self.acessibilidade_input)
+        
+        form_layout.add_widget(Label(text="Caminho da Imagem:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.imagem_input = TextInput(hint_text="Caminho para a imagem", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.imagem_input)
+        
+        self.status_spinner = Spinner(
+            text="Operacional",
+            values=["Operacional", "Manutencao Programada", "Fechada Temporariamente"],
+            size_hint_y=None,
+            height=40
+        )
+        form_layout.add_widget(Label(text="Status:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        form_layout.add_widget(self.status_spinner)
+        
+        scroll.add_widget(form_layout)
+        layout.add_widget(scroll)
+        
+        # Buttons
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        save_button = StyledButton(text="Salvar")
+        save_button.bind(on_press=self.save_attraction)
+        cancel_button = Button(text="Cancelar", background_color=COLOR_SECONDARY, color=COLOR_TEXT_DARK)
+        cancel_button.bind(on_press=self.dismiss)
+        buttons_layout.add_widget(save_button)
+        buttons_layout.add_widget(cancel_button)
+        layout.add_widget(buttons_layout)
+        
+        self.status_label = Label(text="", size_hint_y=None, height=30, color=COLOR_ACCENT)
+        layout.add_widget(self.status_label)
+        
+        self.content = layout
+        
+        # If editing, load attraction data
+        if mode == "edit" and attraction_id:
+            self.load_attraction_data()
+    
+    def load_attraction_data(self):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM atracoes WHERE id = ?", (self.attraction_id,))
+        attraction = cursor.fetchone()
+        conn.close()
+        
+        if attraction:
+            self.nome_input.text = attraction["nome"]
+            self.descricao_curta_input.text = attraction["descricao_curta"] if attraction["descricao_curta"] else ""
+            self.descricao_detalhada_input.text = attraction["descricao_detalhada"] if attraction["descricao_detalhada"] else ""
+            self.tipo_atracao_input.text = attraction["tipo_atracao"] if attraction["tipo_atracao"] else ""
+            self.localizacao_input.text = attraction["localizacao_mapa"] if attraction["localizacao_mapa"] else ""
+            self.capacidade_input.text = str(attraction["capacidade_por_ciclo"]) if attraction["capacidade_por_ciclo"] else ""
+            self.duracao_input.text = str(attraction["duracao_ciclo_minutos"]) if attraction["duracao_ciclo_minutos"] else ""
+            self.altura_minima_input.text = str(attraction["altura_minima_cm"]) if attraction["altura_minima_cm"] else ""
+            self.idade_minima_input.text = str(attraction["idade_minima_anos"]) if attraction["idade_minima_anos"] else ""
+            self.nivel_emocao_input.text = attraction["nivel_emocao"] if attraction["nivel_emocao"] else ""
+            self.acessibilidade_input.text = attraction["acessibilidade"] if attraction["acessibilidade"] else ""
+            self.imagem_input.text = attraction["local_image_path"] if attraction["local_image_path"] else ""
+            self.status_spinner.text = attraction["status"] if attraction["status"] else "Operacional"
+    
+    def save_attraction(self, instance):
+        # Validate required fields
+        if not self.nome_input.text:
+            self.status_label.text = "Nome da atração é obrigatório."
+            return
+        
+        if not self.capacidade_input.text:
+            self.status_label.text = "Capacidade por ciclo é obrigatória."
+            return
+        
+        # Prepare data
+        nome = self.nome_input.text
+        descricao_curta = self.descricao_curta_input.text
+        descricao_detalhada = self.descricao_detalhada_input.text
+        tipo_atracao = self.tipo_atracao_input.text
+        localizacao_mapa = self.localizacao_input.text
+        
+        try:
+            capacidade = int(self.capacidade_input.text)
+            duracao = int(self.duracao_input.text) if self.duracao_input.text else None
+            altura_minima = int(self.altura_minima_input.text) if self.altura_minima_input.text else None
+            idade_minima = int(self.idade_minima_input.text) if self.idade_minima_input.text else None
+        except ValueError:
+            self.status_label.text = "Valores numéricos inválidos."
+            return
+        
+        nivel_emocao = self.nivel_emocao_input.text
+        acessibilidade = self.acessibilidade_input.text
+        local_image_path = self.imagem_input.text
+        status = self.status_spinner.text
+        
+        def write(conn):
+            if self.mode == "add":
+                conn.execute(
+                    "INSERT INTO atracoes (nome, descricao_curta, descricao_detalhada, capacidade_por_ciclo, "
+                    "duracao_ciclo_minutos, altura_minima_cm, idade_minima_anos, tipo_atracao, "
+                    "localizacao_mapa, local_image_path, status, nivel_emocao, acessibilidade) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (nome, descricao_curta, descricao_detalhada, capacidade, duracao, altura_minima, 
+                     idade_minima, tipo_atracao, localizacao_mapa, local_image_path, status, nivel_emocao, acessibilidade)
+                )
+            else:
+                conn.execute(
+                    "UPDATE atracoes SET nome = ?, descricao_curta = ?, descricao_detalhada = ?, "
+                    "capacidade_por_ciclo = ?, duracao_ciclo_minutos = ?, altura_minima_cm = ?, "
+                    "idade_minima_anos = ?, tipo_atracao = ?, localizacao_mapa = ?, local_image_path = ?, "
+                    "status = ?, nivel_emocao = ?, acessibilidade = ? WHERE id = ?",
+                    (nome, descricao_curta, descricao_detalhada, capacidade, duracao, altura_minima, 
+                     idade_minima, tipo_atracao, localizacao_mapa, local_image_path, status, nivel_emocao, 
+                     acessibilidade, self.attraction_id)
+                )
+        
+        try:
+            app = App.get_running_app()
+            app.writer.call(write)
+            app.badge_engine.invalidate()
+            if self.mode == "add":
+                self.status_label.text = "Atração adicionada com sucesso!"
+            else:
+                self.status_label.text = "Atração atualizada com sucesso!"
+            
+            # Call callback to refresh the list
+            if self.callback:
+                self.callback()
+                
+            # Close popup after a short delay
+            Clock.schedule_once(lambda dt: self.dismiss(), 1.5)
+            
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e):
+                self.status_label.text = "Erro: Já existe uma atração com este nome."
+            else:
+                self.status_label.text = f"Erro de integridade: {e}"
+        except Exception as e:
+            self.status_label.text = f"Erro ao salvar: {e}"
+
+
+
+class AdminManageShowsScreen(Screen):
+    def __init__(self, **kwargs):
+        super(AdminManageShowsScreen, self).__init__(**kwargs)
+        self.name = "admin_manage_shows"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Gerenciar Shows"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "admin_home"))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Add Show button
+        add_button = StyledButton(text="Adicionar Novo Show", size_hint_y=None, height=50)
+        add_button.bind(on_press=self.open_add_show_popup)
+        layout.add_widget(add_button)
+
+        # Shows list
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.shows_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.shows_grid.bind(minimum_height=self.shows_grid.setter("height"))
+        scroll_view.add_widget(self.shows_grid)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_shows()
+
+    def load_shows(self):
+        self.shows_grid.clear_widgets()
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, nome, tipo_show, ativo FROM shows ORDER BY nome")
+        shows = cursor.fetchall()
+        conn.close()
+
+        if not shows:
+            self.shows_grid.add_widget(Label(text="Nenhum show cadastrado.", color=COLOR_TEXT_DARK))
+            return
+
+        for show in shows:
+            item = BoxLayout(orientation="horizontal", size_hint_y=None, height=80, spacing=10, padding=5)
+            
+            # Show info
+            info_layout = BoxLayout(orientation="vertical", size_hint_x=0.7)
+            info_layout.add_widget(Label(
+                text=show["nome"],
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY if show["ativo"] == 1 else COLOR_DISABLED,
+                halign="left",
+                text_size=(Window.width * 0.6, None)
+            ))
+            info_layout.add_widget(Label(
+                text=f"Tipo: {show['tipo_show']} | Status: {'Ativo' if show['ativo'] == 1 else 'Inativo'}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                text_size=(Window.width * 0.6, None)
+            ))
+            item.add_widget(info_layout)
+            
+            # Action buttons
+            buttons_layout = BoxLayout(orientation="vertical", size_hint_x=0.3, spacing=5)
+            edit_button = Button(text="Editar", size_hint_y=None, height=35, background_color=COLOR_ACCENT)
+            edit_button.bind(on_press=lambda _, id=show["id"]: self.open_edit_show_popup(id))
+            
+            toggle_button = Button(
+                text="Desativar" if show["ativo"] == 1 else "Ativar", 
+                size_hint_y=None, 
+                height=35, 
+                background_color=COLOR_SECONDARY if show["ativo"] == 1 else COLOR_PRIMARY
+            )
+            toggle_button.bind(on_press=lambda _, id=show["id"], active=show["ativo"]: self.toggle_show_status(id, active))
+            
+            buttons_layout.add_widget(edit_button)
+            buttons_layout.add_widget(toggle_button)
+            item.add_widget(buttons_layout)
+            
+            self.shows_grid.add_widget(item)
+
+    def open_add_show_popup(self, instance):
+        popup = ShowFormPopup(mode="add", callback=self.load_shows)
+        popup.open()
+
+    def open_edit_show_popup(self, show_id):
+        popup = ShowFormPopup(mode="edit", show_id=show_id, callback=self.load_shows)
+        popup.open()
+
+    def toggle_show_status(self, show_id, current_status):
+        new_status = 0 if current_status == 1 else 1
+        try:
+            App.get_running_app().writer.call(
+                lambda conn: conn.execute("UPDATE shows SET ativo = ? WHERE id = ?", (new_status, show_id))
+            )
+            self.load_shows()  # Refresh the list
+        except Exception as e:
+            print(f"Error toggling show status: {e}")
+
+
+
+class ShowFormPopup(Popup):
+    def __init__(self, mode="add", show_id=None, callback=None, **kwargs):
+        self.mode = mode
+        self.show_id = show_id
+        self.callback = callback
+        
+        title = "Adicionar Novo Show" if mode == "add" else "Editar Show"
+        super(ShowFormPopup, self).__init__(title=title, size_hint=(0.9, 0.9), **kwargs)
+        
+        layout = BoxLayout(orientation="vertical", padding=15, spacing=10)
+        
+        scroll = ScrollView(size_hint=(1, 1))
+        form_layout = BoxLayout(orientation="vertical", spacing=10, size_hint_y=None)
+        form_layout.bind(minimum_height=form_layout.setter("height"))
+        
+        # Form fields
+        form_layout.add_widget(Label(text="Nome do Show:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.nome_input = TextInput(hint_text="Nome do show", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.nome_input)
+        
+        form_layout.add_widget(Label(text="Descrição:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.descricao_input = TextInput(hint_text="Descrição do show", multiline=True, size_hint_y=None, height=80)
+        form_layout.add_widget(self.descricao_input)
+        
+        form_layout.add_widget(Label(text="Tipo de Show:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.tipo_show_input = TextInput(hint_text="Ex: Musical, Teatro, Desfile", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.tipo_show_input)
+        
+        form_layout.add_widget(Label(text="Localização:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.localizacao_input = TextInput(hint_text="Local onde o show é realizado", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.localizacao_input)
+        
+        form_layout.add_widget(Label(text="Horários (separados por vírgula):", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.horarios_input = TextInput(hint_text="Ex: 14:00, 17:00, 20:00", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.horarios_input)
+        
+        form_layout.add_widget(Label(text="Duração (minutos):", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.duracao_input = TextInput(hint_text="Ex: 60", input_filter="int", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.duracao_input)
+        
+        form_layout.add_widget(Label(text="URL da Imagem:", size_hint_y=None, height=30, halign="left", text_size=(Window.width * 0.8, None)))
+        self.url_imagem_input = TextInput(hint_text="Caminho para a imagem", multiline=False, size_hint_y=None, height=40)
+        form_layout.add_widget(self.url_imagem_input)
+        
+        self.ativo_checkbox = BoxLayout(orientation="horizontal", size_hint_y=None, height=40)
+        self.ativo_checkbox.add_widget(Label(text="Ativo:", size_hint_x=0.3))
+        self.ativo_value = True
+        self.ativo_button = Button(text="Sim", background_color=COLOR_ACCENT)
+        self.ativo_button.bind(on_press=self.toggle_ativo)
+        self.ativo_checkbox.add_widget(self.ativo_button)
+        form_layout.add_widget(self.ativo_checkbox)
+        
+        scroll.add_widget(form_layout)
+        layout.add_widget(scroll)
+        
+        # Buttons
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        save_button = StyledButton(text="Salvar")
+        save_button.bind(on_press=self.save_show)
+        cancel_button = Button(text="Cancelar", background_color=COLOR_SECONDARY, color=COLOR_TEXT_DARK)
+        cancel_button.bind(on_press=self.dismiss)
+        buttons_layout.add_widget(save_button)
+        buttons_layout.add_widget(cancel_button)
+        layout.add_widget(buttons_layout)
+        
+        self.status_label = Label(text="", size_hint_y=None, height=30, color=COLOR_ACCENT)
+        layout.add_widget(self.status_label)
+        
+        self.content = layout
+        
+        # If editing, load show data
+        if mode == "edit" and show_id:
+            self.load_show_data()
+    
+    def toggle_ativo(self, instance):
+        self.ativo_value = not self.ativo_value
+        instance.text = "Sim" if self.ativo_value else "Não"
+        instance.background_color = COLOR_ACCENT if self.ativo_value else COLOR_SECONDARY
+    
+    def load_show_data(self):
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM shows WHERE id = ?", (self.show_id,))
+        show = cursor.fetchone()
+        conn.close()
+        
+        if show:
+            self.nome_input.text = show["nome"]
+            self.descricao_input.text = show["descricao"] if show["descricao"] else ""
+            self.tipo_show_input.text = show["tipo_show"] if show["tipo_show"] else ""
+            self.localizacao_input.text = show["localizacao"] if show["localizacao"] else ""
+            self.horarios_input.text = show["horarios"] if show["horarios"] else ""
+            self.duracao_input.text = str(show["duracao_minutos"]) if show["duracao_minutos"] else ""
+            self.url_imagem_input.text = show["url_imagem_divulgacao"] if show["url_imagem_divulgacao"] else ""
+            self.ativo_value = show["ativo"] == 1
+            self.ativo_button.text = "Sim" if self.ativo_value else "Não"
+            self.ativo_button.background_color = COLOR_ACCENT if self.ativo_value else COLOR_SECONDARY
+    
+    def save_show(self, instance):
+        # Validate required fields
+        if not self.nome_input.text:
+            self.status_label.text = "Nome do show é obrigatório."
+            return
+        
+        # Prepare data
+        nome = self.nome_input.text
+        descricao = self.descricao_input.text
+        tipo_show = self.tipo_show_input.text
+        localizacao = self.localizacao_input.text
+        horarios = self.horarios_input.text
+        
+        try:
+            duracao = int(self.duracao_input.text) if self.duracao_input.text else None
+        except ValueError:
+            self.status_label.text = "Duração deve ser um número inteiro."
+            return
+        
+        url_imagem = self.url_imagem_input.text
+        ativo = 1 if self.ativo_value else 0
+        
+        def write(conn):
+            if self.mode == "add":
+                conn.execute(
+                    "INSERT INTO shows (nome, descricao, tipo_show, localizacao, horarios, duracao_minutos, url_imagem_divulgacao, ativo) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (nome, descricao, tipo_show, localizacao, horarios, duracao, url_imagem, ativo)
+                )
+            else:
+                conn.execute(
+                    "UPDATE shows SET nome = ?, descricao = ?, tipo_show = ?, localizacao = ?, "
+                    "horarios = ?, duracao_minutos = ?, url_imagem_divulgacao = ?, ativo = ? "
+                    "WHERE id = ?",
+                    (nome, descricao, tipo_show, localizacao, horarios, duracao, url_imagem, ativo, self.show_id)
+                )
+        
+        try:
+            App.get_running_app().writer.call(write)
+            if self.mode == "add":
+                self.status_label.text = "Show adicionado com sucesso!"
+            else:
+                self.status_label.text = "Show atualizado com sucesso!"
+            
+            # Call callback to refresh the list
+            if self.callback:
+                self.callback()
+                
+            # Close popup after a short delay
+            Clock.schedule_once(lambda dt: self.dismiss(), 1.5)
+            
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e):
+                self.status_label.text = "Erro: Já existe um show com este nome."
+            else:
+                self.status_label.text = f"Erro de integridade: {e}"
+        except Exception as e:
+            self.status_label.text = f"Erro ao salvar: {e}"
+
+
+
+class AdminSalesReportScreen(Screen):
+    GROUP_OPTIONS = {
+        "Dia": ("dia",),
+        "Tipo de Ingresso": ("tipo",),
+        "Método de Pagamento": ("metodo",),
+        "Status": ("status",),
+        "Dia e Tipo de Ingresso": ("dia", "tipo"),
+    }
+
+    def __init__(self, **kwargs):
+        super(AdminSalesReportScreen, self).__init__(**kwargs)
+        self.name = "admin_sales_report"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Relatório de Vendas"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "admin_home"))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Filters
+        filters_layout = GridLayout(cols=2, spacing=10, size_hint_y=None, height=200)
+        filters_layout.add_widget(Label(text="De (AAAA-MM-DD):", color=COLOR_TEXT_DARK))
+        self.start_input = TextInput(hint_text="Primeiro dia", multiline=False, size_hint_y=None, height=40)
+        filters_layout.add_widget(self.start_input)
+        filters_layout.add_widget(Label(text="Até (AAAA-MM-DD):", color=COLOR_TEXT_DARK))
+        self.end_input = TextInput(hint_text="Último dia", multiline=False, size_hint_y=None, height=40)
+        filters_layout.add_widget(self.end_input)
+        filters_layout.add_widget(Label(text="Agrupar por:", color=COLOR_TEXT_DARK))
+        self.group_spinner = Spinner(text="Dia", values=list(self.GROUP_OPTIONS), size_hint_y=None, height=40)
+        filters_layout.add_widget(self.group_spinner)
+        filters_layout.add_widget(Label(text="Status:", color=COLOR_TEXT_DARK))
+        self.status_spinner = Spinner(text="Todos", values=["Todos", "Aprovado", "Pendente", "Recusado"], size_hint_y=None, height=40)
+        filters_layout.add_widget(self.status_spinner)
+        layout.add_widget(filters_layout)
+
+        report_button = StyledButton(text="Gerar Relatório", size_hint_y=None, height=50)
+        report_button.bind(on_press=lambda x: self.load_report())
+        layout.add_widget(report_button)
+
+        self.status_label = Label(text="", color=COLOR_TEXT_DARK, size_hint_y=None, height=30)
+        layout.add_widget(self.status_label)
+
+        # Report rows
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.report_grid = GridLayout(cols=4, spacing=5, size_hint_y=None, padding=10, row_default_height=30, row_force_default=True)
+        self.report_grid.bind(minimum_height=self.report_grid.setter("height"))
+        scroll_view.add_widget(self.report_grid)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_report()
+
+    def load_report(self):
+        self.report_grid.clear_widgets()
+        group_by = self.GROUP_OPTIONS[self.group_spinner.text]
+        start = self.start_input.text.strip() or None
+        end = self.end_input.text.strip() or None
+        status = None if self.status_spinner.text == "Todos" else self.status_spinner.text
+        for value in (start, end):
+            if value:
+                try:
+                    datetime.strptime(value, "%Y-%m-%d")
+                except ValueError:
+                    self.status_label.text = "Datas devem estar no formato AAAA-MM-DD."
+                    self.status_label.color = COLOR_SECONDARY
+                    return
+
+        conn = get_db_connection()
+        try:
+            rows = query_sales(conn.cursor(), group_by, start, end, status=status)
+        except sqlite3.Error as e:
+            self.status_label.text = f"Erro ao gerar relatório: {e}"
+            self.status_label.color = COLOR_SECONDARY
+            return
+        finally:
+            conn.close()
+
+        for text in (self.group_spinner.text, "Compras", "Ingressos", "Receita"):
+            self.report_grid.add_widget(Label(text=text, bold=True, color=COLOR_PRIMARY))
+        for row in rows:
+            self.report_grid.add_widget(Label(text=" / ".join(str(row[name]) for name in group_by), color=COLOR_TEXT_DARK))
+            self.report_grid.add_widget(Label(text=str(row["compras"]), color=COLOR_TEXT_DARK))
+            self.report_grid.add_widget(Label(text=str(row["ingressos"]), color=COLOR_TEXT_DARK))
+            self.report_grid.add_widget(Label(text=f"R$ {row['receita']:.2f}".replace(".", ","), color=COLOR_TEXT_DARK))
+
+        total_purchases = sum(row["compras"] for row in rows)
+        total_revenue = sum(row["receita"] for row in rows)
+        self.status_label.text = f"{total_purchases} compras | Receita total: R$ {total_revenue:.2f}".replace(".", ",")
+        self.status_label.color = COLOR_ACCENT if rows else COLOR_TEXT_DARK
@@ -0,0 +1,140 @@
+"""The InfinityParkApp application and its screen registry."""
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.screenmanager import FadeTransition
+
+from infinity_park.badges import BadgeEngine
+from infinity_park.config import API_URL, APP_NAME, PREWARM_SCREENS, SQL_PROFILE, UI_PROFILE
+from infinity_park.db import init_db
+from infinity_park.expiration import ExpirationSweeper
+from infinity_park.instrumentation import STATS as SQL_STATS
+from infinity_park.payments import PaymentWorker
+from infinity_park.pricing import PricingEngine
+from infinity_park.qr import QRRenderer
+from infinity_park.services import LocalBackend
+from infinity_park.storage import Checkpointer
+from infinity_park.ui.screen_manager import LazyScreenManager
+from infinity_park.writer import WriteQueue
+
+KEY_SQL_REPORT = 290  # F9: write the SQL report (with INFINITY_PARK_SQL_PROFILE=1)
+KEY_UI_REPORT = 291  # F10: write the frame profiler's report (with INFINITY_PARK_UI_PROFILE=1)
+
+# Screen name -> Screen class; each module is imported when its first screen is built
+SCREENS = (
+    ("login", "infinity_park.ui.auth.LoginScreen"),
+    ("register", "infinity_park.ui.auth.RegisterScreen"),
+    ("user_home", "infinity_park.ui.home.UserHomeScreen"),
+    ("admin_home", "infinity_park.ui.admin.AdminHomeScreen"),
+    ("attractions_list", "infinity_park.ui.attractions.AttractionsListScreen"),
+    ("attraction_detail", "infinity_park.ui.attractions.AttractionDetailScreen"),
+    ("admin_manage_attractions", "infinity_park.ui.admin.AdminManageAttractionsScreen"),
+    ("shows_list", "infinity_park.ui.shows.ShowsListScreen"),
+    ("show_detail", "infinity_park.ui.shows.ShowDetailScreen"),
+    ("admin_manage_shows", "infinity_park.ui.admin.AdminManageShowsScreen"),
+    ("admin_sales_report", "infinity_park.ui.admin.AdminSalesReportScreen"),
+    ("food_courts_list", "infinity_park.ui.food_courts.FoodCourtsListScreen"),
+    ("food_court_detail", "infinity_park.ui.food_courts.FoodCourtDetailScreen"),
+    ("tickets_list", "infinity_park.ui.tickets.TicketsListScreen"),
+    ("ticket_purchase", "infinity_park.ui.tickets.TicketPurchaseScreen"),
+    ("my_profile", "infinity_park.ui.user_profile.MyProfileScreen"),
+    ("purchase_details", "infinity_park.ui.tickets.PurchaseDetailsScreen"),
+    ("park_map", "infinity_park.ui.park_info.ParkMapScreen"),
+    ("about_park", "infinity_park.ui.park_info.AboutParkScreen"),
+    ("warnings_list", "infinity_park.ui.park_info.WarningsListScreen"),
+    ("create_itinerary", "infinity_park.ui.itineraries.CreateItineraryScreen"),
+    ("my_itinerary", "infinity_park.ui.itineraries.MyItineraryScreen"),
+)
+
+
+class InfinityParkApp(App):
+    def __init__(self, **kwargs):
+        super(InfinityParkApp, self).__init__(**kwargs)
+        self.title = APP_NAME
+        self.user_id = None
+        self.user_profile = None
+        self.previous_screen = "login"
+        self.selected_attraction_id = None
+        self.selected_show_id = None
+        self.selected_lanchonete_id = None
+        self.selected_ticket_type_id = None
+        self.selected_ticket_type_name = None
+        self.selected_ticket_type_price = 0
+        self.selected_purchase_id = None
+        self.qr_renderer = QRRenderer()
+        self.badge_engine = BadgeEngine()  # The admin forms invalidate it after editing attractions
+        self.writer = WriteQueue()  # Every write to the local database goes through it
+        self.checkpointer = Checkpointer()
+        self.ui_profiler = None
+        if API_URL:
+            # Client mode: the API server prices, charges and expires tickets for every kiosk
+            from infinity_park.api import ApiClient
+            self.backend = ApiClient(API_URL)
+            self.payment_worker = self.expiration_sweeper = None
+        else:
+            self.payment_worker = PaymentWorker(writer=self.writer)
+            self.expiration_sweeper = ExpirationSweeper(writer=self.writer)
+            self.backend = LocalBackend(
+                badge_engine=self.badge_engine, pricing_engine=PricingEngine(),
+                payment_worker=self.payment_worker, writer=self.writer
+            )
+
+    def build(self):
+        init_db()
+        self.writer.start()
+        self.checkpointer.start()
+        if self.payment_worker is not None:
+            self.payment_worker.start()
+            self.payment_worker.resume_pending()
+            self.expiration_sweeper.start()
+        self.sm = LazyScreenManager(transition=FadeTransition())
+        if UI_PROFILE:
+            from infinity_park.ui.profiler import FrameProfiler
+            self.ui_profiler = FrameProfiler().attach(self.sm).start()
+        
+        for name, factory in SCREENS:
+            self.sm.register(name, factory)
+        self.sm.current = "login"
+        if PREWARM_SCREENS:
+            self.sm.prewarm(PREWARM_SCREENS)
+        if SQL_PROFILE or UI_PROFILE:
+            Window.bind(on_keyboard=self.on_keyboard)
+            
+        return self.sm
+
+    def get_previous_screen(self):
+        if self.sm.current in ["attraction_detail", "show_detail", "food_court_detail"]:
+            return {
+                "attraction_detail": "attractions_list",
+                "show_detail": "shows_list",
+                "food_court_detail": "food_courts_list"
+            }.get(self.sm.current, "user_home")
+        
+        admin_screens = ["admin_manage_users", "admin_manage_attractions", 
+                        "admin_manage_shows", "admin_manage_food_courts",
+                        "admin_manage_warnings", "admin_sales_report", "admin_system_logs"]
+        
+        return "admin_home" if self.sm.current in admin_screens else "user_home"
+
+    def on_keyboard(self, window, key, *args):
+        if key == KEY_SQL_REPORT and SQL_PROFILE:
+            print(f"Relatório SQL salvo em {SQL_STATS.dump()}")
+            return True
+        if key == KEY_UI_REPORT and self.ui_profiler is not None:
+            print(f"Relatório de frames salvo em {self.ui_profiler.dump()}")
+            return True
+        return False
+
+    def on_stop(self):
+        if self.payment_worker is not None:
+            self.payment_worker.close()
+            self.expiration_sweeper.close()
+        else:
+            self.backend.close()
+        self.writer.close()
+        self.checkpointer.close()
+        if SQL_PROFILE:
+            SQL_STATS.dump()
+        if self.ui_profiler is not None:
+            self.ui_profiler.close()
+            self.ui_profiler.dump()
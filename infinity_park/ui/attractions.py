@@ -0,0 +1,311 @@
+"""Attraction list and detail screens; check-ins are made from the detail screen."""
+
+import os
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+
+from infinity_park import services
+from infinity_park.config import ASSETS_PATH
+from infinity_park.services import ServiceError
+from infinity_park.ui.ratings import RatingPopup
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK,
+                                      HeaderLabel, StyledButton)
+
+
+class AttractionsListScreen(Screen):
+    def __init__(self, **kwargs):
+        super(AttractionsListScreen, self).__init__(**kwargs)
+        self.name = "attractions_list"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Atrações do Parque"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.attractions_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.attractions_grid.bind(minimum_height=self.attractions_grid.setter("height"))
+        scroll_view.add_widget(self.attractions_grid)
+        layout.add_widget(scroll_view)
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_attractions()
+
+    def load_attractions(self):
+        self.attractions_grid.clear_widgets()
+        attractions = App.get_running_app().backend.catalog("atracoes")
+
+        if not attractions:
+            self.attractions_grid.add_widget(Label(text="Nenhuma atração disponível no momento.", color=COLOR_TEXT_DARK))
+            return
+
+        for attraction in attractions:
+            item = BoxLayout(orientation="horizontal", size_hint_y=None, height=150, spacing=10, padding=5)
+            
+            # Image
+            img_path = attraction["local_image_path"] if attraction["local_image_path"] and os.path.exists(attraction["local_image_path"]) else os.path.join(ASSETS_PATH, "attraction_placeholder.png")
+            if os.path.exists(img_path):
+                img = KivyImage(source=img_path, size_hint_x=0.4)
+            else:
+                img = Label(text="Imagem\nNão Disponível", size_hint_x=0.4, color=COLOR_TEXT_DARK)
+            item.add_widget(img)
+            
+            # Info
+            info_layout = BoxLayout(orientation="vertical", size_hint_x=0.6, spacing=5)
+            info_layout.add_widget(Label(
+                text=attraction["nome"],
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            info_layout.add_widget(Label(
+                text=attraction["descricao_curta"] if attraction["descricao_curta"] else "Sem descrição",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            info_layout.add_widget(Label(
+                text=f"Tipo: {attraction['tipo_atracao']} | Status: {attraction['status']}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            
+            # Details button
+            details_button = StyledButton(text="Ver Detalhes", size_hint_y=None, height=40)
+            details_button.bind(on_press=lambda _, id=attraction["id"]: self.show_details(id))
+            info_layout.add_widget(details_button)
+            
+            item.add_widget(info_layout)
+            self.attractions_grid.add_widget(item)
+
+    def show_details(self, attraction_id):
+        app = App.get_running_app()
+        app.selected_attraction_id = attraction_id
+        app.previous_screen = self.name
+        self.manager.current = "attraction_detail"
+
+
+
+class AttractionDetailScreen(Screen):
+    def __init__(self, **kwargs):
+        super(AttractionDetailScreen, self).__init__(**kwargs)
+        self.name = "attraction_detail"
+        self.layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+
+        # Header with title and back button
+        self.header_label = HeaderLabel(text="Detalhes da Atração")
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(self.header_label)
+        
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "attractions_list"))
+        header_layout.add_widget(back_button)
+        
+        self.layout.add_widget(header_layout)
+
+        # Scrollable content area
+        self.scroll_view = ScrollView(size_hint=(1, 1))
+        self.details_content = BoxLayout(
+            orientation="vertical", 
+            size_hint_y=None, 
+            spacing=10,
+            padding=10
+        )
+        self.details_content.bind(minimum_height=self.details_content.setter('height'))
+        self.scroll_view.add_widget(self.details_content)
+        self.layout.add_widget(self.scroll_view)
+
+        self.add_widget(self.layout)
+        
+        # Average rating component
+        self.avg_rating_label = Label(
+            text="Avaliação Média: N/A",
+            font_size="15sp",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+        
+        # Status label for actions
+        self.status_label = Label(
+            text="",
+            font_size="14sp",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+
+    def on_enter(self, *args):
+        self.load_attraction_details()
+
+    def load_attraction_details(self):
+        self.details_content.clear_widgets()
+        attraction_id = App.get_running_app().selected_attraction_id
+        if not attraction_id:
+            self.details_content.add_widget(Label(text="Nenhuma atração selecionada.", color=COLOR_TEXT_DARK))
+            return
+
+        try:
+            result = App.get_running_app().backend.details("atracoes", attraction_id)
+        except ServiceError:
+            self.details_content.add_widget(Label(text="Detalhes da atração não encontrados.", color=COLOR_TEXT_DARK))
+            return
+        attraction, rating_data = result["item"], result["avaliacao"]
+
+        self.header_label.text = attraction["nome"]
+
+        # Attraction image
+        if attraction["local_image_path"] and os.path.exists(attraction["local_image_path"]):
+            self.details_content.add_widget(KivyImage(
+                source=attraction["local_image_path"],
+                size_hint_y=None,
+                height=250
+            ))
+        else:
+            placeholder_img = os.path.join(ASSETS_PATH, "attraction_placeholder.png")
+            if os.path.exists(placeholder_img):
+                self.details_content.add_widget(KivyImage(
+                    source=placeholder_img,
+                    size_hint_y=None,
+                    height=250
+                ))
+            else:
+                self.details_content.add_widget(Label(
+                    text="Sem Imagem Disponível",
+                    size_hint_y=None,
+                    height=200,
+                    color=COLOR_TEXT_DARK
+                ))
+
+        # Attraction details
+        self.details_content.add_widget(Label(
+            text=attraction["nome"],
+            font_size='20sp',
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40,
+            halign='left',
+            text_size=(Window.width * 0.85, None)
+        ))
+
+        desc_label = Label(
+            text=attraction["descricao_detalhada"] if attraction["descricao_detalhada"] else "Descrição não disponível.",
+            font_size='15sp',
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            halign='left',
+            text_size=(Window.width * 0.85, None)
+        )
+
+        desc_label.bind(texture_size=desc_label.setter('size'))
+        self.details_content.add_widget(desc_label)
+
+        # Technical details
+        tech_details = [
+            f"Tipo: {attraction['tipo_atracao']}",
+            f"Status: {attraction['status']}",
+            f"Localização: {attraction['localizacao_mapa']}",
+            f"Altura mínima: {attraction['altura_minima_cm']} cm" if attraction['altura_minima_cm'] else "Sem restrição de altura mínima",
+            f"Idade mínima: {attraction['idade_minima_anos']} anos" if attraction['idade_minima_anos'] else "Sem restrição de idade mínima",
+            f"Nível de emoção: {attraction['nivel_emocao']}",
+            f"Acessibilidade: {attraction['acessibilidade']}"
+        ]
+
+        for detail in tech_details:
+            self.details_content.add_widget(Label(
+                text=detail,
+                font_size='15sp',
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=30,
+                halign='left',
+                text_size=(Window.width * 0.85, None)
+            ))
+
+        # Average rating
+        if rating_data and rating_data["media"] is not None:
+            self.avg_rating_label.text = f"Avaliação Média: {rating_data['media']:.1f}/5 ({rating_data['total_avaliacoes']} avaliações)"
+        else:
+            self.avg_rating_label.text = "Avaliação Média: Nenhuma avaliação ainda."
+        self.details_content.add_widget(self.avg_rating_label)
+
+        # Action buttons
+        action_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        
+        # FastPass button
+        fastpass_button = StyledButton(
+            text="Agendar FastPass",
+            size_hint_x=0.5
+        )
+        fastpass_button.bind(on_press=self.request_fastpass)
+        
+        # Check-in button
+        checkin_button = StyledButton(
+            text="Fazer Check-in",
+            size_hint_x=0.5
+        )
+        checkin_button.bind(on_press=self.do_checkin)
+        
+        action_layout.add_widget(fastpass_button)
+        action_layout.add_widget(checkin_button)
+        self.details_content.add_widget(action_layout)
+
+        # Rating button
+        rate_button = StyledButton(
+            text="Avaliar Atração",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        rate_button.bind(on_press=self.open_rating_popup)
+        self.details_content.add_widget(rate_button)
+        
+        # Status label for actions
+        self.details_content.add_widget(self.status_label)
+
+    def request_fastpass(self, instance):
+        self.status_label.text = "Funcionalidade FastPass em desenvolvimento."
+
+    def do_checkin(self, instance):
+        app = App.get_running_app()
+        user_id = app.user_id
+        attraction_id = app.selected_attraction_id
+        
+        if not user_id:
+            self.status_label.text = "Você precisa estar logado para fazer check-in."
+            return
+            
+        try:
+            new_badges = app.backend.do_checkin(user_id, attraction_id)
+            self.status_label.text = f"Check-in realizado com sucesso! +{services.CHECKIN_POINTS} pontos"
+            if new_badges:
+                self.status_label.text += " | Nova conquista: " + ", ".join(rule.nome for rule in new_badges)
+        except ServiceError as e:
+            self.status_label.text = str(e)
+        except Exception as e:
+            self.status_label.text = f"Erro ao fazer check-in: {e}"
+
+    def open_rating_popup(self, instance):
+        attraction_id = App.get_running_app().selected_attraction_id
+        if attraction_id:
+            popup = RatingPopup(id_referencia=attraction_id, tipo_referencia="atracao")
+            popup.open()
@@ -0,0 +1,137 @@
+"""Login and sign-up screens."""
+
+import os
+
+from kivy.app import App
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.textinput import TextInput
+
+from infinity_park.config import API_URL, APP_NAME, ASSETS_PATH
+from infinity_park.services import ServiceError
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK,
+                                      HeaderLabel, StyledButton)
+
+
+class LoginScreen(Screen):
+    def __init__(self, **kwargs):
+        super(LoginScreen, self).__init__(**kwargs)
+        self.name = "login"
+        layout = BoxLayout(orientation="vertical", padding=30, spacing=15)
+        
+        # Logo
+        logo_path = os.path.join(ASSETS_PATH, "logo_infinity_park_215.png")
+        if os.path.exists(logo_path):
+            logo_img = KivyImage(source=logo_path, size_hint_y=None, height=150)
+            layout.add_widget(logo_img)
+        else:
+            layout.add_widget(Label(text=APP_NAME, font_size="32sp", color=COLOR_PRIMARY, size_hint_y=None, height=60))
+
+        layout.add_widget(Label(text="Login de Usuario", font_size="20sp", color=COLOR_TEXT_DARK))
+        self.username_input = TextInput(hint_text="Usuario", multiline=False, size_hint_y=None, height=45, font_size="16sp")
+        self.password_input = TextInput(hint_text="Senha", password=True, multiline=False, size_hint_y=None, height=45, font_size="16sp")
+        
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        login_button = StyledButton(text="Entrar")
+        login_button.bind(on_press=self.login_user)
+        register_button = Button(text="Registrar", background_color=COLOR_SECONDARY, color=COLOR_TEXT_DARK, font_size="16sp")
+        register_button.bind(on_press=lambda x: setattr(self.manager, "current", "register"))
+        buttons_layout.add_widget(login_button)
+        buttons_layout.add_widget(register_button)
+
+        self.status_label = Label(text="", size_hint_y=None, height=30, color=COLOR_ACCENT)
+
+        layout.add_widget(self.username_input)
+        layout.add_widget(self.password_input)
+        layout.add_widget(buttons_layout)
+        layout.add_widget(self.status_label)
+        
+        # Add admin login info for testing
+        admin_info = Label(
+            text="Admin: usuario=admin, senha=admin123", 
+            font_size="14sp", 
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        )
+        layout.add_widget(admin_info)
+        
+        self.add_widget(layout)
+
+    def login_user(self, instance):
+        app = App.get_running_app()
+        try:
+            user = app.backend.login_user(self.username_input.text, self.password_input.text)
+        except ServiceError as e:
+            self.status_label.text = str(e)
+            return
+        except Exception as e:
+            self.status_label.text = f"Erro ao entrar: {e}"
+            return
+        
+        if user["tipo_perfil"] == "Administrador" and API_URL:
+            # The admin screens edit the local database, which a client kiosk does not serve from
+            app.backend.logout()
+            self.status_label.text = "O painel administrativo só está disponível no servidor."
+            return
+        
+        app.user_id = user["id"]
+        app.user_profile = user["tipo_perfil"]
+        self.username_input.text = ""
+        self.password_input.text = ""
+        self.status_label.text = ""
+        if app.user_profile == "Administrador":
+            self.manager.current = "admin_home"
+        else:
+            self.manager.current = "user_home"
+
+
+
+class RegisterScreen(Screen):
+    def __init__(self, **kwargs):
+        super(RegisterScreen, self).__init__(**kwargs)
+        self.name = "register"
+        layout = BoxLayout(orientation="vertical", padding=30, spacing=15)
+        layout.add_widget(HeaderLabel(text="Cadastro de Novo Usuario"))
+
+        self.username_input = TextInput(hint_text="Nome de Usuario", multiline=False, size_hint_y=None, height=45)
+        self.email_input = TextInput(hint_text="Email para Recuperacao", multiline=False, size_hint_y=None, height=45)
+        self.password_input = TextInput(hint_text="Senha", password=True, multiline=False, size_hint_y=None, height=45)
+        self.confirm_password_input = TextInput(hint_text="Confirmar Senha", password=True, multiline=False, size_hint_y=None, height=45)
+        
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        register_button = StyledButton(text="Registrar")
+        register_button.bind(on_press=self.register_user)
+        back_button = Button(text="Voltar para Login", background_color=COLOR_SECONDARY, color=COLOR_TEXT_DARK)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "login"))
+        buttons_layout.add_widget(register_button)
+        buttons_layout.add_widget(back_button)
+
+        self.status_label = Label(text="", size_hint_y=None, height=30, color=COLOR_ACCENT)
+
+        layout.add_widget(self.username_input)
+        layout.add_widget(self.email_input)
+        layout.add_widget(self.password_input)
+        layout.add_widget(self.confirm_password_input)
+        layout.add_widget(buttons_layout)
+        layout.add_widget(self.status_label)
+        self.add_widget(layout)
+
+    def register_user(self, instance):
+        try:
+            App.get_running_app().backend.register_user(
+                self.username_input.text, self.email_input.text,
+                self.password_input.text, self.confirm_password_input.text
+            )
+            self.status_label.text = "Usuario cadastrado com sucesso! Faca o login."
+            self.username_input.text = ""
+            self.email_input.text = ""
+            self.password_input.text = ""
+            self.confirm_password_input.text = ""
+        except ServiceError as e:
+            self.status_label.text = str(e)
+        except Exception as e:
+            self.status_label.text = f"Erro ao cadastrar: {e}"
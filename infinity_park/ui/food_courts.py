@@ -0,0 +1,323 @@
+"""Food court list and detail screens."""
+
+import os
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+
+from infinity_park.config import ASSETS_PATH
+from infinity_park.services import ServiceError
+from infinity_park.ui.ratings import RatingPopup
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK,
+                                      HeaderLabel, StyledButton)
+
+
+class FoodCourtsListScreen(Screen):
+    def __init__(self, **kwargs):
+        super(FoodCourtsListScreen, self).__init__(**kwargs)
+        self.name = "food_courts_list"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Lanchonetes do Parque"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.food_courts_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.food_courts_grid.bind(minimum_height=self.food_courts_grid.setter("height"))
+        scroll_view.add_widget(self.food_courts_grid)
+        layout.add_widget(scroll_view)
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_food_courts()
+
+    def load_food_courts(self):
+        self.food_courts_grid.clear_widgets()
+        food_courts = App.get_running_app().backend.catalog("lanchonetes")
+
+        if not food_courts:
+            self.food_courts_grid.add_widget(Label(text="Nenhuma lanchonete disponível no momento.", color=COLOR_TEXT_DARK))
+            return
+
+        for food_court in food_courts:
+            item = BoxLayout(orientation="horizontal", size_hint_y=None, height=150, spacing=10, padding=5)
+            
+            # Image
+            img_path = food_court["url_imagem_logo"] if food_court["url_imagem_logo"] and os.path.exists(food_court["url_imagem_logo"]) else os.path.join(ASSETS_PATH, "food_court_placeholder.png")
+            if os.path.exists(img_path):
+                img = KivyImage(source=img_path, size_hint_x=0.4)
+            else:
+                img = Label(text="Imagem\nNão Disponível", size_hint_x=0.4, color=COLOR_TEXT_DARK)
+            item.add_widget(img)
+            
+            # Info
+            info_layout = BoxLayout(orientation="vertical", size_hint_x=0.6, spacing=5)
+            info_layout.add_widget(Label(
+                text=food_court["nome"],
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            info_layout.add_widget(Label(
+                text=food_court["descricao"] if food_court["descricao"] else "Sem descrição",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            info_layout.add_widget(Label(
+                text=f"Tipo: {food_court['tipo_culinaria']} | Horário: {food_court['horario_funcionamento']}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            
+            # Details button
+            details_button = StyledButton(text="Ver Cardápio", size_hint_y=None, height=40)
+            details_button.bind(on_press=lambda _, id=food_court["id"]: self.show_menu(id))
+            info_layout.add_widget(details_button)
+            
+            item.add_widget(info_layout)
+            self.food_courts_grid.add_widget(item)
+
+    def show_menu(self, food_court_id):
+        app = App.get_running_app()
+        app.selected_lanchonete_id = food_court_id
+        app.previous_screen = self.name
+        self.manager.current = "food_court_detail"
+
+
+
+class FoodCourtDetailScreen(Screen):
+    def __init__(self, **kwargs):
+        super(FoodCourtDetailScreen, self).__init__(**kwargs)
+        self.name = "food_court_detail"
+        self.layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+
+        # Header with title and back button
+        self.header_label = HeaderLabel(text="Cardápio")
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(self.header_label)
+        
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "food_courts_list"))
+        header_layout.add_widget(back_button)
+        
+        self.layout.add_widget(header_layout)
+
+        # Scrollable content area
+        self.scroll_view = ScrollView(size_hint=(1, 1))
+        self.menu_content = BoxLayout(
+            orientation="vertical", 
+            size_hint_y=None, 
+            spacing=10,
+            padding=10
+        )
+        self.menu_content.bind(minimum_height=self.menu_content.setter('height'))
+        self.scroll_view.add_widget(self.menu_content)
+        self.layout.add_widget(self.scroll_view)
+
+        self.add_widget(self.layout)
+        
+        # Average rating component
+        self.avg_rating_label = Label(
+            text="Avaliação Média: N/A",
+            font_size="15sp",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+
+    def on_enter(self, *args):
+        self.load_menu()
+
+    def load_menu(self):
+        self.menu_content.clear_widgets()
+        food_court_id = App.get_running_app().selected_lanchonete_id
+        if not food_court_id:
+            self.menu_content.add_widget(Label(text="Nenhuma lanchonete selecionada.", color=COLOR_TEXT_DARK))
+            return
+
+        try:
+            result = App.get_running_app().backend.details("lanchonetes", food_court_id)
+        except ServiceError:
+            self.menu_content.add_widget(Label(text="Lanchonete não encontrada.", color=COLOR_TEXT_DARK))
+            return
+        food_court, categories, rating_data = result["item"], result["cardapio"], result["avaliacao"]
+            
+        self.header_label.text = f"Cardápio - {food_court['nome']}"
+        
+        # Food court info
+        if food_court["url_imagem_logo"] and os.path.exists(food_court["url_imagem_logo"]):
+            self.menu_content.add_widget(KivyImage(
+                source=food_court["url_imagem_logo"],
+                size_hint_y=None,
+                height=150
+            ))
+        
+        self.menu_content.add_widget(Label(
+            text=food_court["nome"],
+            font_size="20sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40
+        ))
+        
+        self.menu_content.add_widget(Label(
+            text=food_court["descricao"] if food_court["descricao"] else "Sem descrição",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        self.menu_content.add_widget(Label(
+            text=f"Tipo: {food_court['tipo_culinaria']} | Horário: {food_court['horario_funcionamento']}",
+            font_size="14sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        ))
+        
+        # Menu items
+        if categories:
+            self.menu_content.add_widget(Label(
+                text="Cardápio",
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                size_hint_y=None,
+                height=40,
+                halign="left"
+            ))
+            
+            for category in categories:
+                # Category header
+                self.menu_content.add_widget(Label(
+                    text=category["categoria"],
+                    font_size="16sp",
+                    bold=True,
+                    color=COLOR_ACCENT,
+                    size_hint_y=None,
+                    height=30,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                for item in category["itens"]:
+                    item_layout = BoxLayout(
+                        orientation="horizontal", 
+                        size_hint_y=None, 
+                        height=80, 
+                        spacing=10,
+                        padding=5
+                    )
+                    
+                    # Item image if available
+                    if item["url_imagem_item"] and os.path.exists(item["url_imagem_item"]):
+                        img = KivyImage(
+                            source=item["url_imagem_item"],
+                            size_hint_x=0.2
+                        )
+                        item_layout.add_widget(img)
+                    
+                    # Item details
+                    item_info = BoxLayout(
+                        orientation="vertical",
+                        size_hint_x=0.6 if item["url_imagem_item"] else 0.8
+                    )
+                    
+                    item_info.add_widget(Label(
+                        text=item["nome_item"],
+                        font_size="16sp",
+                        bold=True,
+                        color=COLOR_TEXT_DARK,
+                        halign="left",
+                        size_hint_y=None,
+                        height=25,
+                        text_size=(Window.width * 0.5, None)
+                    ))
+                    
+                    if item["descricao_item"]:
+                        desc_label = Label(
+                            text=item["descricao_item"],
+                            font_size="14sp",
+                            color=COLOR_TEXT_DARK,
+                            halign="left",
+                            size_hint_y=None,
+                            text_size=(Window.width * 0.5, None)
+                        )
+                        desc_label.bind(texture_size=desc_label.setter('size'))
+                        item_info.add_widget(desc_label)
+                    
+                    item_layout.add_widget(item_info)
+                    
+                    # Price
+                    price_label = Label(
+                        text=f"R$ {item['preco']:.2f}".replace(".", ","),
+                        font_size="16sp",
+                        bold=True,
+                        color=COLOR_ACCENT,
+                        size_hint_x=0.2,
+                        halign="right",
+                        text_size=(Window.width * 0.2, None)
+                    )
+                    item_layout.add_widget(price_label)
+                    
+                    self.menu_content.add_widget(item_layout)
+                    
+                    # Separator
+                    separator = BoxLayout(size_hint_y=None, height=1)
+                    with separator.canvas:
+                        Color(0.9, 0.9, 0.9, 1)
+                        Rectangle(pos=separator.pos, size=separator.size)
+                    self.menu_content.add_widget(separator)
+        else:
+            self.menu_content.add_widget(Label(
+                text="Cardápio não disponível no momento.",
+                font_size="16sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=40
+            ))
+        
+        # Average rating
+        if rating_data and rating_data["media"] is not None:
+            self.avg_rating_label.text = f"Avaliação Média: {rating_data['media']:.1f}/5 ({rating_data['total_avaliacoes']} avaliações)"
+        else:
+            self.avg_rating_label.text = "Avaliação Média: Nenhuma avaliação ainda."
+        self.menu_content.add_widget(self.avg_rating_label)
+        
+        # Rating button
+        rate_button = StyledButton(
+            text="Avaliar Lanchonete",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        rate_button.bind(on_press=self.open_rating_popup)
+        self.menu_content.add_widget(rate_button)
+
+    def open_rating_popup(self, instance):
+        food_court_id = App.get_running_app().selected_lanchonete_id
+        if food_court_id:
+            popup = RatingPopup(id_referencia=food_court_id, tipo_referencia="lanchonete")
+            popup.open()
@@ -0,0 +1,79 @@
+"""Visitor home screen."""
+
+import os
+
+from kivy.app import App
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+
+from infinity_park.config import APP_NAME, ASSETS_PATH
+from infinity_park.ui.widgets import (COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK, HeaderLabel,
+                                      StyledButton)
+
+
+class UserHomeScreen(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.name = "user_home"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=8)
+        
+        layout.add_widget(HeaderLabel(text=f"Bem-vindo ao {APP_NAME}!"))
+        
+        scroll = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        button_grid = GridLayout(cols=2, spacing=10, size_hint_y=None, padding=10)
+        button_grid.bind(minimum_height=button_grid.setter("height"))
+
+        buttons_data = [
+            ("Ver Atracoes", "attractions_list", "atracao_icon.png"),
+            ("Ver Shows", "shows_list", "show_icon.png"),
+            ("Ingressos", "tickets_list", "ticket_icon.png"),
+            ("Lanchonetes", "food_courts_list", "food_icon.png"),
+            ("Mapa do Parque", "park_map", "map_icon.png"),
+            ("Sobre o Parque", "about_park", "info_icon.png"),
+            ("Avisos Importantes", "warnings_list", "warning_icon.png"),
+            ("Meu Perfil", "my_profile", "profile_icon.png"),
+            ("Criar Itinerario", "create_itinerary", "itinerary_icon.png"),
+            ("Ver Meu Itinerario", "my_itinerary", "my_itinerary_icon.png")
+        ]
+
+        for text, screen_name, icon_name in buttons_data:
+            btn_item = BoxLayout(orientation="vertical", size_hint_y=None, height=120, spacing=5)
+            
+            icon_path = os.path.join(ASSETS_PATH, icon_name)
+            if os.path.exists(icon_path):
+                img = KivyImage(source=icon_path, size_hint_y=None, height=60)
+            else:
+                img = Label(text="Ícone", size_hint_y=None, height=60)
+            
+            btn = StyledButton(text=text, size_hint_y=None, height=50)
+            btn.bind(on_press=lambda _, sn=screen_name: self.go_to_screen(sn))
+            
+            btn_item.add_widget(img)
+            btn_item.add_widget(btn)
+            button_grid.add_widget(btn_item)
+
+        scroll.add_widget(button_grid)
+        layout.add_widget(scroll)
+
+        logout_btn = Button(text="Logout", size_hint_y=None, height=50,
+                          background_color=COLOR_SECONDARY, color=COLOR_TEXT_DARK)
+        logout_btn.bind(on_press=self.logout)
+        layout.add_widget(logout_btn)
+        
+        self.add_widget(layout)
+
+    def go_to_screen(self, screen_name):
+        App.get_running_app().previous_screen = self.name
+        self.manager.current = screen_name
+
+    def logout(self, instance):
+        app = App.get_running_app()
+        app.backend.logout()
+        app.user_id = None
+        app.user_profile = None
+        self.manager.current = "login"
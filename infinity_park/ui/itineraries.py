@@ -0,0 +1,542 @@
+"""Itinerary creation and listing screens."""
+
+from datetime import date, datetime
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.spinner import Spinner
+from kivy.uix.textinput import TextInput
+
+from infinity_park.services import ServiceError
+from infinity_park.ui.widgets import COLOR_ACCENT, COLOR_PRIMARY, COLOR_TEXT_DARK, HeaderLabel, StyledButton
+
+
+class CreateItineraryScreen(Screen):
+    def __init__(self, **kwargs):
+        super(CreateItineraryScreen, self).__init__(**kwargs)
+        self.name = "create_itinerary"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Criar Itinerário"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Formulário de criação de itinerário
+        form_layout = BoxLayout(orientation="vertical", spacing=15, padding=10)
+        
+        # Nome do itinerário
+        form_layout.add_widget(Label(
+            text="Nome do Itinerário:",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        self.name_input = TextInput(
+            hint_text="Ex: Meu dia no parque",
+            multiline=False,
+            size_hint_y=None,
+            height=40
+        )
+        form_layout.add_widget(self.name_input)
+        
+        # Data da visita
+        form_layout.add_widget(Label(
+            text="Data da Visita:",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        # Create a date spinner with next 30 days
+        import datetime as dt
+        self.date_spinner = Spinner(
+            text=date.today().strftime("%d/%m/%Y"),
+            values=[
+                (date.today() + dt.timedelta(days=i)).strftime("%d/%m/%Y")
+                for i in range(30)
+            ],
+            size_hint_y=None,
+            height=40
+        )
+        form_layout.add_widget(self.date_spinner)
+        
+        # Lista de atrações disponíveis
+        form_layout.add_widget(Label(
+            text="Selecione as Atrações:",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        # Carregar atrações do banco de dados
+        self.attractions_layout = GridLayout(cols=1, spacing=5, size_hint_y=None)
+        self.attractions_layout.bind(minimum_height=self.attractions_layout.setter("height"))
+        
+        attractions_scroll = ScrollView(size_hint_y=None, height=200)
+        attractions_scroll.add_widget(self.attractions_layout)
+        form_layout.add_widget(attractions_scroll)
+        
+        # Botão para adicionar atração selecionada ao itinerário
+        add_attraction_button = StyledButton(
+            text="Adicionar Atração Selecionada",
+            size_hint_y=None,
+            height=40
+        )
+        add_attraction_button.bind(on_press=self.add_selected_attraction)
+        form_layout.add_widget(add_attraction_button)
+        
+        # Lista de itens do itinerário
+        form_layout.add_widget(Label(
+            text="Seu Itinerário:",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        self.itinerary_layout = GridLayout(cols=1, spacing=5, size_hint_y=None)
+        self.itinerary_layout.bind(minimum_height=self.itinerary_layout.setter("height"))
+        
+        itinerary_scroll = ScrollView(size_hint_y=None, height=200)
+        itinerary_scroll.add_widget(self.itinerary_layout)
+        form_layout.add_widget(itinerary_scroll)
+        
+        # Botão para salvar itinerário
+        save_button = StyledButton(
+            text="Salvar Itinerário",
+            size_hint_y=None,
+            height=50
+        )
+        save_button.bind(on_press=self.save_itinerary)
+        form_layout.add_widget(save_button)
+        
+        # Status message
+        self.status_label = Label(
+            text="",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+        form_layout.add_widget(self.status_label)
+        
+        layout.add_widget(form_layout)
+        self.add_widget(layout)
+        
+        # Lista para armazenar os itens do itinerário
+        self.itinerary_items = []
+        self.selected_attraction = None
+
+    def on_enter(self, *args):
+        self.load_attractions()
+        self.update_itinerary_list()
+
+    def load_attractions(self):
+        self.attractions_layout.clear_widgets()
+        
+        attractions = [attraction for attraction in App.get_running_app().backend.catalog("atracoes")
+                       if attraction["status"] == "Operacional"]
+        
+        if not attractions:
+            self.attractions_layout.add_widget(Label(
+                text="Nenhuma atração disponível no momento.",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=40
+            ))
+            return
+        
+        for attraction in attractions:
+            item = BoxLayout(orientation="horizontal", size_hint_y=None, height=40, spacing=10)
+            
+            select_button = Button(
+                text="Selecionar",
+                size_hint_x=0.3,
+                background_color=COLOR_PRIMARY
+            )
+            select_button.bind(on_press=lambda _, id=attraction["id"], name=attraction["nome"]: self.select_attraction(id, name))
+            
+            item.add_widget(select_button)
+            
+            item.add_widget(Label(
+                text=f"{attraction['nome']} ({attraction['tipo_atracao']})",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_x=0.7,
+                halign="left",
+                text_size=(Window.width * 0.6, None)
+            ))
+            
+            self.attractions_layout.add_widget(item)
+    
+    def select_attraction(self, attraction_id, attraction_name):
+        self.selected_attraction = {
+            "id": attraction_id,
+            "name": attraction_name
+        }
+        self.status_label.text = f"Atração selecionada: {attraction_name}"
+    
+    def add_selected_attraction(self, instance):
+        if not self.selected_attraction:
+            self.status_label.text = "Selecione uma atração primeiro."
+            return
+        
+        # Adicionar horário padrão (pode ser personalizado depois)
+        current_time = datetime.now().strftime("%H:%M")
+        
+        self.itinerary_items.append({
+            "id": self.selected_attraction["id"],
+            "name": self.selected_attraction["name"],
+            "time": current_time,
+            "type": "atracao"
+        })
+        
+        self.update_itinerary_list()
+        self.status_label.text = f"Atração {self.selected_attraction['name']} adicionada ao itinerário."
+        self.selected_attraction = None
+    
+    def update_itinerary_list(self):
+        self.itinerary_layout.clear_widgets()
+        
+        if not self.itinerary_items:
+            self.itinerary_layout.add_widget(Label(
+                text="Seu itinerário está vazio. Adicione atrações.",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=40
+            ))
+            return
+        
+        for i, item in enumerate(self.itinerary_items):
+            item_layout = BoxLayout(orientation="horizontal", size_hint_y=None, height=40, spacing=10)
+            
+            # Botão para remover item
+            remove_button = Button(
+                text="X",
+                size_hint_x=0.1,
+                background_color=(0.9, 0.2, 0.2, 1)
+            )
+            remove_button.bind(on_press=lambda _, idx=i: self.remove_item(idx))
+            
+            item_layout.add_widget(remove_button)
+            
+            # Horário
+            time_input = TextInput(
+                text=item["time"],
+                multiline=False,
+                size_hint_x=0.2
+            )
+            time_input.bind(text=lambda instance, value, idx=i: self.update_item_time(idx, value))
+            item_layout.add_widget(time_input)
+            
+            # Nome da atração
+            item_layout.add_widget(Label(
+                text=item["name"],
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_x=0.7,
+                halign="left",
+                text_size=(Window.width * 0.5, None)
+            ))
+            
+            self.itinerary_layout.add_widget(item_layout)
+    
+    def update_item_time(self, index, value):
+        if 0 <= index < len(self.itinerary_items):
+            self.itinerary_items[index]["time"] = value
+    
+    def remove_item(self, index):
+        if 0 <= index < len(self.itinerary_items):
+            del self.itinerary_items[index]
+            self.update_itinerary_list()
+    
+    def save_itinerary(self, instance):
+        app = App.get_running_app()
+        user_id = app.user_id
+        
+        if not user_id:
+            self.status_label.text = "Você precisa estar logado para salvar um itinerário."
+            return
+        
+        # Converter data para formato YYYY-MM-DD
+        visit_date = datetime.strptime(self.date_spinner.text, "%d/%m/%Y").strftime("%Y-%m-%d")
+        items = [(item["type"], item["id"], item["time"]) for item in self.itinerary_items]
+        
+        try:
+            app.backend.save_itinerary(user_id, self.name_input.text, visit_date, items)
+            self.status_label.text = "Itinerário salvo com sucesso!"
+            
+            # Limpar formulário
+            self.name_input.text = ""
+            self.itinerary_items = []
+            self.update_itinerary_list()
+            
+        except ServiceError as e:
+            self.status_label.text = str(e)
+        except Exception as e:
+            self.status_label.text = f"Erro ao salvar itinerário: {e}"
+
+
+
+class MyItineraryScreen(Screen):
+    def __init__(self, **kwargs):
+        super(MyItineraryScreen, self).__init__(**kwargs)
+        self.name = "my_itinerary"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Meus Itinerários"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Lista de itinerários
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.itineraries_layout = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.itineraries_layout.bind(minimum_height=self.itineraries_layout.setter("height"))
+        scroll_view.add_widget(self.itineraries_layout)
+        layout.add_widget(scroll_view)
+        
+        # Botão para criar novo itinerário
+        create_button = StyledButton(
+            text="Criar Novo Itinerário",
+            size_hint_y=None,
+            height=50
+        )
+        create_button.bind(on_press=lambda x: setattr(self.manager, "current", "create_itinerary"))
+        layout.add_widget(create_button)
+        
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_itineraries()
+
+    def load_itineraries(self):
+        self.itineraries_layout.clear_widgets()
+        
+        user_id = App.get_running_app().user_id
+        if not user_id:
+            self.itineraries_layout.add_widget(Label(
+                text="Você precisa estar logado para ver seus itinerários.",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=50
+            ))
+            return
+        
+        itineraries = App.get_running_app().backend.itineraries(user_id)
+        
+        if not itineraries:
+            self.itineraries_layout.add_widget(Label(
+                text="Você ainda não criou nenhum itinerário.",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=50
+            ))
+            return
+        
+        for itinerary in itineraries:
+            # Formatar datas
+            creation_date = datetime.strptime(itinerary["data_criacao"], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y")
+            visit_date = datetime.strptime(itinerary["data_visita"], "%Y-%m-%d").strftime("%d/%m/%Y")
+            
+            items = itinerary["itens"]
+            
+            # Criar card do itinerário
+            itinerary_card = BoxLayout(
+                orientation="vertical",
+                size_hint_y=None,
+                padding=10,
+                spacing=5
+            )
+            itinerary_card.bind(minimum_height=itinerary_card.setter("height"))
+            
+            # Adicionar fundo
+            with itinerary_card.canvas.before:
+                Color(0.95, 0.95, 0.95, 1)
+                self.rect = Rectangle(pos=itinerary_card.pos, size=itinerary_card.size)
+            itinerary_card.bind(pos=self.update_rect, size=self.update_rect)
+            
+            # Cabeçalho do itinerário
+            header = BoxLayout(orientation="vertical", size_hint_y=None, height=80)
+            
+            header.add_widget(Label(
+                text=itinerary["nome"],
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                size_hint_y=None,
+                height=30,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+            
+            header.add_widget(Label(
+                text=f"Data da visita: {visit_date}",
+                font_size="15sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=25,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+            
+            header.add_widget(Label(
+                text=f"Criado em: {creation_date}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=25,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+            
+            itinerary_card.add_widget(header)
+            
+            # Lista de itens
+            if items:
+                items_layout = GridLayout(cols=1, spacing=5, size_hint_y=None)
+                items_layout.bind(minimum_height=items_layout.setter("height"))
+                
+                for item in items:
+                    item_row = BoxLayout(orientation="horizontal", size_hint_y=None, height=30, spacing=10)
+                    
+                    item_row.add_widget(Label(
+                        text=item["horario_previsto"],
+                        font_size="14sp",
+                        color=COLOR_ACCENT,
+                        size_hint_x=0.2,
+                        halign="left",
+                        text_size=(Window.width * 0.15, None)
+                    ))
+                    
+                    item_row.add_widget(Label(
+                        text=item["nome_item"],
+                        font_size="14sp",
+                        color=COLOR_TEXT_DARK,
+                        size_hint_x=0.8,
+                        halign="left",
+                        text_size=(Window.width * 0.7, None)
+                    ))
+                    
+                    items_layout.add_widget(item_row)
+                    items_layout.height += 30
+                
+                itinerary_card.add_widget(items_layout)
+                itinerary_card.height = 80 + items_layout.height + 20  # header + items + padding
+            else:
+                itinerary_card.add_widget(Label(
+                    text="Nenhum item adicionado a este itinerário.",
+                    font_size="14sp",
+                    color=COLOR_TEXT_DARK,
+                    size_hint_y=None,
+                    height=30
+                ))
+                itinerary_card.height = 80 + 30 + 20  # header + message + padding
+            
+            # Botões de ação
+            buttons_layout = BoxLayout(orientation="horizontal", size_hint_y=None, height=40, spacing=10)
+            
+            edit_button = Button(
+                text="Editar",
+                background_color=COLOR_PRIMARY,
+                size_hint_x=0.5
+            )
+            edit_button.bind(on_press=lambda _, id=itinerary["id"]: self.edit_itinerary(id))
+            
+            delete_button = Button(
+                text="Excluir",
+                background_color=(0.9, 0.2, 0.2, 1),
+                size_hint_x=0.5
+            )
+            delete_button.bind(on_press=lambda _, id=itinerary["id"]: self.delete_itinerary(id))
+            
+            buttons_layout.add_widget(edit_button)
+            buttons_layout.add_widget(delete_button)
+            
+            itinerary_card.add_widget(buttons_layout)
+            itinerary_card.height += 40 + 10  # buttons + padding
+            
+            self.itineraries_layout.add_widget(itinerary_card)
+    
+    def update_rect(self, instance, value):
+        self.rect.pos = instance.pos
+        self.rect.size = instance.size
+    
+    def edit_itinerary(self, itinerary_id):
+        # Implementação futura - por enquanto apenas mostra mensagem
+        popup = Popup(
+            title="Funcionalidade em Desenvolvimento",
+            content=Label(text="A edição de itinerários será implementada em breve."),
+            size_hint=(0.8, 0.4)
+        )
+        popup.open()
+    
+    def delete_itinerary(self, itinerary_id):
+        # Confirmar exclusão
+        content = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        content.add_widget(Label(
+            text="Tem certeza que deseja excluir este itinerário?",
+            font_size="16sp"
+        ))
+        
+        buttons = BoxLayout(size_hint_y=None, height=40, spacing=10)
+        
+        confirm_button = Button(
+            text="Sim, excluir",
+            background_color=(0.9, 0.2, 0.2, 1)
+        )
+        
+        cancel_button = Button(
+            text="Cancelar",
+            background_color=COLOR_PRIMARY
+        )
+        
+        buttons.add_widget(confirm_button)
+        buttons.add_widget(cancel_button)
+        content.add_widget(buttons)
+        
+        popup = Popup(
+            title="Confirmar Exclusão",
+            content=content,
+            size_hint=(0.8, 0.4),
+            auto_dismiss=False
+        )
+        
+        def confirm_delete(instance):
+            app = App.get_running_app()
+            try:
+                app.backend.delete_itinerary(app.user_id, itinerary_id)
+                popup.dismiss()
+                self.load_itineraries()  # Recarregar lista
+                
+            except Exception as e:
+                print(f"Erro ao excluir itinerário: {e}")
+        
+        confirm_button.bind(on_press=confirm_delete)
+        cancel_button.bind(on_press=popup.dismiss)
+        
+        popup.open()
@@ -0,0 +1,387 @@
+"""Park map, about and warnings screens."""
+
+import os
+from datetime import datetime
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+
+from infinity_park.config import ASSETS_PATH
+from infinity_park.ui.widgets import COLOR_PRIMARY, COLOR_TEXT_DARK, HeaderLabel, StyledButton
+
+
+class ParkMapScreen(Screen):
+    def __init__(self, **kwargs):
+        super(ParkMapScreen, self).__init__(**kwargs)
+        self.name = "park_map"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Mapa do Parque"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Conteúdo do mapa
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        content_layout = BoxLayout(orientation="vertical", spacing=15, padding=10, size_hint_y=None)
+        content_layout.bind(minimum_height=content_layout.setter("height"))
+        
+        # Imagem do mapa (placeholder)
+        map_path = os.path.join(ASSETS_PATH, "park_map.png")
+        if os.path.exists(map_path):
+            content_layout.add_widget(KivyImage(
+                source=map_path,
+                size_hint_y=None,
+                height=400
+            ))
+        else:
+            # Placeholder para o mapa
+            placeholder = BoxLayout(orientation="vertical", size_hint_y=None, height=400)
+            placeholder.canvas.before.add(Color(0.9, 0.9, 0.9, 1))
+            placeholder.canvas.before.add(Rectangle(pos=placeholder.pos, size=placeholder.size))
+            
+            placeholder.add_widget(Label(
+                text="Mapa do Parque\n(Imagem não disponível)",
+                font_size="20sp",
+                color=COLOR_TEXT_DARK
+            ))
+            
+            content_layout.add_widget(placeholder)
+        
+        # Legenda do mapa
+        content_layout.add_widget(Label(
+            text="Legenda do Mapa",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40
+        ))
+        
+        # Itens da legenda
+        legend_items = [
+            ("Atrações Radicais", "Vermelho"),
+            ("Atrações Familiares", "Azul"),
+            ("Atrações Infantis", "Verde"),
+            ("Lanchonetes", "Amarelo"),
+            ("Banheiros", "Cinza"),
+            ("Lojas", "Roxo"),
+            ("Entrada/Saída", "Laranja")
+        ]
+        
+        for item, color in legend_items:
+            item_layout = BoxLayout(size_hint_y=None, height=30, spacing=10)
+            
+            color_box = BoxLayout(size_hint_x=0.1)
+            if color == "Vermelho":
+                color_box.canvas.before.add(Color(0.9, 0.2, 0.2, 1))
+            elif color == "Azul":
+                color_box.canvas.before.add(Color(0.2, 0.4, 0.8, 1))
+            elif color == "Verde":
+                color_box.canvas.before.add(Color(0.2, 0.8, 0.2, 1))
+            elif color == "Amarelo":
+                color_box.canvas.before.add(Color(0.9, 0.9, 0.2, 1))
+            elif color == "Cinza":
+                color_box.canvas.before.add(Color(0.5, 0.5, 0.5, 1))
+            elif color == "Roxo":
+                color_box.canvas.before.add(Color(0.6, 0.2, 0.8, 1))
+            elif color == "Laranja":
+                color_box.canvas.before.add(Color(0.9, 0.5, 0.1, 1))
+            
+            color_box.canvas.before.add(Rectangle(pos=color_box.pos, size=color_box.size))
+            item_layout.add_widget(color_box)
+            
+            item_layout.add_widget(Label(
+                text=item,
+                font_size="16sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_x=0.9,
+                halign="left",
+                text_size=(Window.width * 0.7, None)
+            ))
+            
+            content_layout.add_widget(item_layout)
+            content_layout.height += 30
+        
+        # Informações adicionais
+        content_layout.add_widget(Label(
+            text="Informações Úteis",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        info_text = """
+• O parque está dividido em 5 áreas temáticas.
+• Banheiros estão disponíveis em todas as áreas.
+• Pontos de hidratação gratuitos estão marcados com símbolos de gota d'água.
+• Armários para pertences estão disponíveis próximos à entrada principal.
+• Em caso de emergência, procure um funcionário ou dirija-se a um ponto de informação.
+        """
+        
+        info_label = Label(
+            text=info_text,
+            font_size="15sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        )
+        info_label.bind(texture_size=info_label.setter('size'))
+        content_layout.add_widget(info_label)
+        
+        scroll_view.add_widget(content_layout)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+
+
+
+class AboutParkScreen(Screen):
+    def __init__(self, **kwargs):
+        super(AboutParkScreen, self).__init__(**kwargs)
+        self.name = "about_park"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Sobre o Parque"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Conteúdo sobre o parque
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        content_layout = BoxLayout(orientation="vertical", spacing=15, padding=10, size_hint_y=None)
+        content_layout.bind(minimum_height=content_layout.setter("height"))
+        
+        # Logo do parque
+        logo_path = os.path.join(ASSETS_PATH, "logo_infinity_park_215.png")
+        if os.path.exists(logo_path):
+            content_layout.add_widget(KivyImage(
+                source=logo_path,
+                size_hint_y=None,
+                height=150
+            ))
+        
+        # Carregar informações do banco de dados
+        info_items = App.get_running_app().backend.park_info()
+        
+        if info_items:
+            for item in info_items:
+                content_layout.add_widget(Label(
+                    text=item["titulo"],
+                    font_size="18sp",
+                    bold=True,
+                    color=COLOR_PRIMARY,
+                    size_hint_y=None,
+                    height=40,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                content_label = Label(
+                    text=item["conteudo"],
+                    font_size="15sp",
+                    color=COLOR_TEXT_DARK,
+                    size_hint_y=None,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                )
+                content_label.bind(texture_size=content_label.setter('size'))
+                content_layout.add_widget(content_label)
+        else:
+            # Informações padrão caso não haja dados no banco
+            sections = [
+                {
+                    "title": "Sobre o Infinity Park 215",
+                    "content": """O Infinity Park 215 é o seu destino de diversão sem limites! Inaugurado em 2020, nosso parque oferece atrações emocionantes, shows espetaculares e experiências inesquecíveis para toda a família. Venha criar memórias mágicas conosco!
+
+Com mais de 30 atrações distribuídas em 5 áreas temáticas, o Infinity Park 215 foi projetado para proporcionar diversão para todas as idades. Nossa equipe de mais de 500 colaboradores trabalha diariamente para garantir sua segurança e conforto."""
+                },
+                {
+                    "title": "Regras Gerais do Parque",
+                    "content": """Para a segurança e conforto de todos, siga nossas regras:
+
+• Não é permitido entrar com alimentos e bebidas (exceto água e alimentos para bebês).
+• Respeite as filas e as indicações dos funcionários.
+• Proibido fumar fora das áreas designadas.
+• Crianças menores de 12 anos devem estar acompanhadas por um adulto responsável.
+• Siga todas as instruções de segurança nas atrações.
+• Não é permitido pular filas ou guardar lugar para outras pessoas.
+• Divirta-se com responsabilidade!"""
+                },
+                {
+                    "title": "Horários de Funcionamento",
+                    "content": """• Segunda a Quinta: 10h às 18h
+• Sexta: 10h às 22h
+• Sábado: 9h às 22h
+• Domingo: 9h às 20h
+
+Horários especiais em feriados e datas comemorativas. Consulte o calendário no site oficial ou na bilheteria do parque."""
+                },
+                {
+                    "title": "Contato",
+                    "content": """• Telefone: (11) 5555-1234
+• E-mail: contato@infinitypark215.com
+• Site: www.infinitypark215.com
+• Endereço: Av. das Diversões, 215 - Cidade Feliz - SP"""
+                }
+            ]
+            
+            for section in sections:
+                content_layout.add_widget(Label(
+                    text=section["title"],
+                    font_size="18sp",
+                    bold=True,
+                    color=COLOR_PRIMARY,
+                    size_hint_y=None,
+                    height=40,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                content_label = Label(
+                    text=section["content"],
+                    font_size="15sp",
+                    color=COLOR_TEXT_DARK,
+                    size_hint_y=None,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                )
+                content_label.bind(texture_size=content_label.setter('size'))
+                content_layout.add_widget(content_label)
+        
+        scroll_view.add_widget(content_layout)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+
+
+
+class WarningsListScreen(Screen):
+    def __init__(self, **kwargs):
+        super(WarningsListScreen, self).__init__(**kwargs)
+        self.name = "warnings_list"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Avisos Importantes"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Lista de avisos
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.warnings_layout = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.warnings_layout.bind(minimum_height=self.warnings_layout.setter("height"))
+        scroll_view.add_widget(self.warnings_layout)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_warnings()
+
+    def load_warnings(self):
+        self.warnings_layout.clear_widgets()
+        
+        warnings = App.get_running_app().backend.warnings()
+        
+        if not warnings:
+            self.warnings_layout.add_widget(Label(
+                text="Não há avisos importantes no momento.",
+                font_size="16sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=50
+            ))
+            return
+        
+        for warning in warnings:
+            # Determinar cor com base no tipo de aviso
+            if warning["tipo_aviso"] == "Urgente":
+                bg_color = (0.9, 0.2, 0.2, 0.2)  # Vermelho transparente
+                title_color = (0.9, 0.2, 0.2, 1)  # Vermelho
+            elif warning["tipo_aviso"] == "Alerta":
+                bg_color = (0.9, 0.7, 0.2, 0.2)  # Amarelo transparente
+                title_color = (0.9, 0.7, 0.2, 1)  # Amarelo
+            else:  # Informativo
+                bg_color = (0.2, 0.6, 0.9, 0.2)  # Azul transparente
+                title_color = (0.2, 0.6, 0.9, 1)  # Azul
+            
+            # Formatar data
+            pub_date = datetime.strptime(warning["data_publicacao"], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y")
+            
+            # Criar item de aviso
+            warning_item = BoxLayout(
+                orientation="vertical",
+                size_hint_y=None,
+                padding=10,
+                spacing=5
+            )
+            warning_item.bind(minimum_height=warning_item.setter("height"))
+            
+            # Adicionar fundo colorido
+            with warning_item.canvas.before:
+                Color(*bg_color)
+                self.rect = Rectangle(pos=warning_item.pos, size=warning_item.size)
+            warning_item.bind(pos=self.update_rect, size=self.update_rect)
+            
+            # Título do aviso
+            warning_item.add_widget(Label(
+                text=warning["titulo"],
+                font_size="18sp",
+                bold=True,
+                color=title_color,
+                size_hint_y=None,
+                height=30,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+            
+            # Mensagem do aviso
+            message_label = Label(
+                text=warning["mensagem"],
+                font_size="15sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            )
+            message_label.bind(texture_size=message_label.setter('size'))
+            warning_item.add_widget(message_label)
+            
+            # Data de publicação
+            warning_item.add_widget(Label(
+                text=f"Publicado em: {pub_date}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=20,
+                halign="right",
+                text_size=(Window.width * 0.9, None)
+            ))
+            
+            # Ajustar altura do item
+            warning_item.height = 30 + message_label.height + 20 + 20  # título + mensagem + data + padding
+            
+            self.warnings_layout.add_widget(warning_item)
+    
+    def update_rect(self, instance, value):
+        self.rect.pos = instance.pos
+        self.rect.size = instance.size
@@ -0,0 +1,183 @@
+"""Frame-time and screen-method profiler with an on-screen overlay.
+
+Enabled by INFINITY_PARK_UI_PROFILE=1 (config.UI_PROFILE). FrameProfiler
+times the construction of each screen on its first visit, and its
+on_pre_enter, on_enter and load_* methods. It also samples every frame's
+duration through a Clock callback that runs once per frame. Each frame is
+charged with the screen methods that ran during it. The longest of them is
+reported as the frame's responsible function, so a stuttering FadeTransition
+points at the load_menu() or load_profile_data() that caused it.
+
+The overlay in the window's corner shows fps, the last and the worst frame,
+and the last method timed. report() returns the frame percentiles, the
+per-method stats and the worst frames. The app writes it as JSON to
+UI_PROFILE_REPORT on exit and when F10 is pressed, so runs can be compared
+to catch regressions.
+"""
+
+import heapq
+import json
+import os
+import time
+from array import array
+from functools import wraps
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.label import Label
+
+from infinity_park.config import FRAME_BUDGET_MS, UI_PROFILE_REPORT, UI_PROFILE_WORST_FRAMES
+from infinity_park.stats import percentile
+
+TIMED_METHODS = ("on_pre_enter", "on_enter")
+TIMED_PREFIX = "load_"
+
+
+class FrameProfiler(object):
+    """Times screen methods and frames; attach() it to a LazyScreenManager."""
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, worst=UI_PROFILE_WORST_FRAMES):
+        self.budget_ms = budget_ms
+        self.worst = worst
+        self.frames = array("d")  # Frame durations in ms
+        self.calls = {}  # "Screen.method" -> [ms]
+        self.last_call = None  # (name, ms)
+        self._frame_calls = []  # (name, ms) run since the last frame
+        self._worst_frames = []  # Min-heap of (ms, sequence, frame)
+        self._screen_manager = None
+        self._started = None
+        self._overlay = None
+        self._events = []
+
+    def start(self, overlay=True):
+        if self._started is None:
+            self._started = time.perf_counter()
+            self._events.append(Clock.schedule_interval(self._on_frame, 0))
+            if overlay:
+                self._overlay = Label(size_hint=(None, None), size=(420, 44), font_size="12sp",
+                                      halign="right", valign="top", color=(1, 0.3, 0.3, 1))
+                self._overlay.bind(size=self._overlay.setter("text_size"))
+                Window.add_widget(self._overlay)
+                Window.bind(size=self._place_overlay)
+                self._place_overlay(Window, Window.size)
+                self._events.append(Clock.schedule_interval(self._update_overlay, 0.5))
+        return self
+
+    def close(self):
+        for event in self._events:
+            event.cancel()
+        self._events = []
+        if self._overlay is not None:
+            Window.unbind(size=self._place_overlay)
+            Window.remove_widget(self._overlay)
+            self._overlay = None
+
+    def attach(self, screen_manager):
+        """Time screen_manager's screen construction and instrument every screen it builds."""
+        self._screen_manager = screen_manager
+        for screen in screen_manager.screens:
+            self.instrument(screen)
+        screen_manager.screen_hooks.append(self.instrument)
+        build_screen = screen_manager.build_screen
+
+        def timed_build(name):
+            return self._timed(f"{type(screen_manager).__name__}.build_screen({name})", build_screen)(name)
+        screen_manager.build_screen = timed_build
+        return self
+
+    def instrument(self, screen):
+        """Replace screen's on_pre_enter, on_enter and load_* methods by timed wrappers."""
+        for name in dir(type(screen)):
+            if name in TIMED_METHODS or name.startswith(TIMED_PREFIX):
+                method = getattr(screen, name)
+                # Kivy's own no-op handlers are left alone
+                if callable(method) and getattr(method, "__module__", "").startswith("infinity_park."):
+                    setattr(screen, name, self._timed(f"{type(screen).__name__}.{name}", method))
+
+    def _timed(self, name, method):
+        @wraps(method)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record_call(name, (time.perf_counter() - started) * 1000)
+        return timed
+
+    def record_call(self, name, ms):
+        self.calls.setdefault(name, []).append(ms)
+        self.last_call = (name, ms)
+        self._frame_calls.append((name, ms))
+
+    def record_frame(self, ms):
+        """Close the current frame, ms long, charging it with the calls made since the last one."""
+        calls, self._frame_calls = self._frame_calls, []
+        self.frames.append(ms)
+        if len(self._worst_frames) >= self.worst and ms <= self._worst_frames[0][0]:
+            return
+        calls.sort(key=lambda call: call[1], reverse=True)
+        frame = {
+            "ms": round(ms, 2),
+            "segundos": round(time.perf_counter() - (self._started or time.perf_counter()), 2),
+            "tela": self._screen_manager.current if self._screen_manager is not None else None,
+            "funcao": calls[0][0] if calls else None,
+            "chamadas": [{"funcao": name, "ms": round(call_ms, 2)} for name, call_ms in calls],
+        }
+        entry = (ms, len(self.frames), frame)
+        if len(self._worst_frames) < self.worst:
+            heapq.heappush(self._worst_frames, entry)
+        else:
+            heapq.heapreplace(self._worst_frames, entry)
+
+    def _on_frame(self, dt):
+        self.record_frame(dt * 1000)
+
+    def _place_overlay(self, window, size):
+        self._overlay.pos = (size[0] - self._overlay.width - 8, size[1] - self._overlay.height - 8)
+
+    def _update_overlay(self, dt):
+        recent = self.frames[-30:]
+        if not recent:
+            return
+        fps = 1000 * len(recent) / sum(recent)
+        worst = max(self._worst_frames)[0] if self._worst_frames else 0.0
+        text = f"{fps:.0f} fps  frame {recent[-1]:.1f} ms  pior {worst:.1f} ms"
+        if self.last_call is not None:
+            text += f"\n{self.last_call[0]} {self.last_call[1]:.1f} ms"
+        self._overlay.text = text
+
+    def report(self):
+        """Frame percentiles, frames over budget, per-method stats and the worst frames."""
+        frames = list(self.frames)
+        calls = {}
+        for name, values in self.calls.items():
+            calls[name] = {
+                "quantidade": len(values),
+                "total_ms": round(sum(values), 2),
+                "p50_ms": round(percentile(values, 0.50), 2),
+                "p95_ms": round(percentile(values, 0.95), 2),
+                "max_ms": round(max(values), 2),
+            }
+        return {
+            "frames": len(frames),
+            "fps_medio": round(1000 * len(frames) / sum(frames), 1) if frames else 0.0,
+            "orcamento_ms": round(self.budget_ms, 2),
+            "acima_do_orcamento": sum(1 for ms in frames if ms > self.budget_ms),
+            "frame_ms": {
+                "p50": round(percentile(frames, 0.50), 2),
+                "p95": round(percentile(frames, 0.95), 2),
+                "p99": round(percentile(frames, 0.99), 2),
+                "max": round(max(frames), 2) if frames else 0.0,
+            },
+            "metodos": dict(sorted(calls.items(), key=lambda item: item[1]["total_ms"], reverse=True)),
+            "piores_frames": [frame for ms, sequence, frame in sorted(self._worst_frames, reverse=True)],
+        }
+
+    def dump(self, path=UI_PROFILE_REPORT):
+        """Write report() to path as JSON; returns path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as out:
+            json.dump(self.report(), out, ensure_ascii=False, indent=2)
+        return path
@@ -0,0 +1,139 @@
+"""Rating popup opened from the attraction, show and food court screens."""
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.textinput import TextInput
+
+from infinity_park.services import ServiceError
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_DISABLED, COLOR_PRIMARY, COLOR_SECONDARY,
+                                      COLOR_TEXT_DARK, StyledButton)
+
+
+class RatingPopup(Popup):
+    def __init__(self, id_referencia, tipo_referencia, **kwargs):
+        self.id_referencia = id_referencia
+        self.tipo_referencia = tipo_referencia
+        
+        title_map = {
+            "atracao": "Avaliar Atração",
+            "show": "Avaliar Show",
+            "lanchonete": "Avaliar Lanchonete"
+        }
+        
+        title = title_map.get(tipo_referencia, "Avaliar")
+        super(RatingPopup, self).__init__(title=title, size_hint=(0.9, 0.7), **kwargs)
+        
+        layout = BoxLayout(orientation="vertical", padding=15, spacing=10)
+        
+        # Rating stars
+        layout.add_widget(Label(
+            text="Sua Avaliação:",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40
+        ))
+        
+        stars_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        self.star_buttons = []
+        
+        for i in range(1, 6):
+            star = Button(
+                text="★",
+                font_size="24sp",
+                background_color=(0, 0, 0, 0),
+                color=COLOR_DISABLED
+            )
+            star.rating_value = i
+            star.bind(on_press=self.set_rating)
+            stars_layout.add_widget(star)
+            self.star_buttons.append(star)
+        
+        layout.add_widget(stars_layout)
+        
+        # Comment
+        layout.add_widget(Label(
+            text="Comentário (opcional):",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.8, None)
+        ))
+        
+        self.comment_input = TextInput(
+            hint_text="Escreva seu comentário aqui...",
+            multiline=True,
+            size_hint_y=None,
+            height=100
+        )
+        layout.add_widget(self.comment_input)
+        
+        # Status message
+        self.status_label = Label(
+            text="",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+        layout.add_widget(self.status_label)
+        
+        # Buttons
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        
+        submit_button = StyledButton(text="Enviar Avaliação")
+        submit_button.bind(on_press=self.submit_rating)
+        
+        cancel_button = Button(
+            text="Cancelar",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        cancel_button.bind(on_press=self.dismiss)
+        
+        buttons_layout.add_widget(submit_button)
+        buttons_layout.add_widget(cancel_button)
+        layout.add_widget(buttons_layout)
+        
+        self.content = layout
+        self.rating = 0
+
+    def set_rating(self, instance):
+        self.rating = instance.rating_value
+        
+        for i, star in enumerate(self.star_buttons):
+            if i < self.rating:
+                star.color = COLOR_SECONDARY  # Filled star
+            else:
+                star.color = COLOR_DISABLED  # Empty star
+
+    def submit_rating(self, instance):
+        app = App.get_running_app()
+        user_id = app.user_id
+        if not user_id:
+            self.status_label.text = "Você precisa estar logado para avaliar."
+            return
+        
+        try:
+            updated = app.backend.submit_rating(
+                user_id, self.id_referencia, self.tipo_referencia, self.rating, self.comment_input.text
+            )
+            if updated:
+                self.status_label.text = "Sua avaliação foi atualizada!"
+            else:
+                self.status_label.text = "Avaliação enviada com sucesso!"
+            
+            # Close popup after a short delay
+            Clock.schedule_once(lambda dt: self.dismiss(), 1.5)
+            
+        except ServiceError as e:
+            self.status_label.text = str(e)
+        except Exception as e:
+            self.status_label.text = f"Erro ao enviar avaliação: {e}"
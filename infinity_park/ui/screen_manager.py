@@ -0,0 +1,66 @@
+"""ScreenManager that imports and constructs screens on first use."""
+
+import importlib
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import ScreenManager
+
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that constructs each registered screen on first use.
+
+    Screens are registered by name with a factory: a callable returning the
+    Screen, or the dotted path of a Screen class, whose module is imported
+    only then. A screen is built the first time get_screen() asks for it,
+    which includes navigating to it by setting current. prewarm() builds a
+    list of them one per frame in the background, so later visits find them
+    ready. Each callable in screen_hooks is called with every screen built.
+    """
+
+    def __init__(self, **kwargs):
+        super(LazyScreenManager, self).__init__(**kwargs)
+        self.factories = {}  # screen name -> callable or dotted path returning the Screen
+        self.screen_hooks = []
+        self._prewarm_queue = []
+        self._prewarm_interval = 0.1
+
+    def register(self, name, factory):
+        self.factories[name] = factory
+
+    def is_built(self, name):
+        return any(screen.name == name for screen in self.screens)
+
+    def has_screen(self, name):
+        return name in self.factories or super(LazyScreenManager, self).has_screen(name)
+
+    def get_screen(self, name):
+        if name in self.factories and not self.is_built(name):
+            self.build_screen(name)
+        return super(LazyScreenManager, self).get_screen(name)
+
+    def build_screen(self, name):
+        """Construct the registered screen name, run screen_hooks on it and add it; returns it."""
+        factory = self.factories[name]
+        if isinstance(factory, str):
+            module_name, class_name = factory.rsplit(".", 1)
+            factory = getattr(importlib.import_module(module_name), class_name)
+        screen = factory()
+        for hook in self.screen_hooks:
+            hook(screen)
+        self.add_widget(screen)
+        return screen
+
+    def prewarm(self, names, interval=0.1):
+        """Build the named screens one at a time, interval seconds apart."""
+        self._prewarm_queue.extend(names)
+        self._prewarm_interval = interval
+        Clock.schedule_once(self._prewarm_next, interval)
+
+    def _prewarm_next(self, dt):
+        while self._prewarm_queue:
+            name = self._prewarm_queue.pop(0)
+            if not self.is_built(name):
+                self.get_screen(name)
+                break
+        if self._prewarm_queue:
+            Clock.schedule_once(self._prewarm_next, self._prewarm_interval)
@@ -0,0 +1,265 @@
+"""Show list and detail screens."""
+
+import os
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+
+from infinity_park.config import ASSETS_PATH
+from infinity_park.services import ServiceError
+from infinity_park.ui.ratings import RatingPopup
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK,
+                                      HeaderLabel, StyledButton)
+
+
+class ShowsListScreen(Screen):
+    def __init__(self, **kwargs):
+        super(ShowsListScreen, self).__init__(**kwargs)
+        self.name = "shows_list"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Shows do Parque"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.shows_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.shows_grid.bind(minimum_height=self.shows_grid.setter("height"))
+        scroll_view.add_widget(self.shows_grid)
+        layout.add_widget(scroll_view)
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_shows()
+
+    def load_shows(self):
+        self.shows_grid.clear_widgets()
+        shows = App.get_running_app().backend.catalog("shows")
+
+        if not shows:
+            self.shows_grid.add_widget(Label(text="Nenhum show disponível no momento.", color=COLOR_TEXT_DARK))
+            return
+
+        for show in shows:
+            item = BoxLayout(orientation="horizontal", size_hint_y=None, height=150, spacing=10, padding=5)
+            
+            # Image
+            img_path = show["url_imagem_divulgacao"] if show["url_imagem_divulgacao"] and os.path.exists(show["url_imagem_divulgacao"]) else os.path.join(ASSETS_PATH, "show_placeholder.png")
+            if os.path.exists(img_path):
+                img = KivyImage(source=img_path, size_hint_x=0.4)
+            else:
+                img = Label(text="Imagem\nNão Disponível", size_hint_x=0.4, color=COLOR_TEXT_DARK)
+            item.add_widget(img)
+            
+            # Info
+            info_layout = BoxLayout(orientation="vertical", size_hint_x=0.6, spacing=5)
+            info_layout.add_widget(Label(
+                text=show["nome"],
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            info_layout.add_widget(Label(
+                text=f"Tipo: {show['tipo_show']}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            info_layout.add_widget(Label(
+                text=f"Horários: {show['horarios']}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                halign="left",
+                valign="top",
+                text_size=(Window.width * 0.5, None)
+            ))
+            
+            # Details button
+            details_button = StyledButton(text="Ver Detalhes", size_hint_y=None, height=40)
+            details_button.bind(on_press=lambda _, id=show["id"]: self.show_details(id))
+            info_layout.add_widget(details_button)
+            
+            item.add_widget(info_layout)
+            self.shows_grid.add_widget(item)
+
+    def show_details(self, show_id):
+        app = App.get_running_app()
+        app.selected_show_id = show_id
+        app.previous_screen = self.name
+        self.manager.current = "show_detail"
+
+
+
+class ShowDetailScreen(Screen):
+    def __init__(self, **kwargs):
+        super(ShowDetailScreen, self).__init__(**kwargs)
+        self.name = "show_detail"
+        self.layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+
+        # Header with title and back button
+        self.header_label = HeaderLabel(text="Detalhes do Show")
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(self.header_label)
+        
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "shows_list"))
+        header_layout.add_widget(back_button)
+        
+        self.layout.add_widget(header_layout)
+
+        # Scrollable content area
+        self.scroll_view = ScrollView(size_hint=(1, 1))
+        self.details_content = BoxLayout(
+            orientation="vertical", 
+            size_hint_y=None, 
+            spacing=10,
+            padding=10
+        )
+        self.details_content.bind(minimum_height=self.details_content.setter('height'))
+        self.scroll_view.add_widget(self.details_content)
+        self.layout.add_widget(self.scroll_view)
+
+        self.add_widget(self.layout)
+        
+        # Average rating component
+        self.avg_rating_label_show = Label(
+            text="Avaliação Média: N/A",
+            font_size="15sp",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+
+    def on_enter(self, *args):
+        self.load_show_details()
+
+    def load_show_details(self):
+        self.details_content.clear_widgets()
+        show_id = App.get_running_app().selected_show_id
+        if not show_id:
+            self.details_content.add_widget(Label(text="Nenhum show selecionado.", color=COLOR_TEXT_DARK))
+            return
+
+        try:
+            result = App.get_running_app().backend.details("shows", show_id)
+        except ServiceError:
+            self.details_content.add_widget(Label(text="Detalhes do show não encontrados.", color=COLOR_TEXT_DARK))
+            return
+        show, rating_data = result["item"], result["avaliacao"]
+
+        self.header_label.text = show["nome"]
+
+        # Show image
+        if show["url_imagem_divulgacao"] and os.path.exists(show["url_imagem_divulgacao"]):
+            self.details_content.add_widget(KivyImage(
+                source=show["url_imagem_divulgacao"],
+                size_hint_y=None,
+                height=250
+            ))
+        else:
+            placeholder_img = os.path.join(ASSETS_PATH, "show_placeholder.png")
+            if os.path.exists(placeholder_img):
+                self.details_content.add_widget(KivyImage(
+                    source=placeholder_img,
+                    size_hint_y=None,
+                    height=250
+                ))
+            else:
+                self.details_content.add_widget(Label(
+                    text="Sem Imagem Disponível",
+                    size_hint_y=None,
+                    height=200,
+                    color=COLOR_TEXT_DARK
+                ))
+
+        # Show details
+        self.details_content.add_widget(Label(
+            text=f"Nome: {show['nome']}",
+            font_size='20sp',
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40,
+            halign='left',
+            text_size=(Window.width * 0.85, None)
+        ))
+
+        desc_label = Label(
+            text=f"Descrição: {show['descricao'] if show['descricao'] else 'Não disponível.'}",
+            font_size='15sp',
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            halign='left',
+            text_size=(Window.width * 0.85, None)
+        )
+
+        desc_label.bind(texture_size=desc_label.setter('size'))
+        self.details_content.add_widget(desc_label)
+
+        self.details_content.add_widget(Label(
+            text=f"Tipo: {show['tipo_show'] if show['tipo_show'] else 'Não especificado'}",
+            font_size='15sp',
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        ))
+
+        self.details_content.add_widget(Label(
+            text=f"Localização: {show['localizacao'] if show['localizacao'] else 'Não especificado'}",
+            font_size='15sp',
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        ))
+
+        self.details_content.add_widget(Label(
+            text=f"Horários: {show['horarios'] if show['horarios'] else 'Consultar programação'}",
+            font_size='15sp',
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        ))
+
+        self.details_content.add_widget(Label(
+            text=f"Duração: {show['duracao_minutos']} minutos" if show['duracao_minutos'] else "Duração não informada",
+            font_size='15sp',
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        ))
+
+        # Average rating
+        if rating_data and rating_data["media"] is not None:
+            self.avg_rating_label_show.text = f"Avaliação Média: {rating_data['media']:.1f}/5 ({rating_data['total_avaliacoes']} avaliações)"
+        else:
+            self.avg_rating_label_show.text = "Avaliação Média: Nenhuma avaliação ainda."
+        self.details_content.add_widget(self.avg_rating_label_show)
+
+        # Rating button
+        rate_button = StyledButton(
+            text="Avaliar Show",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        rate_button.bind(on_press=self.open_rating_popup)
+        self.details_content.add_widget(rate_button)
+
+    def open_rating_popup(self, instance):
+        show_id = App.get_running_app().selected_show_id
+        if show_id:
+            popup = RatingPopup(id_referencia=show_id, tipo_referencia="show")
+            popup.open()
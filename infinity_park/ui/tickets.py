@@ -0,0 +1,819 @@
+"""Ticket screens: purchase history, ticket purchase and purchase details."""
+
+import threading
+from datetime import date, datetime
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.spinner import Spinner
+
+from infinity_park.inventory import SoldOutError
+from infinity_park.payments import APPROVED as PAYMENT_APPROVED, DECLINED as PAYMENT_DECLINED
+from infinity_park.qr import available as qr_available
+from infinity_park.services import ServiceError
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK,
+                                      HeaderLabel, StyledButton)
+
+
+class TicketsListScreen(Screen):
+    def __init__(self, **kwargs):
+        super(TicketsListScreen, self).__init__(**kwargs)
+        self.name = "tickets_list"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Ingressos"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Tabs for different ticket functions
+        tabs_layout = BoxLayout(size_hint_y=None, height=50, spacing=5)
+        
+        buy_button = StyledButton(text="Comprar Ingressos")
+        buy_button.bind(on_press=lambda x: self.show_tab("buy"))
+        
+        my_tickets_button = Button(
+            text="Meus Ingressos", 
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        my_tickets_button.bind(on_press=lambda x: self.show_tab("my_tickets"))
+        
+        tabs_layout.add_widget(buy_button)
+        tabs_layout.add_widget(my_tickets_button)
+        layout.add_widget(tabs_layout)
+
+        # Content area that will change based on selected tab
+        self.content_area = BoxLayout(orientation="vertical", padding=10)
+        layout.add_widget(self.content_area)
+        
+        self.add_widget(layout)
+        
+        # Default to buy tab
+        self.current_tab = "buy"
+        self.history_generation = 0
+
+    def on_enter(self, *args):
+        self.show_tab(self.current_tab)
+
+    def show_tab(self, tab_name):
+        self.current_tab = tab_name
+        self.content_area.clear_widgets()
+        
+        if tab_name == "buy":
+            self.show_buy_tickets()
+        elif tab_name == "my_tickets":
+            self.show_my_tickets()
+
+    def show_buy_tickets(self):
+        scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        tickets_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        tickets_grid.bind(minimum_height=tickets_grid.setter("height"))
+        
+        ticket_types = App.get_running_app().backend.catalog("ingressos")
+        
+        if not ticket_types:
+            tickets_grid.add_widget(Label(text="Nenhum tipo de ingresso disponível no momento.", color=COLOR_TEXT_DARK))
+        else:
+            tickets_grid.add_widget(Label(
+                text="Selecione o tipo de ingresso para comprar:",
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                size_hint_y=None,
+                height=40
+            ))
+            
+            for ticket in ticket_types:
+                item = BoxLayout(orientation="vertical", size_hint_y=None, height=150, spacing=5, padding=10)
+                item.canvas.before.add(Color(0.95, 0.95, 0.95, 1))
+                item.canvas.before.add(Rectangle(pos=item.pos, size=item.size))
+                
+                item.add_widget(Label(
+                    text=ticket["nome"],
+                    font_size="18sp",
+                    bold=True,
+                    color=COLOR_PRIMARY,
+                    size_hint_y=None,
+                    height=30
+                ))
+                
+                item.add_widget(Label(
+                    text=ticket["descricao"] if ticket["descricao"] else "Sem descrição adicional.",
+                    font_size="14sp",
+                    color=COLOR_TEXT_DARK,
+                    size_hint_y=None,
+                    height=40,
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                details_layout = BoxLayout(size_hint_y=None, height=30)
+                
+                age_text = ""
+                if ticket["idade_minima"] > 0 and ticket["idade_maxima"] < 120:
+                    age_text = f"Idade: {ticket['idade_minima']} a {ticket['idade_maxima']} anos"
+                elif ticket["idade_minima"] > 0:
+                    age_text = f"Idade mínima: {ticket['idade_minima']} anos"
+                elif ticket["idade_maxima"] < 120:
+                    age_text = f"Idade máxima: {ticket['idade_maxima']} anos"
+                
+                if age_text:
+                    details_layout.add_widget(Label(
+                        text=age_text,
+                        font_size="14sp",
+                        color=COLOR_TEXT_DARK,
+                        halign="left",
+                        text_size=(Window.width * 0.5, None)
+                    ))
+                
+                price_text = "Gratuito" if ticket["preco_base"] == 0 else f"R$ {ticket['preco_base']:.2f}".replace(".", ",")
+                details_layout.add_widget(Label(
+                    text=price_text,
+                    font_size="16sp",
+                    bold=True,
+                    color=COLOR_ACCENT,
+                    halign="right",
+                    text_size=(Window.width * 0.4, None)
+                ))
+                
+                item.add_widget(details_layout)
+                
+                select_button = StyledButton(
+                    text="Selecionar",
+                    size_hint_y=None,
+                    height=40
+                )
+                select_button.bind(on_press=lambda _, id=ticket["id"], name=ticket["nome"], price=ticket["preco_base"]: self.select_ticket(id, name, price))
+                item.add_widget(select_button)
+                
+                tickets_grid.add_widget(item)
+        
+        scroll_view.add_widget(tickets_grid)
+        self.content_area.add_widget(scroll_view)
+
+    def show_my_tickets(self):
+        user_id = App.get_running_app().user_id
+        if not user_id:
+            self.content_area.add_widget(Label(text="Você precisa estar logado para ver seus ingressos.", color=COLOR_TEXT_DARK))
+            return
+            
+        self.history_scroll = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.history_grid = GridLayout(cols=1, spacing=15, size_hint_y=None, padding=10)
+        self.history_grid.bind(minimum_height=self.history_grid.setter("height"))
+        self.history_scroll.add_widget(self.history_grid)
+        self.history_scroll.bind(scroll_y=self.on_history_scroll)
+        self.content_area.add_widget(self.history_scroll)
+        
+        # Pages still loading for a previous visit are dropped by add_purchases_page
+        self.history_generation += 1
+        self.history_user_id = user_id
+        self.history_after = None
+        self.history_has_more = True
+        self.history_loading = False
+        self.load_next_purchases_page()
+
+    def on_history_scroll(self, instance, scroll_y):
+        # scroll_y goes from 1 (top) to 0 (bottom); fetch ahead of the end
+        if scroll_y < 0.1:
+            self.load_next_purchases_page()
+
+    def load_next_purchases_page(self):
+        """Fetch the next page of purchases on a worker thread."""
+        if self.history_loading or not self.history_has_more:
+            return
+        self.history_loading = True
+        generation, user_id, after = self.history_generation, self.history_user_id, self.history_after
+        backend = App.get_running_app().backend
+
+        def worker():
+            error = None
+            purchases, next_after = [], None
+            try:
+                page = backend.purchase_page(user_id, after)
+                purchases, next_after = page["compras"], page["proxima"]
+            except Exception as e:
+                error = e
+            Clock.schedule_once(lambda dt: self.add_purchases_page(generation, purchases, next_after, error))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def add_purchases_page(self, generation, purchases, next_after, error=None):
+        if generation != self.history_generation:
+            return
+        self.history_loading = False
+        if error is not None:
+            self.history_has_more = False
+            self.history_grid.add_widget(Label(text=f"Erro ao carregar compras: {error}", color=COLOR_SECONDARY, size_hint_y=None, height=30))
+            return
+        self.history_after = next_after
+        self.history_has_more = next_after is not None
+        
+        if not purchases and not self.history_grid.children:
+            self.history_grid.add_widget(Label(text="Você ainda não possui ingressos comprados.", color=COLOR_TEXT_DARK))
+            return
+            
+        for purchase in purchases:
+            item = BoxLayout(orientation="vertical", size_hint_y=None, height=120, spacing=5, padding=10)
+            item.canvas.before.add(Color(0.95, 0.95, 0.95, 1))
+            item.canvas.before.add(Rectangle(pos=item.pos, size=item.size))
+                
+            # Format date
+            purchase_date = datetime.strptime(purchase["data_compra"], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
+                
+            item.add_widget(Label(
+                text=f"Compra #{purchase['id']} - {purchase_date}",
+                font_size="16sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                size_hint_y=None,
+                height=30
+            ))
+                
+            item.add_widget(Label(
+                text=f"Total: R$ {purchase['valor_total_compra']:.2f}".replace(".", ","),
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=25
+            ))
+                
+            status_color = COLOR_ACCENT if purchase["status_pagamento"] == "Aprovado" else COLOR_SECONDARY
+            item.add_widget(Label(
+                text=f"Status: {purchase['status_pagamento']} | Ingressos: {purchase['total_ingressos']}",
+                font_size="14sp",
+                color=status_color,
+                size_hint_y=None,
+                height=25
+            ))
+                
+            details_button = StyledButton(
+                text="Ver Detalhes",
+                size_hint_y=None,
+                height=30
+            )
+            details_button.bind(on_press=lambda _, id=purchase["id"]: self.show_purchase_details(id))
+            item.add_widget(details_button)
+                
+            self.history_grid.add_widget(item)
+
+    def select_ticket(self, ticket_id, ticket_name, ticket_price):
+        app = App.get_running_app()
+        app.selected_ticket_type_id = ticket_id
+        app.selected_ticket_type_name = ticket_name
+        app.selected_ticket_type_price = ticket_price
+        app.previous_screen = self.name
+        self.manager.current = "ticket_purchase"
+
+    def show_purchase_details(self, purchase_id):
+        app = App.get_running_app()
+        app.selected_purchase_id = purchase_id
+        app.previous_screen = self.name
+        self.manager.current = "purchase_details"
+
+
+
+class TicketPurchaseScreen(Screen):
+    def __init__(self, **kwargs):
+        super(TicketPurchaseScreen, self).__init__(**kwargs)
+        self.name = "ticket_purchase"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        self.header_label = HeaderLabel(text="Comprar Ingressos")
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "tickets_list"))
+        header_layout.add_widget(self.header_label)
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Form content
+        form_layout = BoxLayout(orientation="vertical", spacing=15, padding=10)
+        
+        # Ticket info
+        self.ticket_info = Label(
+            text="Selecione a quantidade e data de visita:",
+            font_size="18sp",
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=40
+        )
+        form_layout.add_widget(self.ticket_info)
+        
+        # Quantity selector
+        qty_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        qty_layout.add_widget(Label(text="Quantidade:", size_hint_x=0.4))
+        
+        qty_selector = BoxLayout(size_hint_x=0.6)
+        self.decrease_btn = Button(text="-", size_hint_x=0.3)
+        self.decrease_btn.bind(on_press=self.decrease_quantity)
+        
+        self.quantity_label = Label(text="1", size_hint_x=0.4)
+        
+        self.increase_btn = Button(text="+", size_hint_x=0.3)
+        self.increase_btn.bind(on_press=self.increase_quantity)
+        
+        qty_selector.add_widget(self.decrease_btn)
+        qty_selector.add_widget(self.quantity_label)
+        qty_selector.add_widget(self.increase_btn)
+        
+        qty_layout.add_widget(qty_selector)
+        form_layout.add_widget(qty_layout)
+        
+        # Date selector
+        date_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        date_layout.add_widget(Label(text="Data de Visita:", size_hint_x=0.4))
+        
+        # Create a date spinner with next 30 days
+        import datetime as dt
+        self.date_spinner = Spinner(
+            text=date.today().strftime("%d/%m/%Y"),
+            values=[
+                (date.today() + dt.timedelta(days=i)).strftime("%d/%m/%Y")
+                for i in range(30)
+            ],
+            size_hint_x=0.6
+        )
+        self.date_spinner.bind(text=lambda instance, value: self.update_quote())
+        date_layout.add_widget(self.date_spinner)
+        form_layout.add_widget(date_layout)
+        
+        self.availability_label = Label(
+            text="",
+            font_size="14sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30
+        )
+        form_layout.add_widget(self.availability_label)
+        
+        # Total price
+        self.total_price_label = Label(
+            text="Total: R$ 0,00",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=40
+        )
+        form_layout.add_widget(self.total_price_label)
+        
+        # Payment method
+        payment_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        payment_layout.add_widget(Label(text="Forma de Pagamento:", size_hint_x=0.4))
+        
+        self.payment_spinner = Spinner(
+            text="Cartão de Crédito",
+            values=["Cartão de Crédito", "Cartão de Débito", "PIX", "Boleto"],
+            size_hint_x=0.6
+        )
+        payment_layout.add_widget(self.payment_spinner)
+        form_layout.add_widget(payment_layout)
+        
+        # Purchase button
+        self.purchase_button = StyledButton(
+            text="Finalizar Compra",
+            size_hint_y=None,
+            height=50
+        )
+        self.purchase_button.bind(on_press=self.process_purchase)
+        form_layout.add_widget(self.purchase_button)
+        
+        # Status message
+        self.status_label = Label(
+            text="",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+        form_layout.add_widget(self.status_label)
+        
+        layout.add_widget(form_layout)
+        self.add_widget(layout)
+        
+        # Initialize
+        self.quantity = 1
+        # Inicializar ticket_price com valor padrão para evitar o erro
+        self.ticket_id = None
+        self.ticket_name = ""
+        self.ticket_price = 0.0  # Inicialização do atributo ticket_price
+        self.base_price = 0.0
+        
+    def on_enter(self, *args):
+        app = App.get_running_app()
+        self.ticket_id = app.selected_ticket_type_id
+        self.ticket_name = app.selected_ticket_type_name
+        self.base_price = app.selected_ticket_type_price
+        
+        self.header_label.text = f"Comprar - {self.ticket_name}"
+        self.update_quote()
+
+    def decrease_quantity(self, instance):
+        if self.quantity > 1:
+            self.quantity -= 1
+            self.quantity_label.text = str(self.quantity)
+            self.update_total()
+
+    def increase_quantity(self, instance):
+        self.quantity += 1
+        self.quantity_label.text = str(self.quantity)
+        self.update_total()
+
+    def update_quote(self):
+        """Price and availability of the selected ticket type for the selected date, in one backend call."""
+        if self.ticket_id is None:
+            return
+        selected_date = datetime.strptime(self.date_spinner.text, "%d/%m/%Y").strftime("%Y-%m-%d")
+        current = App.get_running_app().backend.quote(self.ticket_id, selected_date)
+        left = current["disponiveis"]
+        self.availability_label.text = f"Disponíveis para esta data: {left}" if left else "Esgotado para esta data"
+        self.ticket_price = current["preco"]
+        info = f"Ingresso: {self.ticket_name} - R$ {self.ticket_price:.2f}"
+        if self.ticket_price != self.base_price:
+            info += f" (preço base R$ {self.base_price:.2f})"
+        self.ticket_info.text = info.replace(".", ",")
+        self.update_total()
+
+    def update_total(self):
+        total = self.quantity * self.ticket_price
+        self.total_price_label.text = f"Total: R$ {total:.2f}".replace(".", ",")
+
+    def process_purchase(self, instance):
+        app = App.get_running_app()
+        user_id = app.user_id
+        
+        if not user_id:
+            self.status_label.text = "Você precisa estar logado para comprar ingressos."
+            return
+            
+        # Get selected date in YYYY-MM-DD format
+        selected_date = datetime.strptime(self.date_spinner.text, "%d/%m/%Y").strftime("%Y-%m-%d")
+        payment_method = self.payment_spinner.text
+        
+        try:
+            # Reserve the date's inventory and create purchase and ticket records at the current price
+            purchase = app.backend.process_purchase(
+                user_id, self.ticket_id, selected_date, self.quantity, payment_method
+            )
+            purchase_id = purchase["id"]
+            
+            self.status_label.text = "Compra registrada. Processando pagamento..."
+            self.purchase_button.disabled = True
+            self.update_quote()
+            
+            # The purchase is charged off the UI thread
+            future = app.backend.pay(purchase)
+            future.add_done_callback(
+                lambda f: Clock.schedule_once(lambda dt: self.on_payment_settled(purchase_id, f))
+            )
+            
+        except SoldOutError as e:
+            self.status_label.text = f"Não há ingressos suficientes para esta data. Restam {e.remaining}."
+        except ServiceError as e:
+            self.status_label.text = str(e)
+        except Exception as e:
+            self.status_label.text = f"Erro ao processar compra: {e}"
+
+    def on_payment_settled(self, purchase_id, future):
+        self.purchase_button.disabled = False
+        if future.exception() is not None:
+            self.status_label.text = f"Erro ao processar pagamento: {future.exception()}"
+            return
+        
+        status = future.result()
+        if status == PAYMENT_APPROVED:
+            self.status_label.text = "Compra realizada com sucesso!"
+            self.show_success_popup(purchase_id)
+        elif status == PAYMENT_DECLINED:
+            self.status_label.text = "Pagamento recusado. Os ingressos foram liberados."
+            self.update_quote()
+        else:
+            self.status_label.text = "Pagamento ainda em processamento. Acompanhe em 'Meus Ingressos'."
+
+    def show_success_popup(self, purchase_id):
+        content = BoxLayout(orientation="vertical", padding=20, spacing=15)
+        content.add_widget(Label(
+            text="Compra Realizada com Sucesso!",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_ACCENT
+        ))
+        content.add_widget(Label(
+            text=f"Número da compra: #{purchase_id}",
+            font_size="16sp"
+        ))
+        content.add_widget(Label(
+            text="Seus ingressos estão disponíveis na seção 'Meus Ingressos'.",
+            font_size="14sp"
+        ))
+        
+        view_button = StyledButton(text="Ver Meus Ingressos")
+        view_button.bind(on_press=lambda x: self.go_to_my_tickets())
+        
+        close_button = Button(
+            text="Fechar",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        buttons_layout.add_widget(view_button)
+        buttons_layout.add_widget(close_button)
+        content.add_widget(buttons_layout)
+        
+        popup = Popup(
+            title="Compra Confirmada",
+            content=content,
+            size_hint=(0.9, 0.5),
+            auto_dismiss=False
+        )
+        
+        close_button.bind(on_press=popup.dismiss)
+        popup.open()
+
+    def go_to_my_tickets(self):
+        screen = self.manager.get_screen("tickets_list")
+        screen.current_tab = "my_tickets"
+        self.manager.current = "tickets_list"
+
+
+
+class PurchaseDetailsScreen(Screen):
+    def __init__(self, **kwargs):
+        super(PurchaseDetailsScreen, self).__init__(**kwargs)
+        self.name = "purchase_details"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        self.header_label = HeaderLabel(text="Detalhes da Compra")
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", "tickets_list"))
+        header_layout.add_widget(self.header_label)
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+
+        # Content area
+        self.scroll_view = ScrollView(size_hint=(1, 1), bar_width=10, bar_color=COLOR_PRIMARY)
+        self.content_layout = BoxLayout(orientation="vertical", spacing=15, padding=10, size_hint_y=None)
+        self.content_layout.bind(minimum_height=self.content_layout.setter("height"))
+        self.scroll_view.add_widget(self.content_layout)
+        # Once per frame at most, after scrolling or when the rows are laid out
+        self.qr_trigger = Clock.create_trigger(self.request_visible_qr_codes)
+        self.scroll_view.bind(scroll_y=self.qr_trigger, height=self.qr_trigger)
+        self.content_layout.bind(height=self.qr_trigger)
+        layout.add_widget(self.scroll_view)
+        
+        # (ticket row, QR image, ticket code) still waiting for their image
+        self.qr_slots = []
+        
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        self.load_purchase_details()
+
+    def load_purchase_details(self):
+        self.content_layout.clear_widgets()
+        self.qr_slots = []
+        app = App.get_running_app()
+        purchase_id = app.selected_purchase_id
+        
+        if not purchase_id:
+            self.content_layout.add_widget(Label(text="Nenhuma compra selecionada.", color=COLOR_TEXT_DARK))
+            return
+            
+        try:
+            details = app.backend.purchase_details(app.user_id, purchase_id)
+        except ServiceError:
+            self.content_layout.add_widget(Label(text="Detalhes da compra não encontrados.", color=COLOR_TEXT_DARK))
+            return
+        purchase, groups = details["compra"], details["grupos"]
+            
+        # Format date
+        purchase_date = datetime.strptime(purchase["data_compra"], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
+        
+        # Purchase header
+        self.header_label.text = f"Compra #{purchase_id}"
+        
+        # Purchase summary
+        summary_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=150, spacing=5, padding=10)
+        summary_layout.canvas.before.add(Color(0.95, 0.95, 0.95, 1))
+        summary_layout.canvas.before.add(Rectangle(pos=summary_layout.pos, size=summary_layout.size))
+        
+        summary_layout.add_widget(Label(
+            text=f"Data: {purchase_date}",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        summary_layout.add_widget(Label(
+            text=f"Valor Total: R$ {purchase['valor_total_compra']:.2f}".replace(".", ","),
+            font_size="16sp",
+            bold=True,
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        summary_layout.add_widget(Label(
+            text=f"Forma de Pagamento: {purchase['metodo_pagamento']}",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        status_color = COLOR_ACCENT if purchase["status_pagamento"] == "Aprovado" else COLOR_SECONDARY
+        summary_layout.add_widget(Label(
+            text=f"Status: {purchase['status_pagamento']}",
+            font_size="16sp",
+            color=status_color,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        self.content_layout.add_widget(summary_layout)
+        
+        # Tickets grouped by type; the individual tickets are loaded in pages on demand
+        if groups:
+            self.content_layout.add_widget(Label(
+                text="Ingressos",
+                font_size="18sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                size_hint_y=None,
+                height=40,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+            
+            for group in groups:
+                usage_date = datetime.strptime(group["data_utilizacao_prevista"], "%Y-%m-%d").strftime("%d/%m/%Y")
+                
+                group_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=100, spacing=5, padding=10)
+                group_layout.canvas.before.add(Color(0.98, 0.98, 0.98, 1))
+                group_layout.canvas.before.add(Rectangle(pos=group_layout.pos, size=group_layout.size))
+                
+                group_layout.add_widget(Label(
+                    text=f"{group['quantidade']}x {group['tipo_ingresso']}",
+                    font_size="16sp",
+                    bold=True,
+                    color=COLOR_PRIMARY,
+                    size_hint_y=None,
+                    height=30,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                group_layout.add_widget(Label(
+                    text=f"Valor: R$ {group['preco_unitario_cobrado']:.2f} cada | Subtotal: R$ {group['subtotal']:.2f}".replace(".", ","),
+                    font_size="14sp",
+                    color=COLOR_TEXT_DARK,
+                    size_hint_y=None,
+                    height=25,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                group_layout.add_widget(Label(
+                    text=f"Data de Utilização: {usage_date}",
+                    font_size="14sp",
+                    color=COLOR_TEXT_DARK,
+                    size_hint_y=None,
+                    height=25,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+                
+                self.content_layout.add_widget(group_layout)
+            
+            total_tickets = sum(group["quantidade"] for group in groups)
+            self.tickets_button = StyledButton(text=f"Ver Ingressos ({total_tickets})", size_hint_y=None, height=50)
+            self.tickets_button.bind(on_press=lambda x: self.load_ticket_page())
+            self.content_layout.add_widget(self.tickets_button)
+        
+        self.ticket_purchase_id = purchase_id
+        self.ticket_after = 0
+        self.qr_trigger()
+
+    def load_ticket_page(self):
+        """Append the next page of ticket rows, replacing the button that asked for it."""
+        app = App.get_running_app()
+        page = app.backend.ticket_page(app.user_id, self.ticket_purchase_id, self.ticket_after)
+        tickets, next_after = page["ingressos"], page["proxima"]
+        
+        self.content_layout.remove_widget(self.tickets_button)
+        for ticket in tickets:
+            # Format date
+            usage_date = datetime.strptime(ticket["data_utilizacao_prevista"], "%Y-%m-%d").strftime("%d/%m/%Y")
+                
+            ticket_row = BoxLayout(orientation="horizontal", size_hint_y=None, height=150, spacing=10)
+            ticket_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=150, spacing=5, padding=10)
+            ticket_layout.canvas.before.add(Color(0.98, 0.98, 0.98, 1))
+            ticket_layout.canvas.before.add(Rectangle(pos=ticket_layout.pos, size=ticket_layout.size))
+            ticket_row.add_widget(ticket_layout)
+                
+            ticket_layout.add_widget(Label(
+                text=f"Ingresso: {ticket['tipo_ingresso']}",
+                font_size="16sp",
+                bold=True,
+                color=COLOR_PRIMARY,
+                size_hint_y=None,
+                height=30,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+                
+            ticket_layout.add_widget(Label(
+                text=f"Valor: R$ {ticket['preco_unitario_cobrado']:.2f}".replace(".", ","),
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=25,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+                
+            ticket_layout.add_widget(Label(
+                text=f"Data de Utilização: {usage_date}",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=25,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+                
+            status_color = COLOR_ACCENT if ticket["status_ingresso"] == "Nao Utilizado" else COLOR_SECONDARY
+            ticket_layout.add_widget(Label(
+                text=f"Status: {ticket['status_ingresso']}",
+                font_size="14sp",
+                color=status_color,
+                size_hint_y=None,
+                height=25,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+                
+            ticket_layout.add_widget(Label(
+                text=f"Código: {ticket['codigo_ingresso_unico']}",
+                font_size="12sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=25,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+                
+            if qr_available():
+                # Filled in by request_visible_qr_codes once the row is on screen
+                qr_image = KivyImage(size_hint=(None, None), size=(140, 140))
+                ticket_row.add_widget(qr_image)
+                self.qr_slots.append((ticket_row, qr_image, ticket["codigo_ingresso_unico"]))
+                
+            self.content_layout.add_widget(ticket_row)
+        
+        if next_after is not None:
+            self.ticket_after = next_after
+            self.tickets_button.text = "Carregar Mais Ingressos"
+            self.content_layout.add_widget(self.tickets_button)
+
+    def request_visible_qr_codes(self, *args):
+        """Ask the QR renderer for the tickets currently inside the scroll view."""
+        if not self.qr_slots:
+            return
+        renderer = App.get_running_app().qr_renderer
+        # Visible band in content coordinates (scroll_y is 1 at the top)
+        hidden = max(self.content_layout.height - self.scroll_view.height, 0)
+        view_bottom = hidden * self.scroll_view.scroll_y
+        view_top = view_bottom + self.scroll_view.height
+        waiting = []
+        for row, image, code in self.qr_slots:
+            row_bottom = row.y - self.content_layout.y
+            if row_bottom < view_top and row_bottom + row.height > view_bottom:
+                renderer.request(code, lambda path, image=image: Clock.schedule_once(
+                    lambda dt: setattr(image, "source", path or "")
+                ))
+            else:
+                waiting.append((row, image, code))
+        self.qr_slots = waiting
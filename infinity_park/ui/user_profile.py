@@ -0,0 +1,443 @@
+"""The signed-in user's profile screen."""
+
+import os
+from datetime import datetime
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.image import Image as KivyImage
+from kivy.uix.label import Label
+from kivy.uix.popup import Popup
+from kivy.uix.screenmanager import Screen
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.textinput import TextInput
+
+from infinity_park.badges import RULES_BY_CODE
+from infinity_park.config import ASSETS_PATH
+from infinity_park.profile import SECTIONS as PROFILE_SECTIONS
+from infinity_park.services import ServiceError
+from infinity_park.ui.widgets import (COLOR_ACCENT, COLOR_PRIMARY, COLOR_SECONDARY, COLOR_TEXT_DARK,
+                                      HeaderLabel, StyledButton)
+
+
+class MyProfileScreen(Screen):
+    def __init__(self, **kwargs):
+        super(MyProfileScreen, self).__init__(**kwargs)
+        self.name = "my_profile"
+        layout = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        
+        header_layout = BoxLayout(size_hint_y=None, height=60, padding=5)
+        header_layout.add_widget(HeaderLabel(text="Meu Perfil"))
+        back_button = StyledButton(text="Voltar", size_hint_x=0.25, height=50)
+        back_button.bind(on_press=lambda x: setattr(self.manager, "current", App.get_running_app().get_previous_screen()))
+        header_layout.add_widget(back_button)
+        layout.add_widget(header_layout)
+        
+        # Profile content
+        scroll_view = ScrollView(size_hint=(1, 1))
+        self.profile_content = BoxLayout(orientation="vertical", spacing=15, padding=10, size_hint_y=None)
+        self.profile_content.bind(minimum_height=self.profile_content.setter("height"))
+        scroll_view.add_widget(self.profile_content)
+        layout.add_widget(scroll_view)
+        
+        self.add_widget(layout)
+        self.rendered_user = None  # User whose sections are built
+        self.rendered_sections = {}  # Section -> summary value it was drawn from
+
+    def on_enter(self, *args):
+        self.load_profile_data()
+
+    def load_profile_data(self):
+        """Draw the profile from its summary row, re-rendering only changed sections."""
+        user_id = App.get_running_app().user_id
+        
+        if not user_id:
+            self.show_profile_message("Você precisa estar logado para ver seu perfil.")
+            return
+        
+        try:
+            summary = App.get_running_app().backend.profile(user_id)
+        except Exception:
+            self.show_profile_message("Erro ao carregar dados do perfil.")
+            return
+        
+        if self.rendered_user != user_id:
+            self.build_profile_sections()
+            self.rendered_user = user_id
+        
+        renderers = {
+            "conta": self.render_account_section,
+            "pontos": self.render_points_section,
+            "conquistas": self.render_badges_section,
+            "compras": self.render_recent_purchases_section,
+        }
+        for section in PROFILE_SECTIONS:
+            if self.rendered_sections.get(section) != summary[section]:
+                container = self.section_layouts[section]
+                container.clear_widgets()
+                renderers[section](container, summary[section])
+                self.rendered_sections[section] = summary[section]
+
+    def show_profile_message(self, text):
+        self.profile_content.clear_widgets()
+        self.rendered_user = None
+        self.profile_content.add_widget(Label(
+            text=text,
+            color=COLOR_TEXT_DARK
+        ))
+
+    def build_profile_sections(self):
+        """Create one container per summary section plus the static account actions."""
+        self.profile_content.clear_widgets()
+        self.section_layouts = {}
+        self.rendered_sections = {}
+        for section in PROFILE_SECTIONS:
+            container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=15)
+            container.bind(minimum_height=container.setter("height"))
+            self.section_layouts[section] = container
+            self.profile_content.add_widget(container)
+        
+        # Account actions
+        actions_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=150, spacing=10)
+        actions_layout.add_widget(Label(
+            text="Ações da Conta",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        change_password_button = StyledButton(
+            text="Alterar Senha",
+            size_hint_y=None,
+            height=40
+        )
+        change_password_button.bind(on_press=self.show_change_password_popup)
+        
+        logout_button = Button(
+            text="Sair da Conta",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=40
+        )
+        logout_button.bind(on_press=self.logout)
+        
+        actions_layout.add_widget(change_password_button)
+        actions_layout.add_widget(logout_button)
+        
+        self.profile_content.add_widget(actions_layout)
+
+    def render_account_section(self, container, account):
+        # User avatar placeholder
+        avatar_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=150, padding=10)
+        avatar_path = os.path.join(ASSETS_PATH, "user_avatar.png")
+        
+        if os.path.exists(avatar_path):
+            avatar_layout.add_widget(KivyImage(
+                source=avatar_path,
+                size_hint=(None, None),
+                size=(100, 100),
+                pos_hint={'center_x': 0.5}
+            ))
+        else:
+            avatar_layout.add_widget(Label(
+                text="👤",
+                font_size="60sp",
+                size_hint_y=None,
+                height=100
+            ))
+        
+        avatar_layout.add_widget(Label(
+            text=account["username"],
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30
+        ))
+        
+        container.add_widget(avatar_layout)
+        
+        # User info section
+        info_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=150, spacing=10)
+        info_layout.add_widget(Label(
+            text="Informações da Conta",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        # Format date
+        if account["data_criacao"]:
+            try:
+                creation_date = datetime.strptime(account["data_criacao"], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y")
+            except:
+                creation_date = account["data_criacao"]
+        else:
+            creation_date = "N/A"
+        
+        info_items = [
+            f"Email: {account['email_recuperacao']}",
+            f"Tipo de Perfil: {account['tipo_perfil']}",
+            f"Data de Criação: {creation_date}"
+        ]
+        
+        for item in info_items:
+            info_layout.add_widget(Label(
+                text=item,
+                font_size="16sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=30,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+        
+        container.add_widget(info_layout)
+
+    def render_points_section(self, container, points):
+        points_layout = BoxLayout(orientation="vertical", size_hint_y=None, height=120, spacing=10)
+        points_layout.add_widget(Label(
+            text="Pontos e Atividades",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        points_layout.add_widget(Label(
+            text=f"Total de Pontos: {points['total_pontos']}",
+            font_size="16sp",
+            color=COLOR_ACCENT,
+            bold=True,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        points_layout.add_widget(Label(
+            text=f"Check-ins em Atrações: {points['total_checkins']}",
+            font_size="16sp",
+            color=COLOR_TEXT_DARK,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        container.add_widget(points_layout)
+
+    def render_badges_section(self, container, badge_codes):
+        container.add_widget(Label(
+            text="Conquistas",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        rules = [RULES_BY_CODE[code] for code in badge_codes if code in RULES_BY_CODE]
+        if rules:
+            for rule in rules:
+                container.add_widget(Label(
+                    text=f"★ {rule.nome} - {rule.descricao}",
+                    font_size="15sp",
+                    color=COLOR_ACCENT,
+                    size_hint_y=None,
+                    height=30,
+                    halign="left",
+                    text_size=(Window.width * 0.9, None)
+                ))
+        else:
+            container.add_widget(Label(
+                text="Faça check-ins nas atrações para ganhar conquistas!",
+                font_size="15sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_y=None,
+                height=30,
+                halign="left",
+                text_size=(Window.width * 0.9, None)
+            ))
+
+    def render_recent_purchases_section(self, container, recent_purchases):
+        if not recent_purchases:
+            return
+        
+        container.add_widget(Label(
+            text="Ingressos Recentes",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30,
+            halign="left",
+            text_size=(Window.width * 0.9, None)
+        ))
+        
+        for purchase in recent_purchases:
+            purchase_date = datetime.strptime(purchase["data_compra"], "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y")
+            
+            ticket_item = BoxLayout(
+                orientation="horizontal", 
+                size_hint_y=None, 
+                height=40,
+                spacing=10
+            )
+            
+            ticket_item.add_widget(Label(
+                text=purchase_date,
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_x=0.3,
+                halign="left",
+                text_size=(Window.width * 0.3, None)
+            ))
+            
+            ticket_item.add_widget(Label(
+                text=f"{purchase['total_ingressos']} ingresso(s)",
+                font_size="14sp",
+                color=COLOR_TEXT_DARK,
+                size_hint_x=0.4,
+                halign="center",
+                text_size=(Window.width * 0.4, None)
+            ))
+            
+            ticket_item.add_widget(Label(
+                text=f"R$ {purchase['valor_total_compra']:.2f}".replace(".", ","),
+                font_size="14sp",
+                color=COLOR_ACCENT,
+                size_hint_x=0.3,
+                halign="right",
+                text_size=(Window.width * 0.3, None)
+            ))
+            
+            container.add_widget(ticket_item)
+        
+        view_all_button = StyledButton(
+            text="Ver Todos os Ingressos",
+            size_hint_y=None,
+            height=40
+        )
+        view_all_button.bind(on_press=self.go_to_tickets)
+        container.add_widget(view_all_button)
+
+    def go_to_tickets(self, instance):
+        screen = self.manager.get_screen("tickets_list")
+        screen.current_tab = "my_tickets"
+        self.manager.current = "tickets_list"
+
+    def show_change_password_popup(self, instance):
+        content = BoxLayout(orientation="vertical", padding=20, spacing=15)
+        
+        content.add_widget(Label(
+            text="Alterar Senha",
+            font_size="18sp",
+            bold=True,
+            color=COLOR_PRIMARY,
+            size_hint_y=None,
+            height=30
+        ))
+        
+        current_password = TextInput(
+            hint_text="Senha Atual",
+            password=True,
+            multiline=False,
+            size_hint_y=None,
+            height=40
+        )
+        content.add_widget(current_password)
+        
+        new_password = TextInput(
+            hint_text="Nova Senha",
+            password=True,
+            multiline=False,
+            size_hint_y=None,
+            height=40
+        )
+        content.add_widget(new_password)
+        
+        confirm_password = TextInput(
+            hint_text="Confirmar Nova Senha",
+            password=True,
+            multiline=False,
+            size_hint_y=None,
+            height=40
+        )
+        content.add_widget(confirm_password)
+        
+        status_label = Label(
+            text="",
+            color=COLOR_ACCENT,
+            size_hint_y=None,
+            height=30
+        )
+        content.add_widget(status_label)
+        
+        buttons_layout = BoxLayout(size_hint_y=None, height=50, spacing=10)
+        
+        save_button = StyledButton(text="Salvar")
+        cancel_button = Button(
+            text="Cancelar",
+            background_color=COLOR_SECONDARY,
+            color=COLOR_TEXT_DARK
+        )
+        
+        buttons_layout.add_widget(save_button)
+        buttons_layout.add_widget(cancel_button)
+        content.add_widget(buttons_layout)
+        
+        popup = Popup(
+            title="Alterar Senha",
+            content=content,
+            size_hint=(0.9, 0.6),
+            auto_dismiss=False
+        )
+        
+        def change_password(instance):
+            if new_password.text != confirm_password.text:
+                status_label.text = "As senhas não coincidem."
+                return
+            
+            app = App.get_running_app()
+            try:
+                app.backend.change_password(app.user_id, current_password.text, new_password.text)
+            except ServiceError as e:
+                status_label.text = str(e)
+                return
+            except Exception as e:
+                status_label.text = f"Erro ao alterar senha: {e}"
+                return
+            status_label.text = "Senha alterada com sucesso!"
+            
+            # Close popup after a short delay
+            Clock.schedule_once(lambda dt: popup.dismiss(), 1.5)
+        
+        save_button.bind(on_press=change_password)
+        cancel_button.bind(on_press=popup.dismiss)
+        
+        popup.open()
+
+    def logout(self, instance):
+        app = App.get_running_app()
+        app.backend.logout()
+        app.user_id = None
+        app.user_profile = None
+        self.manager.current = "login"
@@ -0,0 +1,58 @@
+"""Color palette and the widgets shared by every screen."""
+
+from kivy.app import App
+from kivy.properties import NumericProperty, StringProperty
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.utils import get_color_from_hex
+
+# Color Palette
+COLOR_PRIMARY = get_color_from_hex("#1E88E5")  # Vibrant Blue
+COLOR_SECONDARY = get_color_from_hex("#FFC107")  # Amber Yellow
+COLOR_ACCENT = get_color_from_hex("#4CAF50")  # Green
+COLOR_BACKGROUND = get_color_from_hex("#F5F5F5")  # Light Gray
+COLOR_TEXT_DARK = get_color_from_hex("#D3D3D3")  # Grey
+COLOR_TEXT_LIGHT = get_color_from_hex("#FFFFFF")  # White
+COLOR_DISABLED = get_color_from_hex("#BDBDBD")  # Gray for disabled
+
+
+class HeaderLabel(Label):
+    def __init__(self, **kwargs):
+        super(HeaderLabel, self).__init__(**kwargs)
+        self.font_size = "24sp"
+        self.bold = True
+        self.color = COLOR_PRIMARY
+        self.size_hint_y = None
+        self.height = 60
+        self.halign = "center"
+        self.valign = "middle"
+
+
+
+class StyledButton(Button):
+    def __init__(self, **kwargs):
+        super(StyledButton, self).__init__(**kwargs)
+        self.background_color = COLOR_PRIMARY
+        self.color = COLOR_TEXT_LIGHT
+        self.font_size = "16sp"
+        self.size_hint_y = None
+        self.height = 50
+
+
+
+class ClickableLabel(Label):
+    id_ref = NumericProperty(0)
+    screen_to_go = StringProperty("")
+
+    def on_touch_down(self, touch):
+        if self.collide_point(*touch.pos):
+            app = App.get_running_app()
+            if self.screen_to_go == "attraction_detail":
+                app.selected_attraction_id = self.id_ref
+            elif self.screen_to_go == "show_detail":
+                app.selected_show_id = self.id_ref
+            # Add more types if needed
+            app.previous_screen = app.sm.current
+            app.sm.current = self.screen_to_go
+            return True
+        return super(ClickableLabel, self).on_touch_down(touch)
@@ -0,0 +1,160 @@
+"""Single writer thread that group-commits the app's database writes.
+
+SQLite runs one write transaction at a time, and each commit waits for the
+disk. When every screen or API request commits on its own connection,
+concurrent writers queue on the database lock (or fail with "database is
+locked") and pay one sync per operation. WriteQueue sends all of them
+through one thread and one connection instead. It takes whatever operations
+queued up while the previous commit ran, runs each one inside its own
+SAVEPOINT, and commits them together.
+
+    writer = WriteQueue().start()
+    purchase_id = writer.call(process_purchase, user_id, 1, 150.0, "2025-07-01", 2, "PIX")
+    future = writer.submit(submit_rating, user_id, 3, "atracao", 5)
+
+An operation is any function that takes a connection first, such as the ones
+in infinity_park.services. The connection it receives ignores commit(), and
+its rollback() undoes only that operation. A failing operation is rolled back
+alone, and the rest of its group still commits. Each future is resolved with
+its operation's result or exception once the group's commit has finished.
+
+In the app and the API server the screens' and requests' writes, payment
+results (payments.PaymentWorker) and expiration sweeps share one queue, and
+so do a gate validator or a delta sync given it. Command line tools that run
+as processes of their own (gate, gate_snapshot sync, expiration) commit on
+their own connection; SQLite's lock is all that orders them against it.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+
+from infinity_park.config import SQL_PROFILE
+from infinity_park.db import get_db_connection
+from infinity_park.instrumentation import attributed_to, current_caller
+from infinity_park.storage import retry_busy
+
+_STOP = object()
+
+
+class _OperationConnection(object):
+    """The writer's connection as one operation in a group sees it."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self):
+        pass  # The group is committed once all its operations ran
+
+    def rollback(self):
+        self._conn.execute("ROLLBACK TO SAVEPOINT operation")
+
+
+class WriteQueue(object):
+    """Runs submitted write operations on one thread, max_group per commit."""
+
+    def __init__(self, database=None, max_group=256):
+        self.database = database
+        self.max_group = max_group
+        self.operations = 0
+        self.commits = 0
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Commit the operations already submitted and stop the thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, operation, *args, **kwargs):
+        """Queue operation(conn, *args, **kwargs); returns a Future of its result.
+
+        Only valid between start() and close().
+        """
+        future = Future()
+        caller = current_caller() if SQL_PROFILE else None  # Credit the SQL to the submitting code
+        self._queue.put((operation, args, kwargs, future, caller))
+        return future
+
+    def call(self, operation, *args, **kwargs):
+        """Run operation through the queue and wait for it; returns its result or raises its error."""
+        return self.submit(operation, *args, **kwargs).result()
+
+    def stats(self):
+        return {
+            "operacoes": self.operations,
+            "commits": self.commits,
+            "por_commit": self.operations / self.commits if self.commits else 0.0,
+        }
+
+    def _run(self):
+        conn = get_db_connection(self.database)
+        conn.isolation_level = None  # Transactions and savepoints are issued explicitly below
+        operation_conn = _OperationConnection(conn)
+        stopping = False
+        try:
+            while not stopping:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                group = [item]
+                while len(group) < self.max_group:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    group.append(item)
+                self._commit_group(conn, operation_conn, group)
+        finally:
+            conn.close()
+
+    def _commit_group(self, conn, operation_conn, group):
+        outcomes = []  # (future, result, exception)
+        try:
+            retry_busy(conn.execute, "BEGIN IMMEDIATE")  # Other processes may hold the write lock
+            for operation, args, kwargs, future, caller in group:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT operation")
+                try:
+                    with attributed_to(caller):
+                        outcomes.append((future, operation(operation_conn, *args, **kwargs), None))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT operation")
+                    outcomes.append((future, None, e))
+                conn.execute("RELEASE SAVEPOINT operation")
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for operation, args, kwargs, future, caller in group:
+                if future.running() or future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            return
+        self.operations += len(outcomes)
+        self.commits += 1
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)